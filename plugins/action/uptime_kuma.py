@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import importlib
+import os
+import sys
+import traceback
+
+from ansible.plugins.action import ActionBase
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, run_module
+
+try:
+    from ansible.module_utils.common.arg_spec import ModuleArgumentSpecValidator
+    from ansible.module_utils.common.parameters import remove_values
+    from ansible.module_utils.common.warnings import get_deprecation_messages, get_warning_messages
+    from ansible.module_utils.errors import UnsupportedError
+    HAS_ARGUMENT_SPEC_VALIDATOR = True
+except ImportError:
+    HAS_ARGUMENT_SPEC_VALIDATOR = False
+
+
+def no_log_values(argument_spec, params):
+    # the values of the no_log options, also of the suboptions of dict and list options
+    values = set()
+    for name, spec in argument_spec.items():
+        value = params.get(name)
+        if value is None:
+            continue
+        if spec.get("no_log"):
+            values.add(str(value))
+        if spec.get("options"):
+            for item in (value if isinstance(value, list) else [value]):
+                if isinstance(item, dict):
+                    values.update(no_log_values(spec["options"], item))
+    return values
+
+
+class ActionModule(ActionBase):
+    """
+    Runs the modules of this collection inside the controller process.
+
+    The modules only talk to the Uptime Kuma API. If the task runs on the controller anyway
+    (connection local, e.g. hosts: localhost or delegate_to: localhost), the run function of
+    the module is called directly instead of transferring and starting the module.
+    In all other cases the module is executed as usual, also if the module would run with become,
+    with a task environment or with another python interpreter than the controller.
+    """
+
+    def run(self, tmp=None, task_vars=None):
+        result = super(ActionModule, self).run(tmp, task_vars)
+        del tmp
+
+        module = self._load_module(task_vars)
+        if not module:
+            result.update(self._execute_module(task_vars=task_vars))
+            return result
+
+        # the validator reports warnings and deprecations like AnsibleModule, newer ansible versions
+        # display them directly on the controller, older versions collect them for the result
+        warning_count = len(get_warning_messages())
+        deprecation_count = len(get_deprecation_messages())
+        argument_spec = module.get_module_args()
+        validation_result = ModuleArgumentSpecValidator(argument_spec).validate(self._task.args)
+        warnings = list(get_warning_messages()[warning_count:])
+        deprecations = list(get_deprecation_messages()[deprecation_count:])
+        if warnings:
+            result["warnings"] = warnings
+        if deprecations:
+            result["deprecations"] = deprecations
+
+        if validation_result.error_messages:
+            msg = validation_result.errors.msg
+            if isinstance(validation_result.errors[0], UnsupportedError):
+                msg = "Unsupported parameters for ({0}) module: {1}".format(self._task.action, msg)
+            result.update({
+                "failed": True,
+                "msg": msg
+            })
+            return result
+        params = validation_result.validated_parameters
+
+        module_result = {
+            "changed": False
+        }
+        try:
+            run_module(module.run, params, module_result, output_options=getattr(module, "OUTPUT_OPTIONS", ()))
+        except Exception:
+            module_result.update({
+                "failed": True,
+                "msg": traceback.format_exc()
+            })
+
+        result.update(remove_values(module_result, no_log_values(argument_spec, params)))
+        return result
+
+    def _load_module(self, task_vars):
+        # returns the module if it can run on the controller, otherwise None
+        if not HAS_UPTIME_KUMA_API or not HAS_ARGUMENT_SPEC_VALIDATOR:
+            return None
+        if self._connection.transport != "local":
+            return None
+        if self._task.check_mode or self._task.async_val:
+            return None
+        # the module would run as another user, with other environment variables or another python
+        if self._play_context.become or self._task.environment:
+            return None
+        interpreter = (task_vars or {}).get("ansible_python_interpreter")
+        if interpreter and os.path.realpath(self._templar.template(interpreter)) != os.path.realpath(sys.executable):
+            return None
+
+        module_name = self._task.action.split(".")[-1]
+        try:
+            module = importlib.import_module("ansible_collections.lucasheld.uptime_kuma.plugins.modules.{0}".format(module_name))
+        except ImportError:
+            return None
+        if not hasattr(module, "get_module_args") or not hasattr(module, "run"):
+            return None
+        return module
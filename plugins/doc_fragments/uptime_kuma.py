@@ -35,6 +35,24 @@ options:
       - If no further message has arrived within this time, it is assumed that it was the last message.
     type: float
     default: 0.2
+  api_rate_limit:
+    description:
+      - The maximum number of requests per second that are sent to Uptime Kuma.
+      - The limit applies per module execution, with many forks the server receives up to forks times as many requests.
+      - If not specified, the requests are not limited.
+    type: float
+  api_latency_target:
+    description:
+      - If a response takes longer than this many seconds or times out, the client waits between the following requests.
+      - The wait time is doubled with every slow response and halved with every fast response.
+      - If not specified, only timeouts increase the wait time.
+    type: float
+  api_retries:
+    description:
+      - How many times a request that only reads data is sent again after it timed out.
+      - Requests that change data are never sent again.
+      - If not specified, no request is sent again.
+    type: int
   api_username:
     description:
       - The Uptime Kuma username.
@@ -54,3 +72,69 @@ options:
 requirements:
   - uptime-kuma-api
 '''
+
+    RUN = '''
+options:
+  api_endpoints:
+    description:
+      - Runs the module against each of these Uptime Kuma instances instead of I(api_url),
+        with the same options and at most I(api_endpoints_concurrency) instances at the same time.
+      - The options of an endpoint replace the options with the same name, options that are not specified are taken from the module.
+        If an endpoint specifies any of I(api_username), I(api_password) or I(api_token), the credentials of the module are not used.
+      - Cannot be used with the options of modules that write a file on the target, all endpoints would write the same file.
+      - The result of each instance is returned in I(endpoints) with its I(api_url), failed instances with I(failed) and I(msg).
+        The module changed if it changed any instance and fails if it failed for any instance.
+    type: list
+    elements: dict
+    suboptions:
+      api_url:
+        description: The Uptime Kuma URL.
+        type: str
+        required: true
+      api_headers:
+        description: Headers that are passed to the socketio connection.
+        type: dict
+      api_username:
+        description: The Uptime Kuma username.
+        type: str
+      api_password:
+        description: The Uptime Kuma password.
+        type: str
+      api_token:
+        description: The Uptime Kuma login token.
+        type: str
+  api_endpoints_concurrency:
+    description: How many instances of I(api_endpoints) are run at the same time.
+    type: int
+    default: 10
+  api_trace:
+    description:
+      - true to record the calls of the Uptime Kuma API methods.
+      - The method, duration in seconds and size of the received data of every call,
+        the totals per method and the overall totals are returned as I(api_trace).
+      - Calls of the connect, login and disconnect methods are included.
+    type: bool
+    default: false
+  api_profile:
+    description:
+      - true to run the module under cProfile.
+      - The seconds spent in the import of the uptime-kuma-api library, connect, login, run and disconnect
+        are returned as I(api_profile.phases). The waits for further events (I(api_wait_events)) are part of the phases.
+      - With I(api_endpoints) the module is profiled once around all endpoints, the seconds of all endpoints
+        are returned as I(api_profile.phases.endpoints). The phases of the endpoints are summed up,
+        the endpoints run in threads and only the thread of the module is profiled.
+      - If the environment variable C(UPTIME_KUMA_PROFILE) is set, it is used as default.
+    type: bool
+    default: false
+  api_profile_path:
+    description:
+      - Path to write the cProfile stats to, they can be loaded with the C(pstats) module.
+      - The file is written on the host that runs the module.
+      - If not specified, the I(api_profile_top) functions with the highest cumulative time are returned as I(api_profile.functions).
+      - If the environment variable C(UPTIME_KUMA_PROFILE_PATH) is set, it is used as default.
+    type: path
+  api_profile_top:
+    description: How many functions are returned as I(api_profile.functions).
+    type: int
+    default: 20
+'''
@@ -0,0 +1,467 @@
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import object_changed, \
+    clear_unset_params, index_by, run_concurrently
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.fingerprint import FingerprintState
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.status_page import apply_status_page
+
+FORMAT_VERSION = 1
+
+# the options of the objects that are applied, a record can contain more keys
+SETTINGS_KEYS = [
+    "checkUpdate", "checkBeta", "keepDataPeriodDays", "serverTimezone", "entryPage", "searchEngineIndex",
+    "primaryBaseURL", "steamAPIKey", "nscd", "dnsCache", "chromeExecutable", "tlsExpiryNotifyDays", "trustProxy"
+]
+
+PROXY_KEYS = [
+    "protocol", "host", "port", "auth", "username", "password", "active", "default", "applyExisting"
+]
+
+DOCKER_HOST_KEYS = [
+    "name", "dockerType", "dockerDaemon"
+]
+
+MONITOR_KEYS = [
+    "type", "name", "parent", "description", "interval", "retryInterval", "resendInterval", "maxretries", "upsideDown",
+    "notificationIDList", "httpBodyEncoding", "url", "maxredirects", "accepted_statuscodes", "expiryNotification",
+    "ignoreTls", "proxyId", "method", "body", "headers", "authMethod", "tlsCert", "tlsKey", "tlsCa", "basic_auth_user",
+    "basic_auth_pass", "authDomain", "authWorkstation", "oauth_auth_method", "oauth_token_url", "oauth_client_id",
+    "oauth_client_secret", "oauth_scopes", "timeout", "keyword", "invertKeyword", "grpcUrl", "grpcEnableTls",
+    "grpcServiceName", "grpcMethod", "grpcProtobuf", "grpcBody", "grpcMetadata", "hostname", "packetSize", "port",
+    "dns_resolve_server", "dns_resolve_type", "mqttUsername", "mqttPassword", "mqttTopic", "mqttSuccessMessage",
+    "databaseConnectionString", "databaseQuery", "docker_container", "docker_host", "radiusUsername", "radiusPassword",
+    "radiusSecret", "radiusCalledStationId", "radiusCallingStationId", "game", "gamedigGivenPortOnly", "jsonPath",
+    "expectedValue", "kafkaProducerBrokers", "kafkaProducerTopic", "kafkaProducerMessage", "kafkaProducerSsl",
+    "kafkaProducerAllowAutoTopicCreation", "kafkaProducerSaslOptions"
+]
+
+STATUS_PAGE_KEYS = [
+    "slug", "title", "description", "theme", "published", "showTags", "domainNameList", "googleAnalyticsId",
+    "customCSS", "footerText", "showPoweredBy", "showCertificateExpiry", "icon", "publicGroupList"
+]
+
+MAINTENANCE_KEYS = [
+    "title", "strategy", "active", "description", "dateRange", "intervalDay", "weekdays", "daysOfMonth", "timeRange",
+    "cron", "durationMinutes", "timezoneOption"
+]
+
+# in the order of their dependencies, every record only references records of previous types
+RECORD_TYPES = [
+    "settings",
+    "tags",
+    "notifications",
+    "proxies",
+    "docker_hosts",
+    "monitors",
+    "status_pages",
+    "maintenances"
+]
+
+
+def sort_monitors(monitors):
+    # parents before their children
+    monitor_ids = set(i["id"] for i in monitors)
+    sorted_monitors = []
+    added = set()
+    pending = list(monitors)
+    while pending:
+        remaining = []
+        for monitor in pending:
+            parent = monitor.get("parent")
+            if parent is None or parent in added or parent not in monitor_ids:
+                sorted_monitors.append(monitor)
+                added.add(monitor["id"])
+            else:
+                remaining.append(monitor)
+        if len(remaining) == len(pending):
+            # a parent cycle can not be resolved, keep the remaining order
+            sorted_monitors.extend(remaining)
+            break
+        pending = remaining
+    return sorted_monitors
+
+
+def in_batches(func, items, concurrency):
+    # calls func concurrently and yields the results, at most concurrency results are kept in memory
+    batch_size = max(concurrency, 1)
+    for i in range(0, len(items), batch_size):
+        for r in run_concurrently(func, items[i:i + batch_size], concurrency):
+            yield r
+
+
+def get_maintenance_with_associations(api, maintenance):
+    maintenance_id = maintenance["id"]
+    maintenance["monitors"] = api.get_monitor_maintenance(maintenance_id)
+    maintenance["status_pages"] = api.get_status_page_maintenance(maintenance_id)
+    return maintenance
+
+
+def export_records(api, types=None, concurrency=10):
+    """
+    Yields the records (type, data) of the types in dependency order.
+    The records of all types are read in the same session.
+    """
+    types = types or RECORD_TYPES
+    for record_type in RECORD_TYPES:
+        if record_type not in types:
+            continue
+        if record_type == "settings":
+            yield record_type, api.get_settings()
+            continue
+
+        if record_type == "tags":
+            objects = api.get_tags()
+        elif record_type == "notifications":
+            objects = api.get_notifications()
+        elif record_type == "proxies":
+            objects = api.get_proxies()
+        elif record_type == "docker_hosts":
+            objects = api.get_docker_hosts()
+        elif record_type == "monitors":
+            objects = sort_monitors(api.get_monitors())
+        elif record_type == "status_pages":
+            slugs = [i["slug"] for i in api.get_status_pages()]
+            objects = in_batches(api.get_status_page, slugs, concurrency)
+        else:
+            objects = in_batches(
+                lambda maintenance: get_maintenance_with_associations(api, maintenance),
+                api.get_maintenances(),
+                concurrency
+            )
+        for obj in objects:
+            yield record_type, obj
+
+
+def write_records(path, records, header=None):
+    """
+    Writes the records as gzip compressed json lines, one record per line.
+    The first line is the header. The records are written to a temporary file that replaces
+    the file at the end, a failed export keeps the previous file. If the content is the same as
+    the content of the previous file, apart from the creation time, the previous file is kept.
+    Returns the number of records per type and True if the file changed.
+    """
+    counts = {}
+    content_hash = hashlib.sha256()
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    try:
+        with gzip.open(os.fdopen(fd, "wb"), "wt", encoding="utf-8") as f:
+            header = dict(header or {}, format=FORMAT_VERSION)
+            content_hash.update(json.dumps(header).encode("utf-8"))
+            header["created"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            f.write(json.dumps({"type": "header", "data": header}) + "\n")
+            for record_type, data in records:
+                line = json.dumps({"type": record_type, "data": data}, default=str) + "\n"
+                content_hash.update(line.encode("utf-8"))
+                f.write(line)
+                counts[record_type] = counts.get(record_type, 0) + 1
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+    changed = content_hash.hexdigest() != records_hash(path)
+    if changed:
+        if os.path.isfile(path):
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    else:
+        os.remove(tmp_path)
+    return counts, changed
+
+
+def records_hash(path):
+    # the hash of the content of a file written by write_records, without the creation time
+    if not os.path.isfile(path):
+        return None
+    content_hash = hashlib.sha256()
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            header = json.loads(f.readline())["data"]
+            header.pop("created", None)
+            content_hash.update(json.dumps(header).encode("utf-8"))
+            for line in f:
+                content_hash.update(line.encode("utf-8"))
+    except (OSError, ValueError, KeyError):
+        # not a file written by write_records
+        return None
+    return content_hash.hexdigest()
+
+
+def read_records(path):
+    """
+    Yields the records (type, data) of a file written by write_records, one line at a time.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record["type"], record["data"]
+
+
+def filter_keys(data, keys):
+    return dict((k, v) for k, v in data.items() if k in keys)
+
+
+class Importer(object):
+    """
+    Creates or updates the records of an export in one session.
+
+    Existing objects are matched by their name (proxies by host and port, status pages by slug,
+    maintenances by title). The ids of the export are mapped to the ids of the matched or created
+    objects, and the references of the following records are remapped with these mappings.
+    References to objects that are not part of the records are removed.
+    Records of the same type are applied concurrently in batches.
+    Records whose fingerprint matches are not compared with the existing objects.
+    """
+
+    def __init__(self, api, concurrency=10, fingerprints=None):
+        self.api = api
+        self.concurrency = concurrency
+        self.fingerprints = fingerprints or FingerprintState(None, None)
+        self.ids = dict((record_type, {}) for record_type in RECORD_TYPES)
+        self.counts = {}
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def import_records(self, records):
+        batch_type = None
+        batch = []
+        for record_type, data in records:
+            if record_type == "header":
+                if data.get("format") != FORMAT_VERSION:
+                    raise ValueError("Unsupported export format {0}".format(data.get("format")))
+                continue
+            if record_type not in RECORD_TYPES:
+                raise ValueError("Unknown record type {0}".format(record_type))
+            # a child monitor has to wait until its parent is created
+            parent_pending = record_type == "monitors" and data.get("parent") in [i.get("id") for i in batch]
+            if batch and (record_type != batch_type or len(batch) >= self.concurrency or parent_pending):
+                self._apply_batch(batch_type, batch)
+                batch = []
+            batch_type = record_type
+            batch.append(data)
+        if batch:
+            self._apply_batch(batch_type, batch)
+        return self.counts
+
+    def changed(self):
+        return any(count["created"] or count["updated"] for count in self.counts.values())
+
+    def _apply_batch(self, record_type, batch):
+        func = getattr(self, "_import_{0}".format(record_type))
+        run_concurrently(lambda data: self._count(record_type, func(data)), batch, self.concurrency)
+
+    def _count(self, record_type, action):
+        with self._lock:
+            count = self.counts.setdefault(record_type, {
+                "created": 0,
+                "updated": 0,
+                "unchanged": 0
+            })
+            count[action] += 1
+
+    def _index(self, record_type, get_objects, *keys):
+        with self._lock:
+            if record_type not in self._indexes:
+                self._indexes[record_type] = index_by(get_objects(), *keys)
+            return self._indexes[record_type]
+
+    def _map_id(self, record_type, id_):
+        return self.ids[record_type].get(id_)
+
+    def _map_ids(self, record_type, ids):
+        return [i for i in (self._map_id(record_type, id_) for id_ in ids or []) if i is not None]
+
+    def _apply(self, record_type, key, existing, options, add, edit, ignore=None):
+        # returns the id of the object and the action
+        if self.fingerprints.unchanged(record_type, key, options, existing):
+            return existing["id"], "unchanged"
+        if not existing:
+            object_id, action = add(**options), "created"
+        elif object_changed(existing, options, ignore):
+            edit(existing["id"], **options)
+            object_id, action = existing["id"], "updated"
+        else:
+            object_id, action = existing["id"], "unchanged"
+        self.fingerprints.store(record_type, key, object_id, options)
+        return object_id, action
+
+    def _import_settings(self, data):
+        # disableAuth is not imported, enabling it requires the password
+        options = filter_keys(data, SETTINGS_KEYS)
+        if not object_changed(self.api.get_settings(), options):
+            return "unchanged"
+        self.api.set_settings(**options)
+        return "updated"
+
+    def _import_tags(self, data):
+        tags = self._index("tags", self.api.get_tags, "name")
+        options = filter_keys(data, ["name", "color"])
+        tag_id, action = self._apply(
+            "tags", data["name"], tags.get(data["name"]), options,
+            lambda **kwargs: self.api.add_tag(**kwargs)["id"],
+            self.api.edit_tag
+        )
+        self.ids["tags"][data["id"]] = tag_id
+        return action
+
+    def _import_notifications(self, data):
+        notifications = self._index("notifications", self.api.get_notifications, "name")
+        options = dict((k, v) for k, v in data.items() if k not in ["id", "userId", "active"])
+        options["applyExisting"] = False
+        notification_id, action = self._apply(
+            "notifications", data["name"], notifications.get(data["name"]), options,
+            lambda **kwargs: self.api.add_notification(**kwargs)["id"],
+            self.api.edit_notification,
+            {"applyExisting": None}
+        )
+        self.ids["notifications"][data["id"]] = notification_id
+        return action
+
+    def _import_proxies(self, data):
+        proxies = self._index("proxies", self.api.get_proxies, "host", "port")
+        options = filter_keys(data, PROXY_KEYS)
+        options["applyExisting"] = False
+        proxy_id, action = self._apply(
+            "proxies", "{0}:{1}".format(data["host"], data["port"]), proxies.get((data["host"], data["port"])), options,
+            lambda **kwargs: self.api.add_proxy(**kwargs)["id"],
+            self.api.edit_proxy,
+            {"applyExisting": None}
+        )
+        self.ids["proxies"][data["id"]] = proxy_id
+        return action
+
+    def _import_docker_hosts(self, data):
+        docker_hosts = self._index("docker_hosts", self.api.get_docker_hosts, "name")
+        options = filter_keys(data, DOCKER_HOST_KEYS)
+        docker_host_id, action = self._apply(
+            "docker_hosts", data["name"], docker_hosts.get(data["name"]), options,
+            lambda **kwargs: self.api.add_docker_host(**kwargs)["id"],
+            self.api.edit_docker_host
+        )
+        self.ids["docker_hosts"][data["id"]] = docker_host_id
+        return action
+
+    def _import_monitors(self, data):
+        monitors = self._index("monitors", self.api.get_monitors, "name")
+        options = filter_keys(data, MONITOR_KEYS)
+        options.update({
+            "parent": self._map_id("monitors", data.get("parent")),
+            "notificationIDList": self._map_ids("notifications", data.get("notificationIDList")),
+            "proxyId": self._map_id("proxies", data.get("proxyId")),
+            "docker_host": self._map_id("docker_hosts", data.get("docker_host"))
+        })
+        options = clear_unset_params(options)
+
+        monitor = monitors.get(data["name"])
+        monitor_id, action = self._apply(
+            "monitors", data["name"], monitor, options,
+            lambda **kwargs: self.api.add_monitor(**kwargs)["monitorID"],
+            self.api.edit_monitor
+        )
+        self.ids["monitors"][data["id"]] = monitor_id
+
+        existing_tags = set((i["tag_id"], i["value"]) for i in (monitor or {}).get("tags", []))
+        for monitor_tag in data.get("tags", []):
+            tag_id = self._map_id("tags", monitor_tag["tag_id"])
+            if tag_id is not None and (tag_id, monitor_tag["value"]) not in existing_tags:
+                self.api.add_monitor_tag(tag_id, monitor_id, monitor_tag["value"])
+                existing_tags.add((tag_id, monitor_tag["value"]))
+                action = "updated" if action == "unchanged" else action
+
+        if not data.get("active", True) and (not monitor or monitor["active"]):
+            self.api.pause_monitor(monitor_id)
+            action = "updated" if action == "unchanged" else action
+        return action
+
+    def _import_status_pages(self, data):
+        status_pages = self._index("status_pages", self.api.get_status_pages, "slug")
+        slug = data["slug"]
+        options = filter_keys(data, STATUS_PAGE_KEYS)
+        options["publicGroupList"] = [{
+            "name": group["name"],
+            "monitorList": [
+                {"id": monitor_id, "sendUrl": monitor.get("sendUrl", False)}
+                for monitor, monitor_id in ((i, self._map_id("monitors", i["id"])) for i in group["monitorList"])
+                if monitor_id is not None
+            ]
+        } for group in data.get("publicGroupList", [])]
+        incident = data.get("incident")
+        params = {
+            "slug": slug,
+            "title": data["title"],
+            "state": "present",
+            "incident": filter_keys(incident, ["title", "content", "style"]) if incident else None
+        }
+
+        desired = {
+            "options": options,
+            "incident": params["incident"]
+        }
+
+        status_page = status_pages.get(slug)
+        if self.fingerprints.unchanged("status_pages", slug, desired, status_page):
+            self.ids["status_pages"][data["id"]] = status_page["id"]
+            return "unchanged"
+        if status_page:
+            # the status page list does not contain the groups and the incident
+            status_page = self.api.get_status_page(slug)
+        result = {
+            "changed": False
+        }
+        apply_status_page(self.api, params, options, status_page, result)
+        if not status_page:
+            status_page = self.api.get_status_page(slug)
+        self.ids["status_pages"][data["id"]] = status_page["id"]
+        self.fingerprints.store("status_pages", slug, status_page["id"], desired)
+
+        if not result["changed"]:
+            return "unchanged"
+        return "updated" if status_pages.get(slug) else "created"
+
+    def _import_maintenances(self, data):
+        maintenances = self._index("maintenances", self.api.get_maintenances, "title")
+        options = filter_keys(data, MAINTENANCE_KEYS)
+        options = clear_unset_params(options)
+
+        maintenance_id, action = self._apply(
+            "maintenances", data["title"], maintenances.get(data["title"]), options,
+            lambda **kwargs: self.api.add_maintenance(**kwargs)["maintenanceID"],
+            self.api.edit_maintenance
+        )
+        self.ids["maintenances"][data["id"]] = maintenance_id
+
+        monitors = [{"id": i} for i in self._map_ids("monitors", [i["id"] for i in data.get("monitors", [])])]
+        status_pages = [{"id": i} for i in self._map_ids("status_pages", [i["id"] for i in data.get("status_pages", [])])]
+        associations = {
+            "monitors": monitors,
+            "status_pages": status_pages
+        }
+        if self.fingerprints.unchanged("maintenance_associations", data["title"], associations, {"id": maintenance_id}):
+            return action
+
+        monitors_old = self.api.get_monitor_maintenance(maintenance_id) if action != "created" else []
+        if sorted(i["id"] for i in monitors_old) != sorted(i["id"] for i in monitors):
+            self.api.add_monitor_maintenance(maintenance_id, monitors)
+            action = "updated" if action == "unchanged" else action
+
+        status_pages_old = self.api.get_status_page_maintenance(maintenance_id) if action != "created" else []
+        if sorted(i["id"] for i in status_pages_old) != sorted(i["id"] for i in status_pages):
+            self.api.add_status_page_maintenance(maintenance_id, status_pages)
+            action = "updated" if action == "unchanged" else action
+        self.fingerprints.store("maintenance_associations", data["title"], maintenance_id, associations)
+        return action
@@ -4,6 +4,29 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import copy
+import cProfile
+import functools
+import inspect
+import json
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from ansible.module_utils.basic import env_fallback
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.mirror import MirrorApi, mirror_ready
+
+IMPORT_START = time.perf_counter()
+try:
+    from uptime_kuma_api import UptimeKumaApi, UptimeKumaException, Timeout
+    from socketio.exceptions import TimeoutError as SocketIOTimeoutError
+    HAS_UPTIME_KUMA_API = True
+except ImportError:
+    HAS_UPTIME_KUMA_API = False
+IMPORT_DURATION = time.perf_counter() - IMPORT_START
+
 
 def object_changed(superset, subset, ignore=None):
     changed_keys = []
@@ -46,6 +69,15 @@ def clear_params(params: dict):
         "api_username",
         "api_password",
         "api_token",
+        "api_endpoints",
+        "api_endpoints_concurrency",
+        "api_trace",
+        "api_rate_limit",
+        "api_latency_target",
+        "api_retries",
+        "api_profile",
+        "api_profile_path",
+        "api_profile_top",
         "state"
     ]
     return {k: v for k, v in params.items() if k not in ignored_params}
@@ -55,7 +87,60 @@ def clear_unset_params(params: dict):
     return {k: v for k, v in params.items() if v is not None}
 
 
+def index_by(objects, *keys):
+    index = {}
+    for obj in objects:
+        if len(keys) == 1:
+            key = obj[keys[0]]
+        else:
+            key = tuple(obj[k] for k in keys)
+        # keep the first match, like the get_*_by_* helpers
+        index.setdefault(key, obj)
+    return index
+
+
+def select_monitors(monitors, monitor_ids=None, monitor_names=None, tag_names=None, monitor_types=None):
+    # all monitors if no selector is specified, otherwise the monitors that match any selector
+    monitor_ids = monitor_ids or []
+    monitor_names = monitor_names or []
+    tag_names = tag_names or []
+    monitor_types = monitor_types or []
+    if not monitor_ids and not monitor_names and not tag_names and not monitor_types:
+        return monitors
+
+    known_ids = set(i["id"] for i in monitors)
+    for monitor_id in monitor_ids:
+        if monitor_id not in known_ids:
+            raise ValueError("Monitor {0} not found".format(monitor_id))
+    known_names = set(i["name"] for i in monitors)
+    for monitor_name in monitor_names:
+        if monitor_name not in known_names:
+            raise ValueError("Monitor {0} not found".format(monitor_name))
+    return [
+        monitor for monitor in monitors
+        if monitor["id"] in monitor_ids
+        or monitor["name"] in monitor_names
+        or any(tag["name"] in tag_names for tag in monitor["tags"])
+        or monitor["type"] in monitor_types
+    ]
+
+
+def run_concurrently(func, items, concurrency, apis=None):
+    # calls func for each item in a thread pool and returns the results in the order of items,
+    # with apis func is called with one of the clients in turn and the item
+    items = list(items)
+    if apis:
+        items = [(apis[i % len(apis)], item) for i, item in enumerate(items)]
+        func = functools.partial(lambda f, args: f(*args), func)
+    if concurrency <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(func, items))
+
+
 def get_proxy_by_host_port(api, host, port):
+    if isinstance(api, MirrorApi):
+        return api.find("proxies", "{0}:{1}".format(host, port))
     proxies = api.get_proxies()
     for proxy in proxies:
         if proxy["host"] == host and proxy["port"] == port:
@@ -63,6 +148,8 @@ def get_proxy_by_host_port(api, host, port):
 
 
 def get_notification_by_name(api, name):
+    if isinstance(api, MirrorApi):
+        return api.find("notifications", name)
     notifications = api.get_notifications()
     for notification in notifications:
         if notification["name"] == name:
@@ -70,6 +157,8 @@ def get_notification_by_name(api, name):
 
 
 def get_monitor_by_name(api, name):
+    if isinstance(api, MirrorApi):
+        return api.find("monitors", name)
     monitors = api.get_monitors()
     for monitor in monitors:
         if monitor["name"] == name:
@@ -90,6 +179,8 @@ def get_monitor_tag(monitor, tag, value):
 
 
 def get_docker_host_by_name(api, name):
+    if isinstance(api, MirrorApi):
+        return api.find("docker_hosts", name)
     docker_hosts = api.get_docker_hosts()
     for docker_host in docker_hosts:
         if docker_host["name"] == name:
@@ -97,26 +188,382 @@ def get_docker_host_by_name(api, name):
 
 
 def get_maintenance_by_title(api, title):
+    if isinstance(api, MirrorApi):
+        return api.find("maintenances", title)
     maintenances = api.get_maintenances()
     for maintenance in maintenances:
         if maintenance["title"] == title:
             return maintenance
 
 
+def get_status_page_by_slug(api, slug):
+    if isinstance(api, MirrorApi):
+        return api.find("status_pages", slug)
+    status_pages = api.get_status_pages()
+    for status_page in status_pages:
+        if status_page["slug"] == slug:
+            return status_page
+
+
 def get_api_key_by_name(api, name):
+    if isinstance(api, MirrorApi):
+        return api.find("api_keys", name)
     api_keys = api.get_api_keys()
     for api_key in api_keys:
         if api_key["name"] == name:
             return api_key
 
 
-common_module_args = dict(
+class ApiTrace(object):
+    """
+    Records the calls of the public methods of an UptimeKumaApi instance.
+
+    Only the outermost call is recorded, methods that are called by another api method
+    are part of its duration. The size is the length of the json encoded return value.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def wrap(self, api):
+        for name, _ in inspect.getmembers(type(api), inspect.isfunction):
+            if not name.startswith("_"):
+                setattr(api, name, self._wrap_method(name, getattr(api, name)))
+        return api
+
+    def _wrap_method(self, name, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            depth = getattr(self._local, "depth", 0)
+            if depth:
+                return method(*args, **kwargs)
+            self._local.depth = 1
+            start = time.perf_counter()
+            try:
+                r = method(*args, **kwargs)
+            except Exception:
+                self._record(name, start, None, True)
+                raise
+            finally:
+                self._local.depth = 0
+            self._record(name, start, r, False)
+            return r
+        return wrapper
+
+    def _record(self, name, start, r, failed):
+        duration = time.perf_counter() - start
+        size = len(json.dumps(r, default=str)) if r is not None else 0
+        with self._lock:
+            self.calls.append({
+                "method": name,
+                "duration": round(duration, 6),
+                "size": size,
+                "failed": failed
+            })
+
+    def result(self):
+        methods = {}
+        for call in self.calls:
+            method = methods.setdefault(call["method"], {
+                "calls": 0,
+                "duration": 0,
+                "size": 0
+            })
+            method["calls"] += 1
+            method["duration"] += call["duration"]
+            method["size"] += call["size"]
+        for method in methods.values():
+            method["duration"] = round(method["duration"], 6)
+        return {
+            "calls": self.calls,
+            "methods": methods,
+            "total": {
+                "calls": len(self.calls),
+                "duration": round(sum(i["duration"] for i in self.calls), 6),
+                "size": sum(i["size"] for i in self.calls)
+            }
+        }
+
+
+class Profile(object):
+    """
+    Profiles the phases of a module execution with cProfile.
+
+    The stats are written to path if set, otherwise the top functions
+    sorted by cumulative time are returned by result.
+    """
+
+    def __init__(self, path=None, top=20):
+        self.path = path
+        self.top = top
+        self.profiler = cProfile.Profile()
+        self.phases = {
+            "import": round(IMPORT_DURATION, 6)
+        }
+        self._thread = threading.get_ident()
+        self._depth = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        # the profiler only profiles the thread that created it, it is enabled once for nested phases,
+        # phases of other threads are only timed
+        profiled = threading.get_ident() == self._thread
+        start = time.perf_counter()
+        if profiled:
+            if not self._depth:
+                self.profiler.enable()
+            self._depth += 1
+        try:
+            yield
+        finally:
+            if profiled:
+                self._depth -= 1
+                if not self._depth:
+                    self.profiler.disable()
+            with self._lock:
+                self.phases[name] = round(self.phases.get(name, 0) + time.perf_counter() - start, 6)
+
+    def result(self):
+        r = {
+            "phases": self.phases
+        }
+        if self.path:
+            self.profiler.dump_stats(self.path)
+            r["path"] = self.path
+        else:
+            self.profiler.create_stats()
+            stats = sorted(self.profiler.stats.items(), key=lambda i: i[1][3], reverse=True)
+            r["functions"] = [{
+                "function": "{0}:{1}({2})".format(*function),
+                "calls": primitive_calls,
+                "total_time": round(total_time, 6),
+                "cumulative_time": round(cumulative_time, 6)
+            } for function, (primitive_calls, _, total_time, cumulative_time, _) in stats[:self.top]]
+        return r
+
+
+class RateLimiter(object):
+    """
+    Limits the socket.io calls of an UptimeKumaApi instance.
+
+    The calls are spaced so that at most rate calls per second are sent. If a call takes
+    longer than latency_target seconds or times out, the interval between the calls is doubled,
+    every faster call halves it again. Reads that time out are retried up to retries times.
+    """
+
+    max_delay = 5
+
+    def __init__(self, rate=None, latency_target=None, retries=0):
+        self.interval = 1.0 / rate if rate else 0
+        self.latency_target = latency_target
+        self.retries = retries
+        self.delay = 0
+        self.next_call = 0
+        self._lock = threading.Lock()
+
+    def wrap(self, api):
+        call = api._call
+
+        def limited_call(event, data=None):
+            attempt = 0
+            while True:
+                self.wait()
+                start = time.perf_counter()
+                try:
+                    r = call(event, data)
+                except (SocketIOTimeoutError, Timeout):
+                    self.slow_down()
+                    if attempt >= self.retries or not is_read_event(event):
+                        raise
+                    attempt += 1
+                    continue
+                self.update(time.perf_counter() - start)
+                return r
+
+        api._call = limited_call
+        return api
+
+    def wait(self):
+        with self._lock:
+            now = time.perf_counter()
+            call_time = max(now, self.next_call)
+            self.next_call = call_time + max(self.interval, self.delay)
+        if call_time > now:
+            time.sleep(call_time - now)
+
+    def slow_down(self):
+        with self._lock:
+            self.delay = min(max(self.delay * 2, 0.05), self.max_delay)
+
+    def update(self, duration):
+        if self.latency_target and duration > self.latency_target:
+            self.slow_down()
+        else:
+            with self._lock:
+                self.delay = self.delay / 2 if self.delay >= 0.01 else 0
+
+
+def is_read_event(event):
+    # calls that only read data and can be sent again
+    return event.startswith("get") or event in ["needSetup", "twoFAStatus", "checkApprise"]
+
+
+@contextmanager
+def profile_phase(profile, name):
+    if not profile:
+        yield
+        return
+    with profile.phase(name):
+        yield
+
+
+def connect(params, login=True, trace=None, profile=None, limiter=None):
+    with profile_phase(profile, "connect"):
+        api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
+    if not limiter and (params.get("api_rate_limit") or params.get("api_latency_target") or params.get("api_retries")):
+        limiter = RateLimiter(params.get("api_rate_limit"), params.get("api_latency_target"), params.get("api_retries"))
+    if limiter:
+        limiter.wrap(api)
+    # additional connections of a connection pool share the rate limiter, the trace and the profile
+    api.connect_args = (params, login, trace, profile, limiter)
+    if trace:
+        trace.wrap(api)
+    if not login:
+        return api
+
+    api_token = params.get("api_token")
+    api_username = params.get("api_username")
+    api_password = params.get("api_password")
+    try:
+        with profile_phase(profile, "login"):
+            if api_token:
+                api.login_by_token(api_token)
+            elif api_username and api_password:
+                api.login(api_username, api_password)
+            else:
+                # autoLogin for enabled disableAuth
+                api.login()
+    except Exception:
+        api.disconnect()
+        raise
+    return api
+
+
+@contextmanager
+def connection_pool(api, size):
+    """
+    The connected client and size - 1 additional clients that are connected and logged in like the client.
+    """
+    apis = [api]
+    try:
+        if size > 1:
+            run_concurrently(lambda _: apis.append(connect(*api.connect_args)), range(size - 1), size - 1)
+        yield apis
+    finally:
+        for i in apis[1:]:
+            i.disconnect()
+
+
+CREDENTIAL_PARAMS = ("api_username", "api_password", "api_token")
+
+
+def run_endpoints(run, params, result, login=True, profile=None):
+    def run_endpoint(endpoint):
+        endpoint_params = copy.deepcopy(params)
+        endpoint_params["api_endpoints"] = None
+        endpoint = clear_unset_params(endpoint)
+        if any(endpoint.get(i) for i in CREDENTIAL_PARAMS):
+            # the credentials of the endpoint replace all credentials of the module,
+            # otherwise the token of the module would be used before the password of the endpoint
+            for i in CREDENTIAL_PARAMS:
+                endpoint_params[i] = None
+        endpoint_params.update(endpoint)
+        endpoint_result = copy.deepcopy(result)
+        try:
+            run_connected(run, endpoint_params, endpoint_result, login, profile)
+        except Exception:
+            endpoint_result["failed"] = True
+            endpoint_result["msg"] = traceback.format_exc()
+        endpoint_result["api_url"] = endpoint_params["api_url"]
+        return endpoint_result
+
+    results = run_concurrently(run_endpoint, params["api_endpoints"], params["api_endpoints_concurrency"])
+    result["changed"] = any(i["changed"] for i in results)
+    result["endpoints"] = results
+    failed = [i["api_url"] for i in results if i.get("failed")]
+    if failed:
+        raise UptimeKumaException("Failed on {0} of {1} endpoints: {2}".format(len(failed), len(results), ", ".join(failed)))
+
+
+def run_connected(run, params, result, login=True, profile=None):
+    trace = ApiTrace() if params.get("api_trace") else None
+    if params.get("mirror") and mirror_ready(params["mirror"], params["api_url"], params.get("api_username")):
+        # read only modules read the lists from the database of a running mirror
+        api = MirrorApi(params["mirror"])
+        if trace:
+            trace.wrap(api)
+    else:
+        api = connect(params, login, trace, profile)
+    try:
+        with profile_phase(profile, "run"):
+            run(api, params, result)
+    finally:
+        with profile_phase(profile, "disconnect"):
+            api.disconnect()
+        if trace:
+            result["api_trace"] = trace.result()
+
+
+def run_module(run, params, result, login=True, output_options=()):
+    if params.get("api_endpoints"):
+        # all endpoints would write the same file
+        for i in output_options:
+            if params.get(i):
+                raise ValueError("api_endpoints is mutually exclusive with {0}".format(i))
+
+    # one profile for the whole module, the endpoints are run in threads and only add to its phases
+    profile = Profile(params.get("api_profile_path"), params.get("api_profile_top", 20)) if params.get("api_profile") else None
+    try:
+        if params.get("api_endpoints"):
+            with profile_phase(profile, "endpoints"):
+                run_endpoints(run, params, result, login, profile)
+        else:
+            run_connected(run, params, result, login, profile)
+    finally:
+        if profile:
+            result["api_profile"] = profile.result()
+
+
+connection_module_args = dict(
     api_url=dict(type="str", default="http://127.0.0.1:3001"),
     api_timeout=dict(type="float", default=10),
     api_headers=dict(type="dict"),
     api_ssl_verify=dict(type="bool", default=True),
     api_wait_events=dict(type="float", default=0.2),
+    api_rate_limit=dict(type="float"),
+    api_latency_target=dict(type="float"),
+    api_retries=dict(type="int"),
     api_username=dict(type="str"),
     api_password=dict(type="str", no_log=True),
     api_token=dict(type="str", no_log=True)
 )
+
+# options of modules that are run with run_module
+common_module_args = dict(
+    connection_module_args,
+    api_endpoints=dict(type="list", elements="dict", options=dict(
+        api_url=dict(type="str", required=True),
+        api_headers=dict(type="dict"),
+        api_username=dict(type="str"),
+        api_password=dict(type="str", no_log=True),
+        api_token=dict(type="str", no_log=True)
+    )),
+    api_endpoints_concurrency=dict(type="int", default=10),
+    api_trace=dict(type="bool", default=False),
+    api_profile=dict(type="bool", default=False, fallback=(env_fallback, ["UPTIME_KUMA_PROFILE"])),
+    api_profile_path=dict(type="path", fallback=(env_fallback, ["UPTIME_KUMA_PROFILE_PATH"])),
+    api_profile_top=dict(type="int", default=20)
+)
@@ -0,0 +1,116 @@
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import fcntl
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+
+def fingerprint(options, key=None):
+    data = json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+    if key:
+        return hmac.new(key.encode("utf-8"), data, hashlib.sha256).hexdigest()
+    return hashlib.sha256(data).hexdigest()
+
+
+@contextmanager
+def locked(path):
+    # exclusive lock of the file for other processes and for other threads of this process
+    with open(path + ".lock", "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def read_file(path):
+    if not os.path.isfile(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+class FingerprintState(object):
+    """
+    Content hashes of the desired state of applied objects.
+
+    The hashes are stored in a json file by api url, object type and object key, together with
+    the id of the object. If the hash of the desired state and the id of the existing object match
+    the stored values, the object was applied with the same options before and the comparison
+    with the existing object can be skipped. Without a path nothing is stored and nothing is skipped.
+
+    The options contain passwords and secrets, with a key the hashes are HMACs with this key,
+    e.g. the password or token of the login. The file is locked while it is written and only the
+    entries that changed are written, so that modules that share the file do not lose updates.
+    """
+
+    def __init__(self, path, api_url, key=None):
+        self.path = path
+        self.api_url = api_url
+        self.key = key
+        self.objects = {}
+        self._changes = {}
+        self._lock = threading.Lock()
+        if path:
+            with locked(path):
+                self.objects = read_file(path).get(api_url, {})
+
+    def unchanged(self, object_type, key, options, obj):
+        if not self.path or not obj:
+            return False
+        entry = self.objects.get(object_type, {}).get(str(key))
+        return entry is not None and entry["id"] == obj["id"] and entry["hash"] == fingerprint(options, self.key)
+
+    def store(self, object_type, key, id_, options):
+        if not self.path:
+            return
+        entry = {
+            "id": id_,
+            "hash": fingerprint(options, self.key)
+        }
+        with self._lock:
+            objects = self.objects.setdefault(object_type, {})
+            if objects.get(str(key)) != entry:
+                objects[str(key)] = entry
+                self._changes[(object_type, str(key))] = entry
+
+    def remove(self, object_type, key):
+        if not self.path:
+            return
+        with self._lock:
+            if self.objects.get(object_type, {}).pop(str(key), None) is not None:
+                self._changes[(object_type, str(key))] = None
+
+    def save(self):
+        if not self.path or not self._changes:
+            return
+        with locked(self.path):
+            # apply the changes to the current content, other modules may have written the file since it was read
+            data = read_file(self.path)
+            objects = data.setdefault(self.api_url, {})
+            for (object_type, key), entry in self._changes.items():
+                if entry is None:
+                    objects.get(object_type, {}).pop(key, None)
+                else:
+                    objects.setdefault(object_type, {})[key] = entry
+
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        self._changes = {}
+
+
+def fingerprint_key(params):
+    # the secret of the login, it is not stored in the file and a new login invalidates the hashes
+    return params.get("api_password") or params.get("api_token")
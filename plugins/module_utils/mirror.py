@@ -0,0 +1,258 @@
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import queue
+import sqlite3
+import time
+
+try:
+    from uptime_kuma_api import UptimeKumaException
+except ImportError:
+    UptimeKumaException = Exception
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    type TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (type, id)
+);
+CREATE INDEX IF NOT EXISTS objects_name ON objects (type, name);
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# object type: (list event, api method, name of the object)
+OBJECT_TYPES = {
+    "monitors": ("monitorList", "get_monitors", lambda i: i["name"]),
+    "notifications": ("notificationList", "get_notifications", lambda i: i["name"]),
+    "proxies": ("proxyList", "get_proxies", lambda i: "{0}:{1}".format(i["host"], i["port"])),
+    "docker_hosts": ("dockerHostList", "get_docker_hosts", lambda i: i["name"]),
+    "maintenances": ("maintenanceList", "get_maintenances", lambda i: i["title"]),
+    "api_keys": ("apiKeyList", "get_api_keys", lambda i: i["name"]),
+    "status_pages": ("statusPageList", "get_status_pages", lambda i: i["slug"])
+}
+
+
+def pid_path(path):
+    return path + ".pid"
+
+
+def read_pid(path):
+    try:
+        with open(pid_path(path)) as f:
+            pid = int(f.read().strip())
+    except (IOError, OSError, ValueError):
+        return None
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return None
+    return pid
+
+
+def open_database(path):
+    # the lists contain credentials, sqlite creates the -wal and -shm files with the mode of the database
+    if not os.path.exists(path):
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o600))
+    db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+    # readers do not block the writer and the writer does not block readers
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+
+def read_state(path):
+    if not os.path.isfile(path):
+        return {}
+    db = sqlite3.connect(path, timeout=10)
+    try:
+        return dict(db.execute("SELECT key, value FROM state"))
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        db.close()
+
+
+def mirror_ready(path, api_url, api_username=None):
+    """
+    True if the mirror process of the database is running, has received all lists
+    and mirrors the instance of api_url as api_username.
+    """
+    pid = read_pid(path)
+    if not pid:
+        return False
+    state = read_state(path)
+    return (
+        state.get("pid") == str(pid)
+        and state.get("ready") == "1"
+        and state.get("api_url") == api_url.rstrip("/")
+        and state.get("api_username") == api_username
+    )
+
+
+class Mirror(object):
+    """
+    Keeps a local sqlite copy of the lists that Uptime Kuma pushes over the socket.
+
+    The socket handlers of the api only enqueue the received events, the lists are
+    converted and written in the thread that calls run(). Lists that are pushed
+    several times in a row are written once.
+    """
+
+    def __init__(self, path, connect, api_username=None):
+        self.path = path
+        self.connect = connect
+        self.api_username = api_username
+        self.db = open_database(path)
+        self.events = queue.Queue()
+
+    def run(self, stop):
+        while not stop.is_set():
+            try:
+                api = self.connect()
+            except Exception as e:
+                self.set_state(ready="0", error=str(e))
+                stop.wait(5)
+                continue
+            try:
+                self.sync(api, stop)
+            except Exception as e:
+                self.set_state(error=str(e))
+            finally:
+                self.set_state(ready="0")
+                api.disconnect()
+            stop.wait(1)
+
+    def sync(self, api, stop):
+        api.wait_events = 0
+        self.subscribe(api)
+        for object_type in OBJECT_TYPES:
+            self.write_objects(api, object_type)
+        self.set_state(ready="1", error=None, api_url=api.url, api_username=self.api_username)
+
+        while not stop.is_set() and api.sio.connected:
+            try:
+                events = [self.events.get(timeout=1)]
+            except queue.Empty:
+                continue
+            while not self.events.empty():
+                events.append(self.events.get_nowait())
+            self.write_events(api, events)
+
+    def subscribe(self, api):
+        handlers = api.sio.handlers["/"]
+        for event in [i[0] for i in OBJECT_TYPES.values()]:
+            handlers[event] = self._enqueue(event, handlers[event])
+
+    def _enqueue(self, event, handler):
+        def wrapper(*args):
+            handler(*args)
+            self.events.put((event, args))
+        return wrapper
+
+    def write_events(self, api, events):
+        object_types = dict((v[0], k) for k, v in OBJECT_TYPES.items())
+        written = set()
+        for event, args in events:
+            if event not in written:
+                # the api keeps the last list
+                self.write_objects(api, object_types[event])
+                written.add(event)
+
+    def write_objects(self, api, object_type):
+        _, method, get_name = OBJECT_TYPES[object_type]
+        objects = getattr(api, method)()
+        with self.db:
+            self.db.execute("DELETE FROM objects WHERE type = ?", (object_type,))
+            self.db.executemany(
+                "INSERT INTO objects (type, id, name, data) VALUES (?, ?, ?, ?)",
+                [(object_type, i["id"], get_name(i), json.dumps(i)) for i in objects]
+            )
+
+    def set_state(self, **values):
+        values["updated"] = str(time.time())
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)",
+                list(values.items())
+            )
+
+    def close(self):
+        self.db.close()
+
+
+class MirrorApi(object):
+    """
+    Read only api for the info modules that reads the lists from the database of a mirror.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+
+    def _objects(self, object_type):
+        rows = self.db.execute("SELECT data FROM objects WHERE type = ? ORDER BY id", (object_type,))
+        return [json.loads(i[0]) for i in rows]
+
+    def _object(self, object_type, id_):
+        row = self.db.execute("SELECT data FROM objects WHERE type = ? AND id = ?", (object_type, id_)).fetchone()
+        if not row:
+            raise UptimeKumaException("{0} {1} not found".format(object_type, id_))
+        return json.loads(row[0])
+
+    def find(self, object_type, name):
+        row = self.db.execute(
+            "SELECT data FROM objects WHERE type = ? AND name = ? ORDER BY id LIMIT 1",
+            (object_type, name)
+        ).fetchone()
+        if row:
+            return json.loads(row[0])
+
+    def get_monitors(self):
+        return self._objects("monitors")
+
+    def get_monitor(self, id_):
+        return self._object("monitors", id_)
+
+    def get_notifications(self):
+        return self._objects("notifications")
+
+    def get_notification(self, id_):
+        return self._object("notifications", id_)
+
+    def get_proxies(self):
+        return self._objects("proxies")
+
+    def get_proxy(self, id_):
+        return self._object("proxies", id_)
+
+    def get_docker_hosts(self):
+        return self._objects("docker_hosts")
+
+    def get_docker_host(self, id_):
+        return self._object("docker_hosts", id_)
+
+    def get_maintenances(self):
+        return self._objects("maintenances")
+
+    def get_api_keys(self):
+        return self._objects("api_keys")
+
+    def get_api_key(self, id_):
+        return self._object("api_keys", id_)
+
+    def get_status_pages(self):
+        return self._objects("status_pages")
+
+    def disconnect(self):
+        self.db.close()
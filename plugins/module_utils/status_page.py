@@ -0,0 +1,62 @@
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import object_changed, clear_params, \
+    clear_unset_params, index_by
+
+
+def get_status_page_options(api, params, monitors):
+    # monitors is a name -> monitor index that is filled on first use,
+    # so that it can be shared between multiple status pages
+    options = clear_params(params)
+    options = clear_unset_params(options)
+    if "incident" in options:
+        del options["incident"]
+
+    for group in options.get("publicGroupList", []):
+        for monitor in group.get("monitorList", []):
+            if monitor["id"]:
+                monitor.pop("name")
+            else:
+                if not monitors:
+                    monitors.update(index_by(api.get_monitors(), "name"))
+                monitor_name = monitor.pop("name")
+                monitor["id"] = monitors[monitor_name]["id"]
+            if "sendUrl" in monitor and monitor["sendUrl"] is None:
+                monitor.pop("sendUrl")
+
+    return options
+
+
+def apply_status_page(api, params, options, status_page, result):
+    slug = params["slug"]
+    state = params["state"]
+
+    if state == "present":
+        if not status_page:
+            api.add_status_page(slug, params["title"])
+            api.save_status_page(**options)
+            # a new status page has no incident, no need to fetch it again
+            status_page_incident = None
+            result["changed"] = True
+        else:
+            changed_keys = object_changed(status_page, options, {"customCSS": "body {\n  \n}\n"})
+            if changed_keys:
+                api.save_status_page(**options)
+                result["changed"] = True
+            status_page_incident = status_page.get("incident")
+        if params["incident"]:
+            if not status_page_incident:
+                api.post_incident(slug, **params["incident"])
+                result["changed"] = True
+        else:
+            if status_page_incident:
+                api.unpin_incident(slug)
+                result["changed"] = True
+    elif state == "absent":
+        if status_page:
+            api.delete_status_page(slug)
+            result["changed"] = True
@@ -0,0 +1,253 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: api_keys
+author: Lucas Held (@lucasheld)
+short_description: Manages multiple api keys.
+description:
+  - Manages multiple api keys in one session.
+  - The api keys are identified by I(name). The existing api keys are listed only once.
+
+options:
+  api_keys:
+    description: The api keys to manage.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: The name of the api key.
+        type: str
+        required: true
+      expires:
+        description:
+          - The expiration date of the api key.
+          - If not specified, the api key does not expire.
+        type: str
+      active:
+        description: True to activate the api key.
+        type: bool
+        default: true
+      state:
+        description:
+          - Set to C(present) to create the api key.
+          - Set to C(absent) to delete the api key.
+          - Set to C(enabled) to enable the api key.
+          - Set to C(disabled) to disable the api key.
+          - C(absent), C(enabled) and C(disabled) apply to all api keys with the name.
+        type: str
+        default: present
+        choices: ["present", "absent", "enabled", "disabled"]
+  purge:
+    description:
+      - True to delete all api keys that are not listed in I(api_keys).
+      - If several api keys have the same name, all but the first one are deleted.
+    type: bool
+    default: false
+'''
+
+EXAMPLES = r'''
+- name: Add api keys
+  lucasheld.uptime_kuma.api_keys:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    api_keys:
+      - name: tenant 1
+        expires: "2023-03-30 12:20:00"
+        active: true
+      - name: tenant 2
+        expires: "2023-03-30 12:20:00"
+        active: true
+  register: result
+- name: Extract the api keys from the result and set them as fact
+  set_fact:
+    api_keys: "{{ result.created_keys | items2dict(key_name='name', value_name='key') }}"
+
+- name: Rotate api keys, disable an api key and remove all other api keys
+  lucasheld.uptime_kuma.api_keys:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    api_keys:
+      - name: tenant 1 2023
+        expires: "2024-03-30 12:20:00"
+        active: true
+      - name: tenant 2 2023
+        expires: "2024-03-30 12:20:00"
+        active: true
+      - name: tenant 3
+        state: disabled
+    purge: true
+  register: result
+'''
+
+RETURN = r'''
+api_keys:
+  description: The result of each api key, in the order of I(api_keys).
+  returned: always
+  type: complex
+  contains:
+    name:
+      description: The name of the api key.
+      returned: always
+      type: str
+      sample: tenant 1
+    changed:
+      description: True if the api key was changed.
+      returned: always
+      type: bool
+      sample: true
+created_keys:
+  description: The api keys that were created.
+  returned: always
+  type: complex
+  contains:
+    id:
+      description: The id of the api key.
+      returned: always
+      type: int
+      sample: 1
+    name:
+      description: The name of the api key.
+      returned: always
+      type: str
+      sample: tenant 1
+    key:
+      description: The api key.
+      returned: always
+      type: str
+      sample: uk1_9XPRjV7ilGj9CvWRKYiBPq9GLtQs74UzTxKfCxWY
+purged:
+  description: The api keys that were deleted because they are not listed in I(api_keys) or are duplicates.
+  returned: always
+  type: complex
+  contains:
+    id:
+      description: The id of the api key.
+      returned: always
+      type: int
+      sample: 2
+    name:
+      description: The name of the api key.
+      returned: always
+      type: str
+      sample: tenant 3
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, run_module
+
+
+def run(api, params, result):
+    # all api keys by name, uptime kuma does not prevent duplicates
+    api_keys = {}
+    for api_key in api.get_api_keys():
+        api_keys.setdefault(api_key["name"], []).append(api_key)
+
+    result["api_keys"] = []
+    result["created_keys"] = []
+    for api_key_params in params["api_keys"]:
+        name = api_key_params["name"]
+        state = api_key_params["state"]
+
+        duplicates = api_keys.get(name, [])
+
+        changed = False
+        if state == "present":
+            if not duplicates:
+                r = api.add_api_key(name, api_key_params["expires"], api_key_params["active"])
+                result["created_keys"].append({
+                    "id": r["keyID"],
+                    "name": name,
+                    "key": r["key"]
+                })
+                changed = True
+        elif state == "absent":
+            for api_key in api_keys.pop(name, []):
+                api.delete_api_key(api_key["id"])
+                changed = True
+        elif state == "enabled":
+            for api_key in duplicates:
+                if not api_key["active"]:
+                    api.enable_api_key(api_key["id"])
+                    changed = True
+        elif state == "disabled":
+            for api_key in duplicates:
+                if api_key["active"]:
+                    api.disable_api_key(api_key["id"])
+                    changed = True
+
+        result["api_keys"].append({
+            "name": name,
+            "changed": changed
+        })
+        if changed:
+            result["changed"] = True
+
+    result["purged"] = []
+    if params["purge"]:
+        names = set(i["name"] for i in params["api_keys"])
+        for name, duplicates in api_keys.items():
+            # the duplicates of a listed api key are purged, only the first one is kept
+            purged = duplicates[1:] if name in names else duplicates
+            for api_key in purged:
+                api.delete_api_key(api_key["id"])
+                result["purged"].append({
+                    "id": api_key["id"],
+                    "name": api_key["name"]
+                })
+                result["changed"] = True
+
+
+def get_module_args():
+    module_args = dict(
+        api_keys=dict(type="list", elements="dict", required=True, no_log=False, options=dict(
+            name=dict(type="str", required=True),
+            expires=dict(type="str"),
+            active=dict(type="bool", default=True),
+            state=dict(type="str", default="present", choices=["present", "absent", "enabled", "disabled"])
+        )),
+        purge=dict(type="bool", default=False)
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: clear
+author: Lucas Held (@lucasheld)
+short_description: Clears the events, heartbeats and statistics of monitors.
+description:
+  - Clears the events or heartbeats of the selected monitors, and the statistics.
+  - The monitors are selected by I(monitor_ids), I(monitor_names), I(tag_names) and I(monitor_types),
+    a monitor is selected if it matches any of them. To clear the events or heartbeats of all monitors,
+    I(all) has to be set explicitly, the module fails if neither I(all) nor a non-empty selector is specified.
+
+options:
+  data:
+    description:
+      - The data to clear.
+      - C(events) clears the events, the important heartbeats, of the selected monitors.
+      - C(heartbeats) clears the heartbeats of the selected monitors.
+      - C(statistics) clears the statistics of all monitors, Uptime Kuma does not clear them per monitor.
+    type: list
+    elements: str
+    choices: ["events", "heartbeats", "statistics"]
+    required: true
+  all:
+    description:
+      - true to clear the events or heartbeats of all monitors.
+      - Mutually exclusive with I(monitor_ids), I(monitor_names), I(tag_names) and I(monitor_types).
+    type: bool
+    default: false
+  monitor_ids:
+    description: The ids of the monitors to clear.
+    type: list
+    elements: int
+  monitor_names:
+    description: The names of the monitors to clear.
+    type: list
+    elements: str
+  tag_names:
+    description: The names of the tags whose monitors are cleared.
+    type: list
+    elements: str
+  monitor_types:
+    description: The types of the monitors to clear.
+    type: list
+    elements: str
+    choices: ["group", "http", "port", "ping", "keyword", "json-query", "grpc-keyword", "dns", "docker", "real-browser", "push", "steam", "gamedig", "mqtt", "kafka-producer", "sqlserver", "postgres", "mysql", "mongodb", "radius", "redis", "tailscale-ping"]
+  concurrency:
+    description: How many monitors are cleared at the same time.
+    type: int
+    default: 10
+'''
+
+EXAMPLES = r'''
+- name: Clear the heartbeats and events of the monitors of a tag
+  lucasheld.uptime_kuma.clear:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    tag_names:
+      - staging
+    data:
+      - heartbeats
+      - events
+
+- name: Clear the heartbeats of all monitors
+  lucasheld.uptime_kuma.clear:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    all: true
+    data:
+      - heartbeats
+
+- name: Clear the statistics
+  lucasheld.uptime_kuma.clear:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    data:
+      - statistics
+'''
+
+RETURN = r'''
+monitors:
+  description: The number of selected monitors whose events or heartbeats were cleared.
+  returned: always
+  type: int
+  sample: 12
+monitor_ids:
+  description: The ids of the selected monitors whose events or heartbeats were cleared.
+  returned: always
+  type: list
+  elements: int
+  sample: [1, 2, 3]
+cleared:
+  description: The number of cleared monitors per data, C(statistics) is true if the statistics were cleared.
+  returned: always
+  type: dict
+  sample: {"events": 12, "heartbeats": 12, "statistics": false}
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import common_module_args, \
+    run_concurrently, run_module, select_monitors
+
+try:
+    from uptime_kuma_api import MonitorType
+    HAS_UPTIME_KUMA_API = True
+except ImportError:
+    HAS_UPTIME_KUMA_API = False
+
+
+SELECTORS = ["monitor_ids", "monitor_names", "tag_names", "monitor_types"]
+
+
+def run(api, params, result):
+    data = params["data"]
+    cleared = {
+        "events": 0,
+        "heartbeats": 0,
+        "statistics": False
+    }
+    monitor_ids = []
+
+    if "events" in data or "heartbeats" in data:
+        selected = any(params[i] for i in SELECTORS)
+        if params["all"] and selected:
+            raise ValueError("all is mutually exclusive with {0}".format(", ".join(SELECTORS)))
+        if not params["all"] and not selected:
+            # an empty selector, e.g. from a filter that matched nothing, must not clear all monitors
+            raise ValueError("Either all or one of {0} with at least one element is required".format(", ".join(SELECTORS)))
+        monitors = api.get_monitors()
+        if not params["all"]:
+            monitors = select_monitors(
+                monitors,
+                params["monitor_ids"],
+                params["monitor_names"],
+                params["tag_names"],
+                params["monitor_types"]
+            )
+        monitor_ids = [i["id"] for i in monitors]
+        clears = []
+        if "events" in data:
+            clears.extend((api.clear_events, "events", i) for i in monitor_ids)
+        if "heartbeats" in data:
+            clears.extend((api.clear_heartbeats, "heartbeats", i) for i in monitor_ids)
+
+        def clear(item):
+            func, key, monitor_id = item
+            func(monitor_id)
+            return key
+
+        for key in run_concurrently(clear, clears, params["concurrency"]):
+            cleared[key] += 1
+
+    if "statistics" in data:
+        api.clear_statistics()
+        cleared["statistics"] = True
+
+    result["monitors"] = len(monitor_ids)
+    result["monitor_ids"] = monitor_ids
+    result["cleared"] = cleared
+    if monitor_ids or cleared["statistics"]:
+        result["changed"] = True
+
+
+def get_module_args():
+    module_args = dict(
+        data=dict(type="list", elements="str", choices=["events", "heartbeats", "statistics"], required=True),
+        all=dict(type="bool", default=False),
+        monitor_ids=dict(type="list", elements="int"),
+        monitor_names=dict(type="list", elements="str"),
+        tag_names=dict(type="list", elements="str"),
+        monitor_types=dict(type="list", elements="str", choices=[i.value for i in MonitorType]),
+        concurrency=dict(type="int", default=10)
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: database
+author: Lucas Held (@lucasheld)
+short_description: Reports the size of the database and shrinks it.
+description:
+  - Reports the size of the Uptime Kuma database and shrinks it.
+  - Shrinking triggers a VACUUM of the SQLite database. The server is busy while the database is shrunk.
+
+options:
+  shrink:
+    description: true to shrink the database.
+    type: bool
+    default: false
+  threshold:
+    description:
+      - Only shrink the database if its size exceeds this threshold, e.g. C(500MB).
+      - If not specified, the database is always shrunk if I(shrink) is true.
+    type: raw
+'''
+
+EXAMPLES = r'''
+- name: Get the database size
+  lucasheld.uptime_kuma.database:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+  register: result
+
+- name: Shrink the database if it is larger than 500 MB
+  lucasheld.uptime_kuma.database:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    shrink: true
+    threshold: 500MB
+'''
+
+RETURN = r'''
+size:
+  description: The size of the database in bytes before it was shrunk.
+  returned: always
+  type: int
+  sample: 61440
+size_after:
+  description: The size of the database in bytes after it was shrunk.
+  returned: If the database was shrunk.
+  type: int
+  sample: 40960
+shrunk:
+  description: True if the database was shrunk.
+  returned: always
+  type: bool
+  sample: true
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible.module_utils.common.text.formatters import human_to_bytes
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, run_module
+
+
+def run(api, params, result):
+    size = api.get_database_size()["size"]
+    result["size"] = size
+    result["shrunk"] = False
+
+    if not params["shrink"]:
+        return
+    threshold = params["threshold"]
+    if threshold is not None and size <= human_to_bytes(threshold):
+        return
+
+    api.shrink_database()
+    result["size_after"] = api.get_database_size()["size"]
+    result["shrunk"] = True
+    result["changed"] = True
+
+
+def get_module_args():
+    module_args = dict(
+        shrink=dict(type="bool", default=False),
+        threshold=dict(type="raw")
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,7 @@ DOCUMENTATION = r'''
 ---
 extends_documentation_fragment:
   - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
 
 module: docker_host
 author: Lucas Held (@lucasheld)
@@ -71,14 +72,8 @@ RETURN = r'''
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
-from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import common_module_args,\
-    get_docker_host_by_name, clear_params, clear_unset_params, object_changed
-
-try:
-    from uptime_kuma_api import UptimeKumaApi
-    HAS_UPTIME_KUMA_API = True
-except ImportError:
-    HAS_UPTIME_KUMA_API = False
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args,\
+    get_docker_host_by_name, clear_params, clear_unset_params, object_changed, run_module
 
 
 def run(api, params, result):
@@ -106,7 +101,7 @@ def run(api, params, result):
             result["changed"] = True
 
 
-def main():
+def get_module_args():
     module_args = dict(
         id=dict(type="int"),
         name=dict(type="str"),
@@ -115,36 +110,24 @@ def main():
         state=dict(type="str", default="present", choices=["present", "absent"])
     )
     module_args.update(common_module_args)
+    return module_args
 
-    module = AnsibleModule(module_args)
+
+def main():
+    module = AnsibleModule(get_module_args())
     params = module.params
 
     if not HAS_UPTIME_KUMA_API:
         module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
 
-    api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
-    api_token = params.get("api_token")
-    api_username = params.get("api_username")
-    api_password = params.get("api_password")
-    if api_token:
-        api.login_by_token(api_token)
-    elif api_username and api_password:
-        api.login(api_username, api_password)
-    else:
-        # autoLogin for enabled disableAuth
-        api.login()
-
     result = {
         "changed": False
     }
 
     try:
-        run(api, params, result)
-
-        api.disconnect()
+        run_module(run, params, result)
         module.exit_json(**result)
     except Exception:
-        api.disconnect()
         error = traceback.format_exc()
         module.fail_json(msg=error, **result)
 
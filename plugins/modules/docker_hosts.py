@@ -0,0 +1,290 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: docker_hosts
+author: Lucas Held (@lucasheld)
+short_description: Manages multiple docker hosts.
+description:
+  - Manages multiple docker hosts in one session.
+  - The docker hosts are identified by I(name). The existing docker hosts are listed only once.
+
+options:
+  docker_hosts:
+    description: The docker hosts to manage.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      name:
+        description: The name of the docker host.
+        type: str
+        required: true
+      dockerType:
+        description: The docker type of the docker host.
+        type: str
+        choices: ["socket", "tcp"]
+      dockerDaemon:
+        description: The docker daemon of the docker host.
+        type: str
+      state:
+        description:
+          - Set to C(present) to create/update the docker host.
+          - Set to C(absent) to delete the docker host.
+        type: str
+        default: present
+        choices: ["present", "absent"]
+  purge:
+    description:
+      - True to delete all docker hosts that are not listed in I(docker_hosts).
+      - If several docker hosts have the same name, all but the first one are deleted.
+    type: bool
+    default: false
+  test_connection:
+    description:
+      - True to test the connection of all docker hosts that will be created or updated before any change is applied.
+      - If a test fails, no docker host is changed.
+    type: bool
+    default: false
+  concurrency:
+    description: How many connection tests are run at the same time.
+    type: int
+    default: 10
+  fingerprint_file:
+    description:
+      - Path to a json file on the target that stores a hash of the options of every applied docker host.
+      - A docker host whose options and id match the stored hash is not compared with the existing docker host.
+      - Changes that are made outside of this module are therefore only reverted if the options change or the file is removed.
+      - The hashes are HMACs keyed with I(api_password) or I(api_token), a new password or token invalidates them.
+    type: path
+'''
+
+EXAMPLES = r'''
+- name: Add docker hosts
+  lucasheld.uptime_kuma.docker_hosts:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    docker_hosts:
+      - name: Docker host 1
+        dockerType: socket
+        dockerDaemon: /var/run/docker.sock
+      - name: Build agent 1
+        dockerType: tcp
+        dockerDaemon: tcp://10.0.0.1:2375
+
+- name: Add docker hosts after a connection test and remove all other docker hosts
+  lucasheld.uptime_kuma.docker_hosts:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    docker_hosts:
+      - name: Build agent 1
+        dockerType: tcp
+        dockerDaemon: tcp://10.0.0.1:2375
+      - name: Build agent 2
+        dockerType: tcp
+        dockerDaemon: tcp://10.0.0.2:2375
+    test_connection: true
+    concurrency: 20
+    purge: true
+'''
+
+RETURN = r'''
+docker_hosts:
+  description: The result of each docker host, in the order of I(docker_hosts).
+  returned: always
+  type: complex
+  contains:
+    name:
+      description: The name of the docker host.
+      returned: always
+      type: str
+      sample: Docker host 1
+    changed:
+      description: True if the docker host was changed.
+      returned: always
+      type: bool
+      sample: true
+    test:
+      description: The message of the connection test.
+      returned: If I(test_connection) is true and the docker host was tested.
+      type: str
+      sample: "Connected Successfully. Amount of containers: 10"
+purged:
+  description: The docker hosts that were deleted because they are not listed in I(docker_hosts) or are duplicates.
+  returned: always
+  type: complex
+  contains:
+    id:
+      description: The id of the docker host.
+      returned: always
+      type: int
+      sample: 1
+    name:
+      description: The name of the docker host.
+      returned: always
+      type: str
+      sample: Docker host 2
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import common_module_args, \
+    clear_params, clear_unset_params, object_changed, run_concurrently, run_module
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.fingerprint import FingerprintState, \
+    fingerprint_key
+
+try:
+    from uptime_kuma_api import UptimeKumaException
+    HAS_UPTIME_KUMA_API = True
+except ImportError:
+    HAS_UPTIME_KUMA_API = False
+
+
+def test_docker_host(api, docker_host, options):
+    data = {}
+    if docker_host:
+        data = {key: docker_host[key] for key in ["name", "dockerType", "dockerDaemon"]}
+    data.update(options)
+    try:
+        r = api.test_docker_host(**data)
+        return True, r.get("msg")
+    except UptimeKumaException as e:
+        return False, str(e)
+
+
+def run(api, params, result):
+    # all docker hosts by name, uptime kuma does not prevent duplicates
+    docker_hosts = {}
+    for docker_host in api.get_docker_hosts():
+        docker_hosts.setdefault(docker_host["name"], []).append(docker_host)
+    fingerprints = FingerprintState(params["fingerprint_file"], params["api_url"], fingerprint_key(params))
+
+    # (name, state, options, docker host, pending change)
+    actions = []
+    for docker_host_params in params["docker_hosts"]:
+        name = docker_host_params["name"]
+        state = docker_host_params["state"]
+        options = clear_params(docker_host_params)
+        options = clear_unset_params(options)
+
+        duplicates = docker_hosts.get(name, [])
+        docker_host = duplicates[0] if duplicates else None
+        if state == "present":
+            if fingerprints.unchanged("docker_hosts", name, options, docker_host):
+                change = False
+            else:
+                change = not docker_host or bool(object_changed(docker_host, options))
+        else:
+            change = bool(docker_host)
+        actions.append((name, state, options, docker_host, change))
+
+    result["docker_hosts"] = [{"name": i[0], "changed": False} for i in actions]
+
+    if params["test_connection"]:
+        tests = [i for i, action in enumerate(actions) if action[1] == "present" and action[4]]
+        test_results = run_concurrently(
+            lambda i: test_docker_host(api, actions[i][3], actions[i][2]),
+            tests,
+            params["concurrency"]
+        )
+        failed = []
+        for i, (ok, msg) in zip(tests, test_results):
+            result["docker_hosts"][i]["test"] = msg
+            if not ok:
+                failed.append(actions[i][0])
+        if failed:
+            raise UptimeKumaException("Connection test failed for docker hosts: {0}".format(", ".join(failed)))
+
+    for i, (name, state, options, docker_host, change) in enumerate(actions):
+        if state == "absent":
+            fingerprints.remove("docker_hosts", name)
+        elif not change:
+            fingerprints.store("docker_hosts", name, docker_host["id"], options)
+        if not change:
+            continue
+        if state == "present":
+            if not docker_host:
+                r = api.add_docker_host(**options)
+                fingerprints.store("docker_hosts", name, r["id"], options)
+            else:
+                api.edit_docker_host(docker_host["id"], **options)
+                fingerprints.store("docker_hosts", name, docker_host["id"], options)
+        elif state == "absent":
+            for duplicate in docker_hosts.pop(name, []):
+                api.delete_docker_host(duplicate["id"])
+        result["docker_hosts"][i]["changed"] = True
+        result["changed"] = True
+
+    result["purged"] = []
+    if params["purge"]:
+        names = set(i[0] for i in actions)
+        for name, duplicates in docker_hosts.items():
+            # the duplicates of a listed docker host are purged, only the first one is kept
+            purged = duplicates[1:] if name in names else duplicates
+            if name not in names:
+                fingerprints.remove("docker_hosts", name)
+            for docker_host in purged:
+                api.delete_docker_host(docker_host["id"])
+                result["purged"].append({
+                    "id": docker_host["id"],
+                    "name": docker_host["name"]
+                })
+                result["changed"] = True
+
+    fingerprints.save()
+
+
+def get_module_args():
+    module_args = dict(
+        docker_hosts=dict(type="list", elements="dict", required=True, options=dict(
+            name=dict(type="str", required=True),
+            dockerType=dict(type="str", choices=["socket", "tcp"]),
+            dockerDaemon=dict(type="str"),
+            state=dict(type="str", default="present", choices=["present", "absent"])
+        )),
+        purge=dict(type="bool", default=False),
+        test_connection=dict(type="bool", default=False),
+        concurrency=dict(type="int", default=10),
+        fingerprint_file=dict(type="path")
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
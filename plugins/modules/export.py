@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: export
+author: Lucas Held (@lucasheld)
+short_description: Exports the configuration to a file.
+description:
+  - Exports the configuration of Uptime Kuma to a file on the target as gzip compressed json lines.
+  - 'The first line is a header with the Uptime Kuma version, every following line is one record,
+    e.g. C({"type": "monitors", "data": {...}}).'
+  - The file is written to a temporary file first that replaces the file when all records are written,
+    a failed export keeps the previous file. If the records are the same as in the previous file,
+    the previous file is kept and no change is reported.
+  - The records are written in the order settings, tags, notifications, proxies, docker hosts, monitors,
+    status pages and maintenances, so that every record only references records that were written before it.
+    Group monitors are written before their children.
+  - All records are read in the same session and written as soon as they are received.
+
+options:
+  path:
+    description:
+      - Path to the file on the target that the configuration is written to.
+      - Mutually exclusive with I(api_endpoints), all endpoints would write the same file.
+    type: path
+    required: true
+  types:
+    description: The record types to export.
+    type: list
+    elements: str
+    choices: ["settings", "tags", "notifications", "proxies", "docker_hosts", "monitors", "status_pages", "maintenances"]
+    default: ["settings", "tags", "notifications", "proxies", "docker_hosts", "monitors", "status_pages", "maintenances"]
+  concurrency:
+    description: How many status pages and maintenances are queried at the same time.
+    type: int
+    default: 10
+'''
+
+EXAMPLES = r'''
+- name: Export the configuration
+  lucasheld.uptime_kuma.export:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    path: /var/backups/uptime-kuma.jsonl.gz
+
+- name: Export the monitors and their dependencies
+  lucasheld.uptime_kuma.export:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    path: /var/backups/uptime-kuma-monitors.jsonl.gz
+    types:
+      - tags
+      - notifications
+      - proxies
+      - docker_hosts
+      - monitors
+'''
+
+RETURN = r'''
+path:
+  description: The path of the written file.
+  returned: always
+  type: str
+  sample: /var/backups/uptime-kuma.jsonl.gz
+counts:
+  description: The number of written records per type.
+  returned: always
+  type: dict
+  sample: {"settings": 1, "tags": 2, "monitors": 10}
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, run_module
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.backup import RECORD_TYPES, export_records, \
+    write_records
+from ansible.module_utils.basic import missing_required_lib
+
+# the options with the files the module writes
+OUTPUT_OPTIONS = ("path",)
+
+
+def run(api, params, result):
+    records = export_records(api, params["types"], params["concurrency"])
+    counts, changed = write_records(params["path"], records, {"version": api.version})
+
+    result["changed"] = changed
+    result["path"] = params["path"]
+    result["counts"] = counts
+
+
+def get_module_args():
+    module_args = dict(
+        path=dict(type="path", required=True),
+        types=dict(type="list", elements="str", choices=RECORD_TYPES, default=list(RECORD_TYPES)),
+        concurrency=dict(type="int", default=10)
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result, output_options=OUTPUT_OPTIONS)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,11 +13,29 @@ DOCUMENTATION = r'''
 ---
 extends_documentation_fragment:
   - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
 
 module: game_list_info
 author: Lucas Held (@lucasheld)
 short_description: Retrieves facts about the games that are supported by the GameDig monitor type.
 description: Retrieves facts about the games that are supported by the GameDig monitor type.
+
+options:
+  cache_path:
+    description:
+      - Path to a file on the target that the game list is cached in, together with the Uptime Kuma version.
+      - The game list only changes with the Uptime Kuma version. If the cached version matches the version
+        of the server, the cached game list is returned, otherwise it is retrieved and the cache is updated.
+        In check mode the cache is not updated.
+      - If not specified, the game list is always retrieved.
+    type: path
+  keyword:
+    description: Only return the games whose title or keys contain this keyword, case insensitive.
+    type: str
+  keys:
+    description: Only return the games with one of these keys.
+    type: list
+    elements: str
 '''
 
 EXAMPLES = r'''
@@ -30,8 +48,13 @@ EXAMPLES = r'''
 '''
 
 RETURN = r'''
+cached:
+  description: True if the game list was read from I(cache_path).
+  returned: always
+  type: bool
+  sample: true
 game_list:
-  description: The game list
+  description: The game list, only the games that match I(keyword) and I(keys) if specified.
   returned: always
   type: complex
   contains:
@@ -58,56 +81,87 @@ game_list:
       sample: "7 Days to Die (2013)"
 '''
 
+import json
+import os
+import tempfile
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import common_module_args
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, run_module
 from ansible.module_utils.basic import missing_required_lib
 
-try:
-    from uptime_kuma_api import UptimeKumaApi
-    HAS_UPTIME_KUMA_API = True
-except ImportError:
-    HAS_UPTIME_KUMA_API = False
+
+def read_cache(path, version):
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+    except ValueError:
+        return None
+    if cache.get("version") != version:
+        return None
+    return cache["game_list"]
+
+
+def write_cache(path, version, game_list):
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"version": version, "game_list": game_list}, f)
+    os.replace(tmp_path, path)
+
+
+def filter_games(game_list, keyword, keys):
+    if keyword:
+        keyword = keyword.lower()
+        game_list = [
+            game for game in game_list
+            if keyword in game["pretty"].lower() or any(keyword in key.lower() for key in game["keys"])
+        ]
+    if keys:
+        game_list = [game for game in game_list if any(key in keys for key in game["keys"])]
+    return game_list
 
 
 def run(api, params, result):
-    result["game_list"] = api.get_game_list()
+    cache_path = params["cache_path"]
+    version = api.version if cache_path else None
+    game_list = read_cache(cache_path, version)
+    result["cached"] = game_list is not None
+    if game_list is None:
+        game_list = api.get_game_list()
+        if cache_path and not params.get("check_mode"):
+            write_cache(cache_path, version, game_list)
+
+    result["game_list"] = filter_games(game_list, params["keyword"], params["keys"])
+
+
+def get_module_args():
+    module_args = dict(
+        cache_path=dict(type="path"),
+        keyword=dict(type="str"),
+        keys=dict(type="list", elements="str", no_log=False)
+    )
+    module_args.update(common_module_args)
+    return module_args
 
 
 def main():
-    module_args = dict()
-    module_args.update(common_module_args)
-
-    module = AnsibleModule(module_args, supports_check_mode=True)
+    module = AnsibleModule(get_module_args(), supports_check_mode=True)
     params = module.params
 
     if not HAS_UPTIME_KUMA_API:
         module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
 
-    api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
-    api_token = params.get("api_token")
-    api_username = params.get("api_username")
-    api_password = params.get("api_password")
-    if api_token:
-        api.login_by_token(api_token)
-    elif api_username and api_password:
-        api.login(api_username, api_password)
-    else:
-        # autoLogin for enabled disableAuth
-        api.login()
-
     result = {
         "changed": False
     }
 
     try:
-        run(api, params, result)
-
-        api.disconnect()
+        run_module(run, dict(params, check_mode=module.check_mode), result)
         module.exit_json(**result)
     except Exception:
-        api.disconnect()
         error = traceback.format_exc()
         module.fail_json(msg=error, **result)
 
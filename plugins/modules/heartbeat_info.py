@@ -0,0 +1,315 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: heartbeat_info
+author: Lucas Held (@lucasheld)
+short_description: Retrieves the heartbeats of monitors.
+description: Retrieves the heartbeats of monitors within a time window.
+
+options:
+  monitor_ids:
+    description:
+      - The ids of the monitors whose heartbeats are retrieved.
+      - If neither I(monitor_ids) nor I(monitor_names) specified, the heartbeats of all monitors are retrieved.
+    type: list
+    elements: int
+  monitor_names:
+    description:
+      - The names of the monitors whose heartbeats are retrieved.
+      - If neither I(monitor_ids) nor I(monitor_names) specified, the heartbeats of all monitors are retrieved.
+    type: list
+    elements: str
+  hours:
+    description: The time window in hours, the heartbeats of the last I(hours) hours are retrieved.
+    type: int
+    default: 24
+  path:
+    description:
+      - Path to a file on the target that the heartbeats are written to as json lines, one heartbeat per line.
+      - The heartbeats of each monitor are written as soon as they are received and are not returned,
+        so that the memory usage does not grow with the number of heartbeats.
+      - The file is only replaced and the module only reports a change if its content changed.
+        In check mode the file is not written.
+      - If not specified, the heartbeats are returned as I(heartbeats).
+      - Mutually exclusive with I(api_endpoints), all endpoints would write the same file.
+    type: path
+  concurrency:
+    description: How many monitors are queried at the same time.
+    type: int
+    default: 10
+  connections:
+    description:
+      - How many connections to Uptime Kuma are used, the queries are distributed over the connections.
+      - Each additional connection logs in separately.
+    type: int
+    default: 1
+'''
+
+EXAMPLES = r'''
+- name: get the heartbeats of the last 24 hours of a monitor
+  lucasheld.uptime_kuma.heartbeat_info:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    monitor_names:
+      - monitor 1
+  register: result
+
+- name: write the heartbeats of the last week of all monitors to a file
+  lucasheld.uptime_kuma.heartbeat_info:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    hours: 168
+    path: /tmp/heartbeats.jsonl
+'''
+
+RETURN = r'''
+count:
+  description: The number of heartbeats.
+  returned: always
+  type: int
+  sample: 1440
+path:
+  description: The path of the file that the heartbeats were written to.
+  returned: If I(path) specified.
+  type: str
+  sample: /tmp/heartbeats.jsonl
+heartbeats:
+  description: The heartbeats as list, ordered by monitor.
+  returned: If no I(path) specified.
+  type: complex
+  contains:
+    id:
+      description: The id of the heartbeat.
+      returned: always
+      type: int
+      sample: 1
+    monitor_id:
+      description: The id of the monitor of the heartbeat.
+      returned: always
+      type: int
+      sample: 1
+    status:
+      description: The status of the heartbeat (0 down, 1 up, 2 pending, 3 maintenance).
+      returned: always
+      type: int
+      sample: 1
+    important:
+      description: True if the status of the monitor changed with this heartbeat.
+      returned: always
+      type: bool
+      sample: false
+    msg:
+      description: The message of the heartbeat.
+      returned: always
+      type: str
+      sample: '200 - OK'
+    time:
+      description: The time of the heartbeat.
+      returned: always
+      type: str
+      sample: '2023-05-01 17:23:20.349'
+    ping:
+      description: The response time in milliseconds.
+      returned: always
+      type: int
+      sample: 201
+    duration:
+      description: The seconds since the previous heartbeat.
+      returned: always
+      type: int
+      sample: 60
+    down_count:
+      description: The number of consecutive down heartbeats.
+      returned: always
+      type: int
+      sample: 0
+'''
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, index_by, \
+    connection_pool, run_concurrently, run_module
+from ansible.module_utils.basic import missing_required_lib
+
+# the options with the files the module writes
+OUTPUT_OPTIONS = ("path",)
+
+
+class HeartbeatWriter(object):
+    """
+    Writes the heartbeats of the monitors in the order of the monitors to a temporary file
+    and replaces the file with it if the content changed.
+
+    The heartbeats of a monitor wait until the heartbeats of the previous monitors are written,
+    so that the same heartbeats result in the same file. If the heartbeats of a monitor can not
+    be retrieved, the writer is aborted and the waiting monitors are not written.
+    In check mode only the hash of the content is computed and the file is not written.
+    """
+
+    def __init__(self, path, check_mode=False):
+        self.path = path
+        self.hash = hashlib.sha256()
+        self.next_index = 0
+        self.aborted = False
+        self.condition = threading.Condition()
+        self.file = None
+        if not check_mode:
+            fd, self.tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+            self.file = os.fdopen(fd, "w")
+
+    def write(self, index, lines):
+        with self.condition:
+            self.condition.wait_for(lambda: self.aborted or self.next_index == index)
+            if self.aborted:
+                return
+            self.hash.update(lines.encode("utf-8"))
+            if self.file:
+                self.file.write(lines)
+            self.next_index += 1
+            self.condition.notify_all()
+
+    def abort(self):
+        with self.condition:
+            self.aborted = True
+            self.condition.notify_all()
+
+    def discard(self):
+        if self.file:
+            self.file.close()
+            os.remove(self.tmp_path)
+
+    def close(self):
+        # returns True if the content of the file changed
+        changed = self.hash.hexdigest() != file_hash(self.path)
+        if not self.file:
+            return changed
+        self.file.close()
+        if changed:
+            if os.path.isfile(self.path):
+                shutil.copymode(self.path, self.tmp_path)
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+        return changed
+
+
+def file_hash(path):
+    if not os.path.isfile(path):
+        return None
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def get_monitor_ids(api, params):
+    monitor_ids = list(params["monitor_ids"] or [])
+    monitor_names = params["monitor_names"] or []
+    if not monitor_ids and not monitor_names:
+        return [i["id"] for i in api.get_monitors()]
+    if monitor_names:
+        monitors = index_by(api.get_monitors(), "name")
+        for monitor_name in monitor_names:
+            if monitor_name not in monitors:
+                raise ValueError("Monitor {0} not found".format(monitor_name))
+            monitor_ids.append(monitors[monitor_name]["id"])
+    # remove duplicates, keep the order
+    return list(dict.fromkeys(monitor_ids))
+
+
+def run(api, params, result):
+    monitor_ids = get_monitor_ids(api, params)
+    hours = params["hours"]
+
+    with connection_pool(api, params["connections"]) as apis:
+        if not params["path"]:
+            heartbeats = run_concurrently(
+                lambda api_, monitor_id: api_.get_monitor_beats(monitor_id, hours),
+                monitor_ids,
+                params["concurrency"],
+                apis
+            )
+            result["heartbeats"] = [heartbeat for monitor_heartbeats in heartbeats for heartbeat in monitor_heartbeats]
+            result["count"] = len(result["heartbeats"])
+            return
+
+        writer = HeartbeatWriter(params["path"], params.get("check_mode"))
+        try:
+            def write_heartbeats(api_, index_monitor_id):
+                index, monitor_id = index_monitor_id
+                try:
+                    heartbeats = api_.get_monitor_beats(monitor_id, hours)
+                    writer.write(index, "".join(json.dumps(heartbeat) + "\n" for heartbeat in heartbeats))
+                except Exception:
+                    # the following monitors wait for this one
+                    writer.abort()
+                    raise
+                return len(heartbeats)
+
+            counts = run_concurrently(write_heartbeats, enumerate(monitor_ids), params["concurrency"], apis)
+        except Exception:
+            writer.discard()
+            raise
+    result["changed"] = writer.close()
+    result["path"] = params["path"]
+    result["count"] = sum(counts)
+
+
+def get_module_args():
+    module_args = dict(
+        monitor_ids=dict(type="list", elements="int"),
+        monitor_names=dict(type="list", elements="str"),
+        hours=dict(type="int", default=24),
+        path=dict(type="path"),
+        concurrency=dict(type="int", default=10),
+        connections=dict(type="int", default=1)
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args(), supports_check_mode=True)
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, dict(params, check_mode=module.check_mode), result, output_options=OUTPUT_OPTIONS)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
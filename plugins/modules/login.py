@@ -13,6 +13,7 @@ DOCUMENTATION = r'''
 ---
 extends_documentation_fragment:
   - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
 
 module: login
 author: Lucas Held (@lucasheld)
@@ -52,13 +53,7 @@ token:
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
-from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import common_module_args
-
-try:
-    from uptime_kuma_api import UptimeKumaApi
-    HAS_UPTIME_KUMA_API = True
-except ImportError:
-    HAS_UPTIME_KUMA_API = False
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, run_module
 
 
 def run(api, params, result):
@@ -70,32 +65,30 @@ def run(api, params, result):
     result["token"] = r["token"]
 
 
-def main():
+def get_module_args():
     module_args = dict(
         api_2fa=dict(type="str", no_log=True)
     )
     module_args.update(common_module_args)
     module_args.pop("api_token")
+    return module_args
+
 
-    module = AnsibleModule(module_args)
+def main():
+    module = AnsibleModule(get_module_args())
     params = module.params
 
     if not HAS_UPTIME_KUMA_API:
         module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
 
-    api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
-
     result = {
         "changed": False
     }
 
     try:
-        run(api, params, result)
-
-        api.disconnect()
+        run_module(run, params, result, login=False)
         module.exit_json(**result)
     except Exception:
-        api.disconnect()
         error = traceback.format_exc()
         module.fail_json(msg=error, **result)
 
@@ -13,6 +13,7 @@ DOCUMENTATION = r'''
 ---
 extends_documentation_fragment:
   - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
 
 module: maintenance_info
 author: Lucas Held (@lucasheld)
@@ -30,6 +31,16 @@ options:
       - The name of the maintenance to inspect.
       - Only required if no I(id) specified.
     type: str
+  include_associations:
+    description:
+      - True to add the monitors and status pages to all maintenances if no I(id) or I(title) specified.
+      - The monitors and status pages are always added if I(id) or I(title) specified.
+    type: bool
+    default: false
+  concurrency:
+    description: How many maintenances are queried at the same time if I(include_associations) is true.
+    type: int
+    default: 10
 '''
 
 EXAMPLES = r'''
@@ -39,6 +50,14 @@ EXAMPLES = r'''
     api_username: admin
     api_password: secret123
   register: result
+
+- name: get all maintenances with their monitors and status pages
+  lucasheld.uptime_kuma.maintenance_info:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    include_associations: true
+  register: result
 '''
 
 RETURN = r'''
@@ -134,12 +153,12 @@ maintenances:
       sample: "under-maintenance"
     monitors:
       description: The monitors of the maintenance.
-      returned: If I(id) or I(title) specified.
+      returned: If I(id) or I(title) specified or I(include_associations) is true.
       type: list
       sample: [{"id": 1}]
     status_pages:
       description: The status pages of the maintenance.
-      returned: If I(id) or I(title) specified.
+      returned: If I(id) or I(title) specified or I(include_associations) is true.
       type: list
       sample: [{"id": 1,"title": "status page 1"}]
 '''
@@ -147,15 +166,10 @@ maintenances:
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import common_module_args, get_maintenance_by_title
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, get_maintenance_by_title, \
+    run_concurrently, run_module
 from ansible.module_utils.basic import missing_required_lib
 
-try:
-    from uptime_kuma_api import UptimeKumaApi
-    HAS_UPTIME_KUMA_API = True
-except ImportError:
-    HAS_UPTIME_KUMA_API = False
-
 
 def add_maintenance_monitors_status_pages(api, maintenance):
     maintenance_id = maintenance["id"]
@@ -178,46 +192,42 @@ def run(api, params, result):
         maintenances = [maintenance]
     else:
         maintenances = api.get_maintenances()
+        if params["include_associations"]:
+            run_concurrently(
+                lambda maintenance: add_maintenance_monitors_status_pages(api, maintenance),
+                maintenances,
+                params["concurrency"]
+            )
 
     result["maintenances"] = maintenances
 
 
-def main():
+def get_module_args():
     module_args = dict(
         id=dict(type="int"),
         title=dict(type="str"),
+        include_associations=dict(type="bool", default=False),
+        concurrency=dict(type="int", default=10)
     )
     module_args.update(common_module_args)
+    return module_args
 
-    module = AnsibleModule(module_args, supports_check_mode=True)
+
+def main():
+    module = AnsibleModule(get_module_args(), supports_check_mode=True)
     params = module.params
 
     if not HAS_UPTIME_KUMA_API:
         module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
 
-    api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
-    api_token = params.get("api_token")
-    api_username = params.get("api_username")
-    api_password = params.get("api_password")
-    if api_token:
-        api.login_by_token(api_token)
-    elif api_username and api_password:
-        api.login(api_username, api_password)
-    else:
-        # autoLogin for enabled disableAuth
-        api.login()
-
     result = {
         "changed": False
     }
 
     try:
-        run(api, params, result)
-
-        api.disconnect()
+        run_module(run, params, result)
         module.exit_json(**result)
     except Exception:
-        api.disconnect()
         error = traceback.format_exc()
         module.fail_json(msg=error, **result)
 
@@ -0,0 +1,185 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: migrate
+author: Lucas Held (@lucasheld)
+short_description: Copies the configuration from one Uptime Kuma instance to another.
+description:
+  - Reads the configuration of the I(source) instance once and creates or updates it on the target instance,
+    which is specified with the I(api_url) and the other common options.
+  - The records are read and applied like with the M(lucasheld.uptime_kuma.export) and M(lucasheld.uptime_kuma.restore)
+    modules, but without a file in between. See there for the matching of existing objects and the remapping of the ids.
+  - Objects that only exist on the target are not changed and not deleted.
+
+options:
+  source:
+    description: The connection to the source instance.
+    type: dict
+    required: true
+    suboptions:
+      api_url:
+        description: The Uptime Kuma URL of the source instance.
+        type: str
+        required: true
+      api_timeout:
+        description: How many seconds the client should wait for the connection, an expected event or a server response.
+        type: float
+        default: 10
+      api_headers:
+        description: Headers that are passed to the socketio connection.
+        type: dict
+      api_ssl_verify:
+        description: true to verify SSL certificates, or false to skip SSL certificate verification.
+        type: bool
+        default: true
+      api_wait_events:
+        description: How many seconds the client should wait for the next event of the same type.
+        type: float
+        default: 0.2
+      api_username:
+        description: The Uptime Kuma username of the source instance.
+        type: str
+      api_password:
+        description: The Uptime Kuma password of the source instance.
+        type: str
+      api_token:
+        description: The Uptime Kuma login token of the source instance.
+        type: str
+      api_rate_limit:
+        description: The maximum number of requests per second that are sent to the source instance.
+        type: float
+      api_latency_target:
+        description: If a response takes longer than this many seconds, the client waits between the following requests.
+        type: float
+      api_retries:
+        description: How many times a request that only reads data is sent again after it timed out.
+        type: int
+  types:
+    description: The record types to copy.
+    type: list
+    elements: str
+    choices: ["settings", "tags", "notifications", "proxies", "docker_hosts", "monitors", "status_pages", "maintenances"]
+    default: ["tags", "notifications", "proxies", "docker_hosts", "monitors", "status_pages", "maintenances"]
+  concurrency:
+    description:
+      - How many status pages and maintenances are read from the source at the same time,
+        and how many records of the same type are created or updated on the target at the same time.
+    type: int
+    default: 10
+  fingerprint_file:
+    description:
+      - Path to a json file on the target that stores a hash of every applied record of the target.
+      - A record whose hash and id match the stored values is not compared with the existing object.
+      - Changes that are made outside of this module are therefore only reverted if the record changes or the file is removed.
+      - The hashes are HMACs keyed with I(api_password) or I(api_token), a new password or token invalidates them.
+    type: path
+'''
+
+EXAMPLES = r'''
+- name: Copy the monitors and their dependencies to another instance
+  lucasheld.uptime_kuma.migrate:
+    api_url: http://new-uptime-kuma:3001
+    api_username: admin
+    api_password: secret123
+    source:
+      api_url: http://old-uptime-kuma:3001
+      api_username: admin
+      api_password: secret456
+'''
+
+RETURN = r'''
+counts:
+  description: The number of created, updated and unchanged objects on the target per type.
+  returned: always
+  type: dict
+  sample: {"tags": {"created": 2, "updated": 0, "unchanged": 1}, "monitors": {"created": 10, "updated": 1, "unchanged": 0}}
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, connect, \
+    run_module
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.backup import RECORD_TYPES, Importer, \
+    export_records
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.fingerprint import FingerprintState, \
+    fingerprint_key
+from ansible.module_utils.basic import missing_required_lib
+
+
+SOURCE_ARGS = [
+    "api_url",
+    "api_timeout",
+    "api_headers",
+    "api_ssl_verify",
+    "api_wait_events",
+    "api_username",
+    "api_password",
+    "api_token",
+    "api_rate_limit",
+    "api_latency_target",
+    "api_retries"
+]
+
+
+def run(api, params, result):
+    fingerprints = FingerprintState(params["fingerprint_file"], params["api_url"], fingerprint_key(params))
+    source_api = connect(params["source"])
+    try:
+        records = export_records(source_api, params["types"], params["concurrency"])
+        importer = Importer(api, params["concurrency"], fingerprints)
+        result["counts"] = importer.import_records(records)
+        result["changed"] = importer.changed()
+    finally:
+        source_api.disconnect()
+        fingerprints.save()
+
+
+def get_module_args():
+    source_args = dict((k, dict(common_module_args[k])) for k in SOURCE_ARGS)
+    source_args["api_url"] = dict(type="str", required=True)
+    module_args = dict(
+        source=dict(type="dict", required=True, options=source_args),
+        types=dict(type="list", elements="str", choices=RECORD_TYPES, default=RECORD_TYPES[1:]),
+        concurrency=dict(type="int", default=10),
+        fingerprint_file=dict(type="path")
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+
+module: mirror
+author: Lucas Held (@lucasheld)
+short_description: Starts and stops a local mirror of the lists of Uptime Kuma.
+description:
+  - Starts a process on the target that stays connected to Uptime Kuma and keeps a local sqlite copy
+    of the lists that Uptime Kuma pushes, the monitors, notifications, proxies, docker hosts, maintenances,
+    api keys and status pages.
+  - The info modules with the option I(mirror) read the lists from the database of a running mirror
+    instead of connecting to Uptime Kuma, if their I(api_url) and I(api_username) match the ones of the mirror.
+    Objects are looked up by id and name with indexes.
+  - The process reconnects if the connection is lost. The database is only used while the process
+    is connected and has received all lists.
+  - The process is started once and keeps running after the playbook, until it is stopped with I(state=stopped).
+
+options:
+  path:
+    description:
+      - Path to the sqlite database on the target.
+      - The id of the process is written to the same path with the suffix C(.pid).
+    type: path
+    required: true
+  state:
+    description:
+      - Set to C(started) to start the mirror if it is not running.
+        A running mirror of another I(api_url) or I(api_username) is restarted.
+        Waits until the mirror has received all lists.
+      - Set to C(stopped) to stop the mirror.
+    type: str
+    default: started
+    choices: ["started", "stopped"]
+'''
+
+EXAMPLES = r'''
+- name: Start the mirror
+  lucasheld.uptime_kuma.mirror:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    path: /var/lib/uptime-kuma-mirror.db
+
+- name: Get all monitors from the mirror
+  lucasheld.uptime_kuma.monitor_info:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    mirror: /var/lib/uptime-kuma-mirror.db
+  register: result
+
+- name: Stop the mirror
+  lucasheld.uptime_kuma.mirror:
+    path: /var/lib/uptime-kuma-mirror.db
+    state: stopped
+'''
+
+RETURN = r'''
+path:
+  description: The path of the database.
+  returned: always
+  type: str
+  sample: /var/lib/uptime-kuma-mirror.db
+pid:
+  description: The id of the mirror process.
+  returned: If I(state=started).
+  type: int
+  sample: 4242
+'''
+
+import os
+import signal
+import threading
+import time
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import connection_module_args, connect
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.mirror import Mirror, mirror_ready, pid_path, \
+    read_pid, read_state
+from ansible.module_utils.basic import missing_required_lib
+
+try:
+    from uptime_kuma_api import UptimeKumaException, Timeout
+    HAS_UPTIME_KUMA_API = True
+except ImportError:
+    HAS_UPTIME_KUMA_API = False
+
+
+def serve(params):
+    path = params["path"]
+    # the database and the pid file are only readable by the user of the mirror
+    os.umask(0o077)
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
+    mirror = Mirror(path, lambda: connect(params), params["api_username"])
+    mirror.set_state(pid=str(os.getpid()), ready="0", error=None, api_url=params["api_url"].rstrip("/"), api_username=params["api_username"])
+    with open(pid_path(path), "w") as f:
+        f.write(str(os.getpid()))
+    try:
+        mirror.run(stop)
+    finally:
+        mirror.close()
+        os.remove(pid_path(path))
+
+
+def start(params):
+    pid = os.fork()
+    if pid:
+        os.waitpid(pid, 0)
+        return
+
+    # detach from the module process, the module output must not wait for the mirror
+    try:
+        os.setsid()
+        if os.fork():
+            os._exit(0)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        os.chdir("/")
+        serve(params)
+    finally:
+        os._exit(0)
+
+
+def wait_started(params):
+    path = params["path"]
+    deadline = time.time() + params["api_timeout"] * 3
+    while time.time() < deadline:
+        if mirror_ready(path, params["api_url"], params["api_username"]):
+            return read_pid(path)
+        pid = read_pid(path)
+        state = read_state(path)
+        if pid and state.get("pid") == str(pid) and state.get("error"):
+            stop(path)
+            raise UptimeKumaException("Mirror failed to start: {0}".format(state["error"]))
+        time.sleep(0.05)
+    raise Timeout("Timed out while waiting for the mirror to start")
+
+
+def stop(path, timeout=10):
+    pid = read_pid(path)
+    if not pid:
+        return False
+    os.kill(pid, signal.SIGTERM)
+    # the mirror removes the pid file when it exits
+    deadline = time.time() + timeout
+    while os.path.exists(pid_path(path)):
+        if time.time() > deadline:
+            raise Timeout("Timed out while waiting for the mirror to stop")
+        time.sleep(0.05)
+    return True
+
+
+def mirror_matches(path, pid, params):
+    # the running mirror mirrors the instance of api_url as api_username
+    state = read_state(path)
+    return (
+        state.get("pid") == str(pid)
+        and state.get("api_url") == params["api_url"].rstrip("/")
+        and state.get("api_username") == params["api_username"]
+    )
+
+
+def run(params, result):
+    result["path"] = params["path"]
+    if params["state"] == "stopped":
+        result["changed"] = stop(params["path"])
+        return
+
+    pid = read_pid(params["path"])
+    if pid and not mirror_matches(params["path"], pid, params):
+        stop(params["path"])
+        pid = None
+    if not pid:
+        start(params)
+        pid = wait_started(params)
+        result["changed"] = True
+    result["pid"] = pid
+
+
+def get_module_args():
+    module_args = dict(
+        path=dict(type="path", required=True),
+        state=dict(type="str", default="started", choices=["started", "stopped"])
+    )
+    module_args.update(connection_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run(params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,7 @@ DOCUMENTATION = r'''
 ---
 extends_documentation_fragment:
   - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
 
 module: monitor
 author: Lucas Held (@lucasheld)
@@ -350,10 +351,10 @@ import traceback
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
 from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import object_changed, clear_params, \
     common_module_args, get_proxy_by_host_port, get_notification_by_name, get_monitor_by_name, clear_unset_params, \
-    get_docker_host_by_name
+    get_docker_host_by_name, run_module
 
 try:
-    from uptime_kuma_api import UptimeKumaApi, MonitorType
+    from uptime_kuma_api import MonitorType
     HAS_UPTIME_KUMA_API = True
 except ImportError:
     HAS_UPTIME_KUMA_API = False
@@ -440,7 +441,7 @@ def run(api, params, result):
             result["changed"] = True
 
 
-def main():
+def get_module_args():
     module_args = dict(
         id=dict(type="int"),
         name=dict(type="str"),
@@ -551,36 +552,24 @@ def main():
         state=dict(type="str", default="present", choices=["present", "absent", "paused", "resumed"])
     )
     module_args.update(common_module_args)
+    return module_args
+
 
-    module = AnsibleModule(module_args)
+def main():
+    module = AnsibleModule(get_module_args())
     params = module.params
 
     if not HAS_UPTIME_KUMA_API:
         module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
 
-    api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
-    api_token = params.get("api_token")
-    api_username = params.get("api_username")
-    api_password = params.get("api_password")
-    if api_token:
-        api.login_by_token(api_token)
-    elif api_username and api_password:
-        api.login(api_username, api_password)
-    else:
-        # autoLogin for enabled disableAuth
-        api.login()
-
     result = {
         "changed": False
     }
 
     try:
-        run(api, params, result)
-
-        api.disconnect()
+        run_module(run, params, result)
         module.exit_json(**result)
     except Exception:
-        api.disconnect()
         error = traceback.format_exc()
         module.fail_json(msg=error, **result)
 
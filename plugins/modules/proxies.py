@@ -0,0 +1,280 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: proxies
+author: Lucas Held (@lucasheld)
+short_description: Manages multiple proxies.
+description:
+  - Manages multiple proxies in one session.
+  - The proxies are identified by I(host) and I(port). The existing proxies are listed only once.
+
+options:
+  proxies:
+    description: The proxies to manage.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      host:
+        description: The host of the proxy.
+        type: str
+        required: true
+      port:
+        description: The port of the proxy.
+        type: int
+        required: true
+      protocol:
+        description: The protocol of the proxy.
+        type: str
+        choices: ["https", "http", "socks", "socks5", "socks5h", "socks4"]
+      auth:
+        description: True if the authentication is enabled.
+        type: bool
+      username:
+        description: The username of the proxy.
+        type: str
+      password:
+        description: The password of the proxy.
+        type: str
+      active:
+        description:
+          - True if the proxy is active.
+          - Uptime Kuma activates every saved proxy, an inactive proxy is therefore not reported as changed.
+        type: bool
+      default:
+        description:
+          - True if the proxy is the default.
+          - Only one proxy can be the default.
+        type: bool
+      applyExisting:
+        description:
+          - True if the proxy is applied to existing monitors.
+          - Only one proxy can be applied to existing monitors.
+        type: bool
+      state:
+        description:
+          - Set to C(present) to create/update the proxy.
+          - Set to C(absent) to delete the proxy.
+        type: str
+        default: present
+        choices: ["present", "absent"]
+  purge:
+    description:
+      - True to delete all proxies that are not listed in I(proxies).
+      - If several proxies have the same host and port, all but the first one are deleted.
+    type: bool
+    default: false
+  fingerprint_file:
+    description:
+      - Path to a json file on the target that stores a hash of the options of every applied proxy.
+      - A proxy whose options and id match the stored hash is not compared with the existing proxy.
+      - Changes that are made outside of this module are therefore only reverted if the options change or the file is removed.
+      - The hashes are HMACs keyed with I(api_password) or I(api_token), a new password or token invalidates them.
+    type: path
+'''
+
+EXAMPLES = r'''
+- name: Add proxies
+  lucasheld.uptime_kuma.proxies:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    proxies:
+      - protocol: http
+        host: 10.0.0.1
+        port: 8080
+      - protocol: http
+        host: 10.0.0.2
+        port: 8080
+        default: true
+
+- name: Add proxies and remove all other proxies
+  lucasheld.uptime_kuma.proxies:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    proxies:
+      - protocol: http
+        host: 10.0.0.1
+        port: 8080
+    purge: true
+'''
+
+RETURN = r'''
+proxies:
+  description: The result of each proxy, in the order of I(proxies).
+  returned: always
+  type: complex
+  contains:
+    host:
+      description: The host of the proxy.
+      returned: always
+      type: str
+      sample: 10.0.0.1
+    port:
+      description: The port of the proxy.
+      returned: always
+      type: int
+      sample: 8080
+    changed:
+      description: True if the proxy was changed.
+      returned: always
+      type: bool
+      sample: true
+purged:
+  description: The proxies that were deleted because they are not listed in I(proxies) or are duplicates.
+  returned: always
+  type: complex
+  contains:
+    id:
+      description: The id of the proxy.
+      returned: always
+      type: int
+      sample: 1
+    host:
+      description: The host of the proxy.
+      returned: always
+      type: str
+      sample: 10.0.0.3
+    port:
+      description: The port of the proxy.
+      returned: always
+      type: int
+      sample: 8080
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, object_changed, clear_params, common_module_args, \
+    clear_unset_params, run_module
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.fingerprint import FingerprintState, \
+    fingerprint_key
+
+
+def run(api, params, result):
+    for key in ["default", "applyExisting"]:
+        if len([i for i in params["proxies"] if i[key] and i["state"] == "present"]) > 1:
+            raise ValueError("Only one proxy can set {0}".format(key))
+
+    # all proxies by host and port, uptime kuma does not prevent duplicates
+    proxies = {}
+    for proxy in api.get_proxies():
+        proxies.setdefault((proxy["host"], proxy["port"]), []).append(proxy)
+    fingerprints = FingerprintState(params["fingerprint_file"], params["api_url"], fingerprint_key(params))
+
+    result["proxies"] = []
+    for proxy_params in params["proxies"]:
+        host = proxy_params["host"]
+        port = proxy_params["port"]
+        state = proxy_params["state"]
+        options = clear_params(proxy_params)
+        options = clear_unset_params(options)
+
+        duplicates = proxies.get((host, port), [])
+        proxy = duplicates[0] if duplicates else None
+        key = "{0}:{1}".format(host, port)
+
+        changed = False
+        if state == "present":
+            if not proxy:
+                r = api.add_proxy(**options)
+                fingerprints.store("proxies", key, r["id"], options)
+                changed = True
+            elif not fingerprints.unchanged("proxies", key, options, proxy):
+                # uptime kuma always activates a saved proxy
+                changed_keys = object_changed(proxy, options, {"applyExisting": [False, None], "active": True})
+                if changed_keys:
+                    api.edit_proxy(proxy["id"], **options)
+                    changed = True
+                fingerprints.store("proxies", key, proxy["id"], options)
+        elif state == "absent":
+            for i in proxies.pop((host, port), []):
+                api.delete_proxy(i["id"])
+                changed = True
+            fingerprints.remove("proxies", key)
+
+        result["proxies"].append({
+            "host": host,
+            "port": port,
+            "changed": changed
+        })
+        if changed:
+            result["changed"] = True
+
+    result["purged"] = []
+    if params["purge"]:
+        keys = [(i["host"], i["port"]) for i in params["proxies"]]
+        for key, duplicates in proxies.items():
+            # the duplicates of a listed proxy are purged, only the first one is kept
+            purged = duplicates[1:] if key in keys else duplicates
+            if key not in keys:
+                fingerprints.remove("proxies", "{0}:{1}".format(*key))
+            for proxy in purged:
+                api.delete_proxy(proxy["id"])
+                result["purged"].append({
+                    "id": proxy["id"],
+                    "host": proxy["host"],
+                    "port": proxy["port"]
+                })
+                result["changed"] = True
+
+    fingerprints.save()
+
+
+def get_module_args():
+    module_args = dict(
+        proxies=dict(type="list", elements="dict", required=True, options=dict(
+            host=dict(type="str", required=True),
+            port=dict(type="int", required=True),
+            protocol=dict(type="str", choices=["https", "http", "socks", "socks5", "socks5h", "socks4"]),
+            auth=dict(type="bool"),
+            username=dict(type="str"),
+            password=dict(type="str", no_log=True),
+            active=dict(type="bool"),
+            default=dict(type="bool"),
+            applyExisting=dict(type="bool"),
+            state=dict(type="str", default="present", choices=["present", "absent"])
+        )),
+        purge=dict(type="bool", default=False),
+        fingerprint_file=dict(type="path")
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
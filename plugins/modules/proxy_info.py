@@ -13,6 +13,7 @@ DOCUMENTATION = r'''
 ---
 extends_documentation_fragment:
   - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
 
 module: proxy_info
 author: Lucas Held (@lucasheld)
@@ -37,6 +38,12 @@ options:
       - Only required if no I(id) specified.
       - Only valid in combination with I(host).
     type: int
+  mirror:
+    description:
+      - Path to the database of a mirror started with the M(lucasheld.uptime_kuma.mirror) module.
+      - If the mirror is running, has received all lists and mirrors the same I(api_url) as I(api_username),
+        the proxies are read from the database instead of Uptime Kuma. Otherwise the module connects to Uptime Kuma.
+    type: path
 '''
 
 EXAMPLES = r'''
@@ -114,15 +121,10 @@ proxies:
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import common_module_args, get_proxy_by_host_port
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, get_proxy_by_host_port, \
+    run_module
 from ansible.module_utils.basic import missing_required_lib
 
-try:
-    from uptime_kuma_api import UptimeKumaApi
-    HAS_UPTIME_KUMA_API = True
-except ImportError:
-    HAS_UPTIME_KUMA_API = False
-
 
 def run(api, params, result):
     if params["id"]:
@@ -135,43 +137,32 @@ def run(api, params, result):
         result["proxies"] = api.get_proxies()
 
 
-def main():
+def get_module_args():
     module_args = dict(
         id=dict(type="int"),
         host=dict(type="str"),
         port=dict(type="int"),
+        mirror=dict(type="path"),
     )
     module_args.update(common_module_args)
+    return module_args
+
 
-    module = AnsibleModule(module_args, supports_check_mode=True)
+def main():
+    module = AnsibleModule(get_module_args(), supports_check_mode=True)
     params = module.params
 
     if not HAS_UPTIME_KUMA_API:
         module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
 
-    api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
-    api_token = params.get("api_token")
-    api_username = params.get("api_username")
-    api_password = params.get("api_password")
-    if api_token:
-        api.login_by_token(api_token)
-    elif api_username and api_password:
-        api.login(api_username, api_password)
-    else:
-        # autoLogin for enabled disableAuth
-        api.login()
-
     result = {
         "changed": False
     }
 
     try:
-        run(api, params, result)
-
-        api.disconnect()
+        run_module(run, params, result)
         module.exit_json(**result)
     except Exception:
-        api.disconnect()
         error = traceback.format_exc()
         module.fail_json(msg=error, **result)
 
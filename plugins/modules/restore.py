@@ -0,0 +1,115 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: restore
+author: Lucas Held (@lucasheld)
+short_description: Restores the configuration from a file.
+description:
+  - Imports a file on the target that was written by the M(lucasheld.uptime_kuma.export) module.
+  - The file is read one record at a time, the records are created or updated in dependency order in one session.
+  - Existing objects are matched by their name, proxies by host and port, status pages by slug and maintenances by title.
+  - The ids of the file are remapped to the ids of the matched or created objects, e.g. the notifications,
+    proxy, docker host, parent and tags of a monitor. References to objects that are not part of the file are removed.
+  - Objects that are not part of the file are not changed and not deleted.
+  - The setting disableAuth is not imported.
+
+options:
+  path:
+    description: Path to the file on the target that is restored.
+    type: path
+    required: true
+  concurrency:
+    description: How many records of the same type are created or updated at the same time.
+    type: int
+    default: 10
+  fingerprint_file:
+    description:
+      - Path to a json file on the target that stores a hash of every applied record of the target.
+      - A record whose hash and id match the stored values is not compared with the existing object.
+      - Changes that are made outside of this module are therefore only reverted if the record changes or the file is removed.
+      - The hashes are HMACs keyed with I(api_password) or I(api_token), a new password or token invalidates them.
+    type: path
+'''
+
+EXAMPLES = r'''
+- name: Restore the configuration
+  lucasheld.uptime_kuma.restore:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    path: /var/backups/uptime-kuma.jsonl.gz
+'''
+
+RETURN = r'''
+counts:
+  description: The number of created, updated and unchanged objects per type.
+  returned: always
+  type: dict
+  sample: {"tags": {"created": 2, "updated": 0, "unchanged": 1}, "monitors": {"created": 10, "updated": 1, "unchanged": 0}}
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, run_module
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.backup import Importer, read_records
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.fingerprint import FingerprintState, \
+    fingerprint_key
+from ansible.module_utils.basic import missing_required_lib
+
+
+def run(api, params, result):
+    fingerprints = FingerprintState(params["fingerprint_file"], params["api_url"], fingerprint_key(params))
+    importer = Importer(api, params["concurrency"], fingerprints)
+    try:
+        result["counts"] = importer.import_records(read_records(params["path"]))
+    finally:
+        fingerprints.save()
+    result["changed"] = importer.changed()
+
+
+def get_module_args():
+    module_args = dict(
+        path=dict(type="path", required=True),
+        concurrency=dict(type="int", default=10),
+        fingerprint_file=dict(type="path")
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,7 @@ DOCUMENTATION = r'''
 ---
 extends_documentation_fragment:
   - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
 
 module: status_page
 author: Lucas Held (@lucasheld)
@@ -164,68 +165,27 @@ RETURN = r'''
 import traceback
 
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib
-from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import object_changed, clear_params, \
-    common_module_args, clear_unset_params, get_monitor_by_name
-
-try:
-    from uptime_kuma_api import UptimeKumaApi
-    HAS_UPTIME_KUMA_API = True
-except ImportError:
-    HAS_UPTIME_KUMA_API = False
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, get_status_page_by_slug, \
+    run_module
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.status_page import get_status_page_options, \
+    apply_status_page
 
 
 def run(api, params, result):
     slug = params["slug"]
     state = params["state"]
 
-    options = clear_params(params)
-    options = clear_unset_params(options)
-    if "incident" in options:
-        del options["incident"]
-
-    for group in options.get("publicGroupList", []):
-        for monitor in group.get("monitorList", []):
-            if monitor["id"]:
-                monitor.pop("name")
-            else:
-                monitor_name = monitor.pop("name")
-                monitor["id"] = get_monitor_by_name(api, monitor_name)["id"]
-            if "sendUrl" in monitor and monitor["sendUrl"] is None:
-                monitor.pop("sendUrl")
+    options = get_status_page_options(api, params, {})
 
-    try:
+    status_page = get_status_page_by_slug(api, slug)
+    if status_page and state == "present":
+        # the status page list does not contain the groups and the incident
         status_page = api.get_status_page(slug)
-    except Exception:
-        status_page = None
 
-    if state == "present":
-        if not status_page:
-            api.add_status_page(slug, params["title"])
-            api.save_status_page(**options)
-            status_page = api.get_status_page(slug)
-            result["changed"] = True
-        else:
-            changed_keys = object_changed(status_page, options, {"customCSS": "body {\n  \n}\n"})
-            if changed_keys:
-                api.save_status_page(**options)
-                result["changed"] = True
-        if status_page:
-            status_page_incident = status_page.get("incident")
-            if params["incident"]:
-                if not status_page_incident:
-                    api.post_incident(slug, **params["incident"])
-                    result["changed"] = True
-            else:
-                if status_page_incident:
-                    api.unpin_incident(slug)
-                    result["changed"] = True
-    elif state == "absent":
-        if status_page:
-            api.delete_status_page(slug)
-            result["changed"] = True
+    apply_status_page(api, params, options, status_page, result)
 
 
-def main():
+def get_module_args():
     module_args = dict(
         slug=dict(type="str", required=True),
         # id_=dict(type="int"),
@@ -257,36 +217,24 @@ def main():
         state=dict(type="str", default="present", choices=["present", "absent"])
     )
     module_args.update(common_module_args)
+    return module_args
 
-    module = AnsibleModule(module_args)
+
+def main():
+    module = AnsibleModule(get_module_args())
     params = module.params
 
     if not HAS_UPTIME_KUMA_API:
         module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
 
-    api = UptimeKumaApi(params["api_url"], timeout=params["api_timeout"], headers=params["api_headers"], ssl_verify=params["api_ssl_verify"], wait_events=params["api_wait_events"])
-    api_token = params.get("api_token")
-    api_username = params.get("api_username")
-    api_password = params.get("api_password")
-    if api_token:
-        api.login_by_token(api_token)
-    elif api_username and api_password:
-        api.login(api_username, api_password)
-    else:
-        # autoLogin for enabled disableAuth
-        api.login()
-
     result = {
         "changed": False
     }
 
     try:
-        run(api, params, result)
-
-        api.disconnect()
+        run_module(run, params, result)
         module.exit_json(**result)
     except Exception:
-        api.disconnect()
         error = traceback.format_exc()
         module.fail_json(msg=error, **result)
 
@@ -0,0 +1,310 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: status_pages
+author: Lucas Held (@lucasheld)
+short_description: Manages multiple status pages.
+description:
+  - Manages multiple status pages in one session.
+  - The existing status pages are listed once. Full details are only fetched for status pages that need to be compared.
+
+options:
+  status_pages:
+    description: The status pages to manage. Each entry accepts the options of the M(lucasheld.uptime_kuma.status_page) module.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      slug:
+        description: The slug of the status page.
+        type: str
+        required: true
+      title:
+        description: The title of the status page.
+        type: str
+      description:
+        description: The description of the status page.
+        type: str
+      theme:
+        description: The theme of the status page.
+        type: str
+        choices: ["auto", "light", "dark"]
+      published:
+        description: True if the status page is published.
+        type: bool
+      showTags:
+        description: True if the tags are shown.
+        type: bool
+      domainNameList:
+        description: The domain name list of the status page.
+        type: list
+        elements: "str"
+      googleAnalyticsId:
+        description: The Google Analytics ID of the status page.
+        type: str
+      customCSS:
+        description: The custom CSS of the status page.
+        type: str
+      footerText:
+        description: The footer text of the status page.
+        type: str
+      showPoweredBy:
+        description: True if the powered by is shown.
+        type: bool
+      icon:
+        description: The icon of the status page.
+        type: str
+      publicGroupList:
+        description: The public group list of the status page.
+        type: list
+        elements: dict
+        suboptions:
+          name:
+            description: The name of the group.
+            type: str
+            required: true
+          weight:
+            description: The weight of the group.
+            type: int
+          monitorList:
+            description: The monitor list of the group.
+            type: list
+            elements: dict
+            required: true
+            suboptions:
+              id:
+                description:
+                  - The id of the monitor.
+                  - Only required if no I(name) specified.
+                type: int
+              name:
+                description:
+                  - The name of the monitor.
+                  - Only required if no I(id) specified.
+                type: str
+              sendUrl:
+                description: True if the monitor URL is a publicly shown clickable link.
+                type: bool
+      incident:
+        description: The incident of the status page.
+        type: dict
+        suboptions:
+          title:
+            description: The title of the status page.
+            type: str
+            required: true
+          content:
+            description: The content of the status page.
+            type: str
+            required: true
+          style:
+            description: The style of the status page.
+            type: str
+            choices: ["info", "warning", "danger", "primary", "light", "dark"]
+      state:
+        description:
+          - Set to C(present) to create/update the status page.
+          - Set to C(absent) to delete the status page.
+        type: str
+        default: present
+        choices: ["present", "absent"]
+  fingerprint_file:
+    description:
+      - Path to a json file on the target that stores a hash of the options of every applied status page.
+      - A status page whose options and id match the stored hash is neither retrieved nor compared with the existing status page.
+      - Changes that are made outside of this module are therefore only reverted if the options change or the file is removed.
+      - The hashes are HMACs keyed with I(api_password) or I(api_token), a new password or token invalidates them.
+    type: path
+'''
+
+EXAMPLES = r'''
+- name: Add status pages
+  lucasheld.uptime_kuma.status_pages:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    status_pages:
+      - slug: customer1
+        title: Customer 1
+      - slug: customer2
+        title: Customer 2
+        incident:
+          title: incidenttitle
+          content: incidentcontent
+          style: info
+
+- name: Add status pages with monitors
+  lucasheld.uptime_kuma.status_pages:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    status_pages:
+      - slug: customer1
+        title: Customer 1
+        publicGroupList:
+          - name: Services
+            weight: 1
+            monitorList:
+              - name: Monitor 1
+      - slug: customer2
+        title: Customer 2
+        publicGroupList:
+          - name: Services
+            weight: 1
+            monitorList:
+              - name: Monitor 2
+
+- name: Remove status pages
+  lucasheld.uptime_kuma.status_pages:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    status_pages:
+      - slug: customer1
+        state: absent
+      - slug: customer2
+        state: absent
+'''
+
+RETURN = r'''
+status_pages:
+  description: The result of each status page, in the order of I(status_pages).
+  returned: always
+  type: complex
+  contains:
+    slug:
+      description: The slug of the status page.
+      returned: always
+      type: str
+      sample: customer1
+    changed:
+      description: True if the status page was changed.
+      returned: always
+      type: bool
+      sample: true
+'''
+
+import traceback
+
+from ansible.module_utils.basic import AnsibleModule, missing_required_lib
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, index_by, \
+    run_module
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.status_page import get_status_page_options, \
+    apply_status_page
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.fingerprint import FingerprintState, \
+    fingerprint_key
+
+
+def run(api, params, result):
+    status_pages = index_by(api.get_status_pages(), "slug")
+    monitors = {}
+    fingerprints = FingerprintState(params["fingerprint_file"], params["api_url"], fingerprint_key(params))
+
+    result["status_pages"] = []
+    for status_page_params in params["status_pages"]:
+        slug = status_page_params["slug"]
+        state = status_page_params["state"]
+
+        options = get_status_page_options(api, status_page_params, monitors)
+
+        desired = {
+            "options": options,
+            "incident": status_page_params["incident"]
+        }
+
+        status_page = status_pages.get(slug)
+        status_page_result = {
+            "changed": False
+        }
+        if state == "absent":
+            apply_status_page(api, status_page_params, options, status_page, status_page_result)
+            fingerprints.remove("status_pages", slug)
+        elif not fingerprints.unchanged("status_pages", slug, desired, status_page):
+            if status_page:
+                # the status page list does not contain the groups and the incident
+                status_page = api.get_status_page(slug)
+            apply_status_page(api, status_page_params, options, status_page, status_page_result)
+            # the id of a new status page is stored with the next run
+            fingerprints.store("status_pages", slug, status_page["id"] if status_page else None, desired)
+        result["status_pages"].append({
+            "slug": slug,
+            "changed": status_page_result["changed"]
+        })
+        if status_page_result["changed"]:
+            result["changed"] = True
+
+    fingerprints.save()
+
+
+def get_module_args():
+    module_args = dict(
+        status_pages=dict(type="list", elements="dict", required=True, options=dict(
+            slug=dict(type="str", required=True),
+            title=dict(type="str"),
+            description=dict(type="str"),
+            theme=dict(type="str", choices=["auto", "light", "dark"]),
+            published=dict(type="bool"),
+            showTags=dict(type="bool"),
+            domainNameList=dict(type="list", elements="str"),
+            googleAnalyticsId=dict(type="str"),
+            customCSS=dict(type="str"),
+            footerText=dict(type="str"),
+            showPoweredBy=dict(type="bool"),
+            icon=dict(type="str"),
+            publicGroupList=dict(type="list", elements="dict", options=dict(
+                name=dict(type="str", required=True),
+                weight=dict(type="int", required=False),
+                monitorList=dict(type="list", elements="dict", required=True, options=dict(
+                    id=dict(type="int", required=False),
+                    name=dict(type="str", required=False),
+                    sendUrl=dict(type="bool", required=False)
+                ))
+            )),
+            incident=dict(type="dict", options=dict(
+                title=dict(type="str", required=True),
+                content=dict(type="str", required=True),
+                style=dict(type="str", choices=["info", "warning", "danger", "primary", "light", "dark"])
+            )),
+            state=dict(type="str", default="present", choices=["present", "absent"])
+        )),
+        fingerprint_file=dict(type="path")
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args())
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
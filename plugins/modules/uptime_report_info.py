@@ -0,0 +1,341 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2023, Lucas Held <lucasheld@hotmail.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+DOCUMENTATION = r'''
+---
+extends_documentation_fragment:
+  - lucasheld.uptime_kuma.uptime_kuma
+  - lucasheld.uptime_kuma.uptime_kuma.run
+
+module: uptime_report_info
+author: Lucas Held (@lucasheld)
+short_description: Computes the availability and response times of monitors.
+description:
+  - Retrieves the heartbeats of monitors and computes the availability, the downtime
+    and the response times per monitor and per tag for one or more time windows.
+  - Heartbeats with the status up or maintenance count as available, heartbeats with the status down as downtime.
+  - Each heartbeat is weighted by its duration, the seconds since the previous heartbeat.
+
+options:
+  monitor_ids:
+    description:
+      - The ids of the monitors to report.
+      - If none of I(monitor_ids), I(monitor_names) and I(tag_names) specified, all monitors are reported.
+    type: list
+    elements: int
+  monitor_names:
+    description:
+      - The names of the monitors to report.
+      - If none of I(monitor_ids), I(monitor_names) and I(tag_names) specified, all monitors are reported.
+    type: list
+    elements: str
+  tag_names:
+    description:
+      - The names of the tags whose monitors are reported.
+      - If none of I(monitor_ids), I(monitor_names) and I(tag_names) specified, all monitors are reported.
+    type: list
+    elements: str
+  windows:
+    description:
+      - The time windows in hours, e.g. C([24, 168, 720]) for a day, a week and 30 days.
+      - The heartbeats of the largest window are retrieved once and used for all windows.
+    type: list
+    elements: int
+    default: [24]
+  by_tag:
+    description: True to also report all tags of the reported monitors.
+    type: bool
+    default: true
+  concurrency:
+    description: How many monitors are queried at the same time.
+    type: int
+    default: 10
+'''
+
+EXAMPLES = r'''
+- name: get the availability of all monitors for the last day, week and 30 days
+  lucasheld.uptime_kuma.uptime_report_info:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    windows:
+      - 24
+      - 168
+      - 720
+  register: result
+
+- name: get the availability of the monitors of a tag
+  lucasheld.uptime_kuma.uptime_report_info:
+    api_url: http://127.0.0.1:3001
+    api_username: admin
+    api_password: secret123
+    tag_names:
+      - production
+  register: result
+'''
+
+RETURN = r'''
+monitors:
+  description: The reports of the monitors as list.
+  returned: always
+  type: complex
+  contains:
+    id:
+      description: The id of the monitor.
+      returned: always
+      type: int
+      sample: 1
+    name:
+      description: The name of the monitor.
+      returned: always
+      type: str
+      sample: 'monitor 1'
+    windows:
+      description: The reports for each window, in the order of I(windows).
+      returned: always
+      type: complex
+      contains:
+        hours:
+          description: The time window in hours.
+          returned: always
+          type: int
+          sample: 24
+        beats:
+          description: The number of heartbeats in the window.
+          returned: always
+          type: int
+          sample: 1440
+        availability:
+          description: The available time in percent, None if there are no heartbeats.
+          returned: always
+          type: float
+          sample: 99.93
+        downtime_minutes:
+          description: The time with the status down in minutes.
+          returned: always
+          type: float
+          sample: 1.0
+        ping_mean:
+          description: The mean response time in milliseconds, None if there are no response times.
+          returned: always
+          type: float
+          sample: 195.2
+        ping_p95:
+          description: The 95th percentile of the response times in milliseconds.
+          returned: always
+          type: float
+          sample: 230.0
+        ping_p99:
+          description: The 99th percentile of the response times in milliseconds.
+          returned: always
+          type: float
+          sample: 301.0
+tags:
+  description: The reports of the tags of the reported monitors as list, the heartbeats of all monitors of a tag are combined.
+  returned: If I(by_tag) is true.
+  type: complex
+  contains:
+    name:
+      description: The name of the tag.
+      returned: always
+      type: str
+      sample: 'production'
+    monitors:
+      description: The number of reported monitors with this tag.
+      returned: always
+      type: int
+      sample: 12
+    windows:
+      description: The reports for each window, like the windows of the monitors.
+      returned: always
+      type: list
+      sample: [{"hours": 24, "beats": 17280, "availability": 99.99, "downtime_minutes": 1.0, "ping_mean": 195.2, "ping_p95": 230.0, "ping_p99": 301.0}]
+'''
+
+import math
+import operator
+import traceback
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, chain, filterfalse
+from datetime import datetime, timedelta, timezone
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.lucasheld.uptime_kuma.plugins.module_utils.common import HAS_UPTIME_KUMA_API, common_module_args, \
+    run_concurrently, run_module, select_monitors
+from ansible.module_utils.basic import missing_required_lib
+
+
+STATUS_DOWN = 0
+STATUS_UP = 1
+STATUS_MAINTENANCE = 3
+UP_STATUS = frozenset([STATUS_UP, STATUS_MAINTENANCE])
+
+
+class BeatArrays(object):
+    """
+    The heartbeats of the largest window as typed arrays, ordered by time.
+
+    The durations, the available and down durations and the available heartbeats are summed up once
+    with running totals, the sums of a window are the differences of two totals. Windows are slices,
+    the percentiles are computed over the sorted pings of the slices.
+    """
+
+    def __init__(self, heartbeats):
+        self.times = [i["time"] for i in heartbeats]
+        status = array("b", [i["status"] for i in heartbeats])
+        durations = array("d", [i["duration"] or 0 for i in heartbeats])
+        up = array("b", map(UP_STATUS.__contains__, status))
+        down = array("b", map(STATUS_DOWN.__eq__, status))
+        self.total = running_total(durations)
+        self.up = running_total(map(operator.mul, durations, up))
+        self.down = running_total(map(operator.mul, durations, down))
+        self.up_beats = running_total(up)
+        self.pings = array("d", [i["ping"] if i["ping"] is not None else math.nan for i in heartbeats])
+
+    def window(self, since):
+        # heartbeat times are utc strings that sort like the times
+        start = bisect_right(self.times, since)
+        return WindowArrays(
+            len(self.times) - start,
+            self.total[-1] - self.total[start],
+            self.up[-1] - self.up[start],
+            self.down[-1] - self.down[start],
+            self.up_beats[-1] - self.up_beats[start],
+            self.pings[start:]
+        )
+
+
+def running_total(values):
+    # the sums of the first 0 to n values
+    return array("d", accumulate(chain([0], values)))
+
+
+class WindowArrays(object):
+    def __init__(self, beats, total, up, down, up_beats, pings):
+        self.beats = beats
+        self.total = total
+        self.up = up
+        self.down = down
+        self.up_beats = up_beats
+        self.pings = array("d", sorted(filterfalse(math.isnan, pings)))
+
+    @classmethod
+    def combine(cls, windows):
+        combined = cls.__new__(cls)
+        combined.beats = sum(i.beats for i in windows)
+        combined.total = sum(i.total for i in windows)
+        combined.up = sum(i.up for i in windows)
+        combined.down = sum(i.down for i in windows)
+        combined.up_beats = sum(i.up_beats for i in windows)
+        pings = array("d")
+        for window in windows:
+            pings.extend(window.pings)
+        combined.pings = array("d", sorted(pings))
+        return combined
+
+    def report(self, hours):
+        if self.total:
+            availability = self.up / self.total * 100
+        elif self.beats:
+            # only the first heartbeat of a monitor has no duration
+            availability = self.up_beats / self.beats * 100
+        else:
+            availability = None
+        return {
+            "hours": hours,
+            "beats": self.beats,
+            "availability": round(availability, 4) if availability is not None else None,
+            "downtime_minutes": round(self.down / 60, 2),
+            "ping_mean": round(sum(self.pings) / len(self.pings), 2) if self.pings else None,
+            "ping_p95": percentile(self.pings, 95),
+            "ping_p99": percentile(self.pings, 99)
+        }
+
+
+def percentile(sorted_values, p):
+    # nearest rank percentile
+    if not sorted_values:
+        return None
+    rank = int(math.ceil(p / 100.0 * len(sorted_values)))
+    return sorted_values[max(rank, 1) - 1]
+
+
+def run(api, params, result):
+    windows = sorted(set(params["windows"]))
+    since = dict(
+        (hours, (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3])
+        for hours in windows
+    )
+    monitors = select_monitors(api.get_monitors(), params["monitor_ids"], params["monitor_names"], params["tag_names"])
+
+    def get_windows(monitor):
+        # only the arrays of the windows are kept, not the heartbeats
+        beats = BeatArrays(api.get_monitor_beats(monitor["id"], windows[-1]))
+        return dict((hours, beats.window(since[hours])) for hours in windows)
+
+    monitor_windows = run_concurrently(get_windows, monitors, params["concurrency"])
+
+    result["monitors"] = [{
+        "id": monitor["id"],
+        "name": monitor["name"],
+        "windows": [monitor_window[hours].report(hours) for hours in params["windows"]]
+    } for monitor, monitor_window in zip(monitors, monitor_windows)]
+
+    if params["by_tag"]:
+        tags = {}
+        for monitor, monitor_window in zip(monitors, monitor_windows):
+            # a monitor can have the same tag multiple times with different values
+            for tag_name in set(tag["name"] for tag in monitor["tags"]):
+                tags.setdefault(tag_name, []).append(monitor_window)
+        result["tags"] = [{
+            "name": tag_name,
+            "monitors": len(tag_windows),
+            "windows": [
+                WindowArrays.combine([i[hours] for i in tag_windows]).report(hours) for hours in params["windows"]
+            ]
+        } for tag_name, tag_windows in sorted(tags.items())]
+
+
+def get_module_args():
+    module_args = dict(
+        monitor_ids=dict(type="list", elements="int"),
+        monitor_names=dict(type="list", elements="str"),
+        tag_names=dict(type="list", elements="str"),
+        windows=dict(type="list", elements="int", default=[24]),
+        by_tag=dict(type="bool", default=True),
+        concurrency=dict(type="int", default=10)
+    )
+    module_args.update(common_module_args)
+    return module_args
+
+
+def main():
+    module = AnsibleModule(get_module_args(), supports_check_mode=True)
+    params = module.params
+
+    if not HAS_UPTIME_KUMA_API:
+        module.fail_json(msg=missing_required_lib("uptime_kuma_api"))
+
+    result = {
+        "changed": False
+    }
+
+    try:
+        run_module(run, params, result)
+        module.exit_json(**result)
+    except Exception:
+        error = traceback.format_exc()
+        module.fail_json(msg=error, **result)
+
+
+if __name__ == '__main__':
+    main()
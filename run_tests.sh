@@ -10,6 +10,9 @@
 #
 # run all tests against specific uptime kuma version and specific modules:
 # ./run_tests.sh 1.19.4 maintenance maintenance_info
+#
+# run all tests against the in-memory fake server (tests/fake_server) instead of docker:
+# ./run_tests.sh fake
 
 venv_path="$(pwd)/venv/bin/python"
 collection_path="$HOME/.ansible/collections/ansible_collections/lucasheld/uptime_kuma"
@@ -42,10 +45,17 @@ done
 
 for version in ${versions[*]}
 do
-  docker rm -f uptimekuma > /dev/null 2>&1
+  if [ "$version" = "fake" ]
+  then
+    echo "Starting fake uptime kuma..."
+    "$venv_path" -m tests.fake_server --port 3001 > /dev/null 2>&1 &
+    fake_server_pid=$!
+  else
+    docker rm -f uptimekuma > /dev/null 2>&1
 
-  echo "Starting uptime kuma $version..."
-  docker run -d -it --rm -p 3001:3001 --name uptimekuma "louislam/uptime-kuma:$version" > /dev/null || exit 1
+    echo "Starting uptime kuma $version..."
+    docker run -d -it --rm -p 3001:3001 --name uptimekuma "louislam/uptime-kuma:$version" > /dev/null || exit 1
+  fi
 
   while [[ "$(curl -s -L -o /dev/null -w ''%{http_code}'' 127.0.0.1:3001)" != "200" ]]
   do
@@ -60,7 +70,12 @@ do
   ansible-test integration -v --requirements --python-interpreter "$venv_path" $integration_targets
 
   echo "Stopping uptime kuma..."
-  docker stop uptimekuma > /dev/null
+  if [ "$version" = "fake" ]
+  then
+    kill "$fake_server_pid"
+  else
+    docker stop uptimekuma > /dev/null
+  fi
   sleep 1
 
   echo ""
@@ -0,0 +1,3 @@
+from .benchmark import run_benchmarks
+
+__all__ = ["run_benchmarks"]
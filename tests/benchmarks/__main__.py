@@ -0,0 +1,69 @@
+import argparse
+import json
+import os
+import sys
+
+# the modules import their module_utils from ansible_collections,
+# add the collections root if the collection is installed in a collections path
+collection_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+collections_path = os.path.dirname(os.path.dirname(os.path.dirname(collection_root)))
+if os.path.basename(os.path.dirname(os.path.dirname(collection_root))) == "ansible_collections":
+    sys.path.insert(0, collections_path)
+
+from .benchmark import DEFAULT_SIZES, SCENARIOS, compare, run_benchmarks  # noqa: E402
+
+
+def format_row(values):
+    return "{0:<34} {1:>7} {2:>9} {3:>6} {4:>6} {5:>10} {6:>8}".format(*values)
+
+
+def report(measurement):
+    peak = measurement["peak_memory"]
+    print(format_row([
+        measurement["scenario"],
+        measurement["size"],
+        "{0:.3f}".format(measurement["seconds"]),
+        measurement["calls"],
+        measurement["waits"],
+        "{0:.1f}".format(peak / 1024.0 / 1024.0) if peak is not None else "-",
+        measurement["changed"]
+    ]))
+    sys.stdout.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Measures the run functions of the modules against seeded fake uptime kuma servers."
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="number of seeded monitors, notifications and tags")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), help="scenarios to run, defaults to all")
+    parser.add_argument("--latency", type=float, default=0.0, help="delay of every server event in seconds")
+    parser.add_argument("--wait-events", type=float, default=0.01, help="api_wait_events of the client")
+    parser.add_argument("--no-memory", action="store_true", help="do not trace the memory usage, it slows down the runs")
+    parser.add_argument("--output", help="write the results as json to this file")
+    parser.add_argument("--baseline", help="compare the results to a json file written by --output")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="allowed factor of the duration compared to the baseline")
+    args = parser.parse_args()
+
+    print(format_row(["scenario", "size", "seconds", "calls", "waits", "peak MiB", "changed"]))
+    results = run_benchmarks(args.sizes, args.scenarios, args.latency, args.wait_events, not args.no_memory, report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print("regression: {0}".format(regression))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
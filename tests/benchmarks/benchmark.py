@@ -0,0 +1,236 @@
+"""
+Scalability benchmarks of the module run functions.
+
+Every scenario calls the run function of a module, like ModuleTestCase.run_module does,
+against a fake server that is seeded with the same number of monitors, notifications and tags.
+The wall time, the socket.io calls, the waits for pushed event data and the peak memory
+of the client are recorded.
+
+Run from the collection root of an installed collection::
+
+    python -m tests.benchmarks --sizes 100 1000 10000 --output baseline.json
+    python -m tests.benchmarks --baseline baseline.json
+"""
+import copy
+import importlib
+import multiprocessing
+import socket
+import time
+import tracemalloc
+from collections import Counter
+
+from ansible.module_utils.common.arg_spec import ArgumentSpecValidator
+from uptime_kuma_api import UptimeKumaApi
+
+from tests.fake_server import FakeUptimeKumaServer
+
+
+USERNAME = "admin"
+PASSWORD = "secret123"
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+
+def _name(kind, size, position):
+    # name of a seeded object, position is relative to the dataset size
+    return "{0} {1}".format(kind, max(1, int(size * position)))
+
+
+# name -> (module, function that returns the task arguments for the dataset size)
+SCENARIOS = {
+    "monitor_info_all": ("monitor_info", lambda size: {}),
+    "monitor_info_by_name": ("monitor_info", lambda size: {
+        "name": _name("monitor", size, 0.5)
+    }),
+    "monitor_unchanged": ("monitor", lambda size: {
+        "name": _name("monitor", size, 0.5),
+        "type": "http",
+        "url": "http://127.0.0.1/{0}".format(max(1, int(size * 0.5)))
+    }),
+    "monitor_add_with_notifications": ("monitor", lambda size: {
+        "name": "benchmark monitor",
+        "type": "http",
+        "url": "http://127.0.0.1/benchmark",
+        "notification_names": [_name("notification", size, i / 10.0) for i in range(1, 11)]
+    }),
+    "monitor_tag_present": ("monitor_tag", lambda size: {
+        "monitor_name": _name("monitor", size, 0.5),
+        "tag_name": _name("tag", size, 0.9),
+        "value": "benchmark"
+    }),
+    "notification_info_all": ("notification_info", lambda size: {}),
+    "notification_unchanged": ("notification", lambda size: {
+        "name": _name("notification", size, 0.5),
+        "type": "PushByTechulus",
+        "pushAPIKey": "123456789"
+    }),
+    "tag_info_all": ("tag_info", lambda size: {}),
+    "tag_unchanged": ("tag", lambda size: {
+        "name": _name("tag", size, 0.5)
+    }),
+    "maintenance_with_monitor_names": ("maintenance", lambda size: {
+        "title": "benchmark maintenance",
+        "strategy": "manual",
+        "monitors": [{"name": _name("monitor", size, i / 10.0)} for i in range(1, 11)]
+    }),
+    "status_page_with_monitor_names": ("status_page", lambda size: {
+        "slug": "benchmark",
+        "title": "benchmark",
+        "publicGroupList": [{
+            "name": "services",
+            "monitorList": [{"name": _name("monitor", size, i / 10.0)} for i in range(1, 11)]
+        }]
+    })
+}
+
+
+def _free_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def _serve(port, size, latency):
+    server = FakeUptimeKumaServer(port=port, latency=latency)
+    server.add_user(USERNAME, PASSWORD)
+    server.seed(monitors=size, notifications=size, tags=size)
+    server.serve_forever()
+
+
+def start_server(size, latency):
+    """
+    Starts a seeded fake server in a separate process,
+    so that its memory usage is not included in the measurements.
+    """
+    port = _free_port()
+    process = multiprocessing.Process(target=_serve, args=(port, size, latency), daemon=True)
+    process.start()
+    timestamp = time.time()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            break
+        except OSError:
+            if time.time() - timestamp > 30:
+                process.terminate()
+                raise
+            time.sleep(0.05)
+    return process, "http://127.0.0.1:{0}".format(port)
+
+
+def count_calls(api):
+    """
+    Counts the socket.io calls and the waits for pushed event data of the api instance.
+    Every wait for event data sleeps wait_events seconds.
+    """
+    calls = Counter()
+    waits = Counter()
+    call = api._call
+    get_event_data = api._get_event_data
+
+    def counted_call(event, data=None):
+        calls[event] += 1
+        return call(event, data)
+
+    def counted_get_event_data(event):
+        waits[str(event.value)] += 1
+        return get_event_data(event)
+
+    api._call = counted_call
+    api._get_event_data = counted_get_event_data
+    return calls, waits
+
+
+def build_params(module, url, args):
+    args = dict(args, api_url=url)
+    validation_result = ArgumentSpecValidator(module.get_module_args()).validate(args)
+    if validation_result.error_messages:
+        raise ValueError(validation_result.errors.msg)
+    return validation_result.validated_parameters
+
+
+def run_scenario(api, url, name, size, memory=True):
+    module_name, build_args = SCENARIOS[name]
+    module = importlib.import_module("plugins.modules.{0}".format(module_name))
+    params = build_params(module, url, build_args(size))
+
+    calls, waits = count_calls(api)
+    result = {
+        "changed": False
+    }
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        module.run(api, copy.deepcopy(params), result)
+    finally:
+        duration = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if memory else None
+        if memory:
+            tracemalloc.stop()
+        del api._call
+        del api._get_event_data
+
+    return {
+        "scenario": name,
+        "module": module_name,
+        "size": size,
+        "seconds": round(duration, 4),
+        "calls": sum(calls.values()),
+        "waits": sum(waits.values()),
+        "calls_by_event": dict(calls),
+        "waits_by_event": dict(waits),
+        "peak_memory": peak,
+        "changed": result["changed"]
+    }
+
+
+def run_benchmarks(sizes=None, scenarios=None, latency=0.0, wait_events=0.01, memory=True, report=None):
+    """
+    Runs the scenarios against a fake server for every dataset size and returns the measurements.
+    The scenarios of one size share the connection, like the tasks of a play share the server state.
+    """
+    sizes = sizes or DEFAULT_SIZES
+    scenarios = scenarios or list(SCENARIOS)
+    results = []
+    for size in sizes:
+        process, url = start_server(size, latency)
+        try:
+            start = time.perf_counter()
+            api = UptimeKumaApi(url, timeout=300, wait_events=wait_events)
+            api.login(USERNAME, PASSWORD)
+            # wait for the initial messages, like the first get call of a module would do
+            api.get_monitors()
+            login_seconds = time.perf_counter() - start
+            for name in scenarios:
+                measurement = run_scenario(api, url, name, size, memory)
+                measurement["login_seconds"] = round(login_seconds, 4)
+                results.append(measurement)
+                if report:
+                    report(measurement)
+            api.disconnect()
+        finally:
+            process.terminate()
+            process.join()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the regressions of results compared to baseline: more api calls or waits,
+    or a duration that is more than threshold times the baseline duration.
+    """
+    baseline = dict(((i["scenario"], i["size"]), i) for i in baseline)
+    regressions = []
+    for result in results:
+        old = baseline.get((result["scenario"], result["size"]))
+        if not old:
+            continue
+        for key in ["calls", "waits"]:
+            if result[key] > old[key]:
+                regressions.append("{0} ({1}): {2} {3} -> {4}".format(result["scenario"], result["size"], key, old[key], result[key]))
+        if result["seconds"] > old["seconds"] * threshold:
+            regressions.append("{0} ({1}): seconds {2} -> {3}".format(result["scenario"], result["size"], old["seconds"], result["seconds"]))
+    return regressions
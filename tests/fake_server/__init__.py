@@ -0,0 +1,3 @@
+from .server import FakeUptimeKumaServer
+
+__all__ = ["FakeUptimeKumaServer"]
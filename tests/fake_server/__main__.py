@@ -0,0 +1,41 @@
+import argparse
+
+from .server import DEFAULT_VERSION, FakeUptimeKumaServer
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.fake_server",
+        description="Runs an in-memory fake of the Uptime Kuma socket.io server."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=3001)
+    parser.add_argument("--version", default=DEFAULT_VERSION, help="uptime kuma version that is reported to the clients")
+    parser.add_argument("--latency", type=float, default=0.0, help="delay of every event in seconds")
+    parser.add_argument("--username", help="create this user, otherwise the setup is required")
+    parser.add_argument("--password")
+    for name in ["monitors", "notifications", "tags", "proxies", "docker-hosts", "status-pages", "maintenances",
+                 "api-keys", "heartbeats"]:
+        parser.add_argument("--{0}".format(name), type=int, default=0, help="number of generated {0}".format(name.replace("-", " ")))
+    args = parser.parse_args()
+
+    server = FakeUptimeKumaServer(args.host, args.port, args.latency, args.version)
+    if args.username:
+        server.add_user(args.username, args.password)
+    server.seed(
+        monitors=args.monitors,
+        notifications=args.notifications,
+        tags=args.tags,
+        proxies=args.proxies,
+        docker_hosts=args.docker_hosts,
+        status_pages=args.status_pages,
+        maintenances=args.maintenances,
+        api_keys=args.api_keys,
+        heartbeats=args.heartbeats
+    )
+    print("Fake Uptime Kuma {0} listening on {1}".format(args.version, server.url))
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
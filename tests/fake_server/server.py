@@ -0,0 +1,1398 @@
+import base64
+import datetime
+import hashlib
+import hmac
+import itertools
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import struct
+import threading
+import time
+from collections import Counter
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import ServerHandler, WSGIRequestHandler, WSGIServer, make_server
+
+import socketio
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_VERSION = "1.23.2"
+
+PROXY_PROTOCOLS = ["https", "http", "socks", "socks5", "socks5h", "socks4"]
+
+# keys of a monitor that are computed by the server and never stored as sent by the client
+COMPUTED_MONITOR_KEYS = ["id", "tags", "childrenIDs", "pathName", "maintenance", "forceInactive", "includeSensitiveData"]
+
+MONITOR_DEFAULTS = {
+    "accepted_statuscodes": ["200-299"],
+    "active": True,
+    "authDomain": None,
+    "authMethod": None,
+    "authWorkstation": None,
+    "basic_auth_pass": None,
+    "basic_auth_user": None,
+    "body": None,
+    "databaseConnectionString": None,
+    "databaseQuery": None,
+    "description": None,
+    "dns_last_result": None,
+    "dns_resolve_server": "1.1.1.1",
+    "dns_resolve_type": "A",
+    "docker_container": None,
+    "docker_host": None,
+    "expectedValue": None,
+    "expiryNotification": False,
+    "game": None,
+    "gamedigGivenPortOnly": True,
+    "grpcBody": None,
+    "grpcEnableTls": False,
+    "grpcMetadata": None,
+    "grpcMethod": None,
+    "grpcProtobuf": None,
+    "grpcServiceName": None,
+    "grpcUrl": None,
+    "headers": None,
+    "hostname": None,
+    "httpBodyEncoding": "json",
+    "ignoreTls": False,
+    "interval": 60,
+    "invertKeyword": False,
+    "jsonPath": None,
+    "kafkaProducerAllowAutoTopicCreation": False,
+    "kafkaProducerBrokers": [],
+    "kafkaProducerMessage": None,
+    "kafkaProducerSaslOptions": {},
+    "kafkaProducerSsl": False,
+    "kafkaProducerTopic": None,
+    "keyword": None,
+    "maxredirects": 10,
+    "maxretries": 0,
+    "method": "GET",
+    "mqttPassword": "",
+    "mqttSuccessMessage": "",
+    "mqttTopic": "",
+    "mqttUsername": "",
+    "name": None,
+    "notificationIDList": {},
+    "oauth_auth_method": None,
+    "oauth_client_id": None,
+    "oauth_client_secret": None,
+    "oauth_scopes": None,
+    "oauth_token_url": None,
+    "packetSize": 56,
+    "parent": None,
+    "port": None,
+    "proxyId": None,
+    "pushToken": None,
+    "radiusCalledStationId": None,
+    "radiusCallingStationId": None,
+    "radiusPassword": None,
+    "radiusSecret": None,
+    "radiusUsername": None,
+    "resendInterval": 0,
+    "retryInterval": 60,
+    "screenshot": None,
+    "timeout": 48,
+    "tlsCa": None,
+    "tlsCert": None,
+    "tlsKey": None,
+    "type": "http",
+    "upsideDown": False,
+    "url": "https://",
+    "weight": 2000
+}
+
+SETTINGS_DEFAULTS = {
+    "checkUpdate": True,
+    "checkBeta": False,
+    "keepDataPeriodDays": 180,
+    "serverTimezone": "UTC",
+    "entryPage": "dashboard",
+    "searchEngineIndex": False,
+    "primaryBaseURL": "",
+    "steamAPIKey": "",
+    "nscd": True,
+    "dnsCache": True,
+    "chromeExecutable": "",
+    "tlsExpiryNotifyDays": [7, 14, 21],
+    "disableAuth": False,
+    "trustProxy": False
+}
+
+GAME_LIST = [
+    {"keys": ["minecraft"], "pretty": "Minecraft (2009)", "options": {"port": 25565, "protocol": "minecraft"}, "extra": {}},
+    {"keys": ["csgo"], "pretty": "Counter-Strike: Global Offensive (2012)", "options": {"port": 27015, "protocol": "valve"}, "extra": {}},
+    {"keys": ["tf2"], "pretty": "Team Fortress 2 (2007)", "options": {"port": 27015, "protocol": "valve"}, "extra": {}},
+    {"keys": ["rust"], "pretty": "Rust (2013)", "options": {"port": 28015, "protocol": "valve"}, "extra": {}},
+    {"keys": ["terraria"], "pretty": "Terraria - TShock (2011)", "options": {"port": 7777, "protocol": "terraria"}, "extra": {}},
+    {"keys": ["valheim"], "pretty": "Valheim (2021)", "options": {"port": 2457, "port_query_offset": 1, "protocol": "valve"}, "extra": {}}
+]
+
+# size of an empty uptime kuma sqlite database
+EMPTY_DATABASE_SIZE = 98304
+
+
+class FakeUptimeKumaError(Exception):
+    pass
+
+
+def now():
+    return datetime.datetime.utcnow()
+
+
+def format_datetime(date, milliseconds=False):
+    if milliseconds:
+        return date.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    return date.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def verify_totp(secret, token, window=1):
+    # rfc 6238 with the defaults of uptime kuma (sha1, 6 digits, 30 seconds)
+    if not secret or not token:
+        return False
+    key = base64.b32decode(secret)
+    counter = int(time.time()) // 30
+    for i in range(counter - window, counter + window + 1):
+        digest = hmac.new(key, struct.pack(">Q", i), hashlib.sha1).digest()
+        offset = digest[-1] & 0x0f
+        code = (struct.unpack(">I", digest[offset:offset + 4])[0] & 0x7fffffff) % 1000000
+        if "{0:06d}".format(code) == str(token):
+            return True
+    return False
+
+
+def check_slug(slug):
+    if not re.match(r"^[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*$", slug):
+        raise FakeUptimeKumaError("Invalid Slug")
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _ServerHandler(ServerHandler):
+    def handle_error(self):
+        # a closed websocket connection ends the request without a response
+        if self.environ.get("HTTP_UPGRADE", "").lower() == "websocket":
+            return
+        super(_ServerHandler, self).handle_error()
+
+
+class _WSGIRequestHandler(WSGIRequestHandler):
+    # wsgiref with access to the raw socket, like gunicorn, to support websocket connections
+
+    def get_environ(self):
+        environ = super(_WSGIRequestHandler, self).get_environ()
+        environ["gunicorn.socket"] = self.connection
+        return environ
+
+    def handle(self):
+        self.raw_requestline = self.rfile.readline(65537)
+        if len(self.raw_requestline) > 65536:
+            self.send_error(414)
+            return
+        if not self.parse_request():
+            return
+        handler = _ServerHandler(self.rfile, self.wfile, self.get_stderr(), self.get_environ(), multithread=True)
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeUptimeKumaServer(socketio.Namespace):
+    """
+    In-memory stand-in for the Uptime Kuma Socket.IO server.
+
+    Implements the socket.io events and the public status page endpoint that are used by
+    the uptime_kuma_api package, with the response formats of Uptime Kuma 1.23.
+    Every event is delayed by ``latency`` seconds to simulate the round trip and the
+    database access of a real instance. The number of handled events is counted in ``calls``.
+
+    Usage::
+
+        server = FakeUptimeKumaServer(latency=0.005)
+        server.add_user("admin", "secret123")
+        server.seed(monitors=10000, notifications=100, tags=100)
+        server.start()
+        api = UptimeKumaApi(server.url)
+        ...
+        server.stop()
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, version=DEFAULT_VERSION, after_login_delay=0.0):
+        super(FakeUptimeKumaServer, self).__init__("/")
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.version = version
+        # the real server waits 500 ms after login before it sends the status page list
+        self.after_login_delay = after_login_delay
+
+        self.calls = Counter()
+        self._lock = threading.RLock()
+        self._sessions = {}
+        self._users = {}
+        self._tokens = {}
+        self._httpd = None
+        self._thread = None
+
+        self.sio = socketio.Server(async_mode="threading", always_connect=True, max_http_buffer_size=100000000)
+        self.sio.register_namespace(self)
+        self.app = socketio.WSGIApp(self.sio, self._http_app)
+
+        self.reset()
+
+    # lifecycle
+
+    @property
+    def url(self):
+        return "http://{0}:{1}".format(self.host, self.port)
+
+    def start(self):
+        self._httpd = make_server(
+            self.host, self.port, self.app,
+            server_class=_ThreadingWSGIServer, handler_class=_WSGIRequestHandler
+        )
+        self.port = self._httpd.server_port
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def serve_forever(self):
+        self.start()
+        try:
+            self._thread.join()
+        except KeyboardInterrupt:
+            self.stop()
+
+    # data
+
+    def reset(self):
+        """Deletes all data except the users."""
+        with self._lock:
+            self._ids = {}
+            self.settings = dict(SETTINGS_DEFAULTS)
+            self.monitors = {}
+            self.monitor_tags = {}
+            self.tags = {}
+            self.notifications = {}
+            self.proxies = {}
+            self.docker_hosts = {}
+            self.status_pages = {}
+            self.status_page_groups = {}
+            self.incidents = {}
+            self.maintenances = {}
+            self.maintenance_monitors = {}
+            self.maintenance_status_pages = {}
+            self.api_keys = {}
+            self.heartbeats = {}
+            self.freed_bytes = 0
+            self.calls.clear()
+
+    def add_user(self, username, password):
+        with self._lock:
+            self._users[username] = {
+                "id": len(self._users) + 1,
+                "username": username,
+                "password": password
+            }
+
+    def _next_id(self, table):
+        if table not in self._ids:
+            self._ids[table] = itertools.count(1)
+        return next(self._ids[table])
+
+    def seed(self, monitors=0, notifications=0, tags=0, proxies=0, docker_hosts=0, status_pages=0,
+             maintenances=0, api_keys=0, heartbeats=0, heartbeat_interval=60, seed=0):
+        """
+        Adds generated objects. Every monitor gets one tag and one notification (round robin)
+        and ``heartbeats`` heartbeats in the past, ``heartbeat_interval`` seconds apart.
+        """
+        rand = random.Random(seed)
+        with self._lock:
+            notification_ids = [self._add_notification({
+                "name": "notification {0}".format(i),
+                "type": "PushByTechulus",
+                "pushAPIKey": "123456789",
+                "isDefault": False,
+                "applyExisting": False
+            }) for i in range(1, notifications + 1)]
+            tag_ids = [self._add_tag("tag {0}".format(i), "#{0:06x}".format(rand.randrange(0x1000000)))
+                       for i in range(1, tags + 1)]
+            for i in range(1, proxies + 1):
+                self._save_proxy({"protocol": "http", "host": "10.0.{0}.{1}".format(i // 256, i % 256), "port": 8080}, None)
+            for i in range(1, docker_hosts + 1):
+                self._save_docker_host({"name": "docker host {0}".format(i), "dockerType": "socket", "dockerDaemon": "/var/run/docker.sock"}, None)
+            for i in range(1, monitors + 1):
+                monitor_id = self._add_monitor({
+                    "type": "http",
+                    "name": "monitor {0}".format(i),
+                    "url": "http://127.0.0.1/{0}".format(i),
+                    "notificationIDList": {str(notification_ids[i % len(notification_ids)]): True} if notification_ids else {}
+                })
+                if tag_ids:
+                    self._add_monitor_tag(tag_ids[i % len(tag_ids)], monitor_id, "")
+                self._seed_heartbeats(monitor_id, heartbeats, heartbeat_interval, rand)
+            for i in range(1, status_pages + 1):
+                self._add_status_page("status page {0}".format(i), "status-page-{0}".format(i))
+            for i in range(1, maintenances + 1):
+                self._add_maintenance({"title": "maintenance {0}".format(i), "strategy": "manual", "active": True})
+            for i in range(1, api_keys + 1):
+                self._add_api_key({"name": "api key {0}".format(i), "expires": None, "active": 1})
+
+    def _seed_heartbeats(self, monitor_id, count, interval, rand):
+        heartbeats = self.heartbeats.setdefault(monitor_id, [])
+        start = now() - datetime.timedelta(seconds=count * interval)
+        previous_status = None
+        for i in range(count):
+            status = 1 if rand.random() > 0.02 else 0
+            heartbeats.append({
+                "id": self._next_id("heartbeat"),
+                "important": 1 if status != previous_status else 0,
+                "monitor_id": monitor_id,
+                "status": status,
+                "msg": "200 - OK" if status else "timeout of 48000ms exceeded",
+                "time": format_datetime(start + datetime.timedelta(seconds=i * interval), milliseconds=True),
+                "ping": rand.randint(5, 300) if status else None,
+                "duration": interval if previous_status is not None else 0,
+                "down_count": 0
+            })
+            previous_status = status
+
+    def database_size(self):
+        with self._lock:
+            data = [self.monitors, self.monitor_tags, self.tags, self.notifications, self.proxies, self.docker_hosts,
+                    self.status_pages, self.maintenances, self.api_keys, self.heartbeats]
+            size = sum(len(json.dumps(i, default=str)) for i in data)
+        return EMPTY_DATABASE_SIZE + size + self.freed_bytes
+
+    def _free(self, obj):
+        self.freed_bytes += len(json.dumps(obj, default=str))
+
+    # socket.io dispatching
+
+    def trigger_event(self, event, *args):
+        self.calls[event] += 1
+        if event in ["connect", "disconnect"]:
+            return super(FakeUptimeKumaServer, self).trigger_event(event, *args)
+        if self.latency:
+            time.sleep(self.latency)
+        handler = getattr(self, "on_" + event, None)
+        if not handler:
+            return {"ok": False, "msg": "event {0} is not implemented by the fake server".format(event)}
+        try:
+            return handler(*args)
+        except FakeUptimeKumaError as e:
+            return {"ok": False, "msg": str(e)}
+        except Exception as e:
+            # like uptime kuma, unexpected errors are returned to the client
+            logger.exception("event %s failed", event)
+            return {"ok": False, "msg": str(e)}
+
+    def _user_id(self, sid):
+        user = self._sessions.get(sid)
+        if not user:
+            raise FakeUptimeKumaError("You are not logged in.")
+        return user["id"]
+
+    def _room(self, sid):
+        return "user-{0}".format(self._user_id(sid))
+
+    def on_connect(self, sid, environ, auth=None):
+        self.emit("info", self._info(hide_version=True), to=sid)
+        if self.settings["disableAuth"] and self._users:
+            user = list(self._users.values())[0]
+            self._after_login(sid, user)
+            self.emit("autoLogin", to=sid)
+
+    def on_disconnect(self, sid, reason=None):
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def _info(self, hide_version=False):
+        info = {
+            "primaryBaseURL": self.settings["primaryBaseURL"] or None,
+            "serverTimezone": self.settings["serverTimezone"],
+            "serverTimezoneOffset": "+00:00"
+        }
+        if not hide_version:
+            info.update({
+                "version": self.version,
+                "latestVersion": self.version
+            })
+        return info
+
+    def _after_login(self, sid, user):
+        with self._lock:
+            self._sessions[sid] = user
+        self.enter_room(sid, self._room(sid))
+        self._send_monitor_list(sid)
+        self.emit("info", self._info(), to=sid)
+        self._send_maintenance_list(sid)
+        self._send_notification_list(sid)
+        self._send_proxy_list(sid)
+        self._send_docker_host_list(sid)
+        self._send_api_key_list(sid)
+        if self.after_login_delay:
+            timer = threading.Timer(self.after_login_delay, self._send_after_login_delayed, (sid,))
+            timer.daemon = True
+            timer.start()
+        else:
+            self._send_after_login_delayed(sid)
+
+    def _send_after_login_delayed(self, sid):
+        if sid not in self._sessions:
+            return
+        self._send_status_page_list(sid)
+        with self._lock:
+            monitor_ids = list(self.monitors)
+        for monitor_id in monitor_ids:
+            self._send_monitor_stats(sid, monitor_id)
+
+    # lists
+
+    def _send_monitor_list(self, sid):
+        with self._lock:
+            data = self._monitor_list_json()
+        self.emit("monitorList", data, room=self._room(sid))
+
+    def _send_notification_list(self, sid):
+        with self._lock:
+            data = [dict(i) for i in self.notifications.values()]
+        self.emit("notificationList", data, room=self._room(sid))
+
+    def _send_proxy_list(self, sid):
+        with self._lock:
+            data = [dict(i) for i in self.proxies.values()]
+        self.emit("proxyList", data, room=self._room(sid))
+
+    def _send_docker_host_list(self, sid):
+        with self._lock:
+            data = [dict(i) for i in self.docker_hosts.values()]
+        self.emit("dockerHostList", data, room=self._room(sid))
+
+    def _send_maintenance_list(self, sid):
+        with self._lock:
+            data = dict((str(i), self._maintenance_json(i)) for i in self.maintenances)
+        self.emit("maintenanceList", data, room=self._room(sid))
+
+    def _send_api_key_list(self, sid):
+        with self._lock:
+            data = [self._api_key_json(i) for i in self.api_keys]
+        self.emit("apiKeyList", data, room=self._room(sid))
+
+    def _send_status_page_list(self, sid):
+        with self._lock:
+            data = dict((str(i), self._status_page_json(i)) for i in self.status_pages)
+        self.emit("statusPageList", data, to=sid)
+
+    def _send_monitor_stats(self, sid, monitor_id):
+        with self._lock:
+            heartbeats = list(self.heartbeats.get(monitor_id, []))
+        important = [self._heartbeat_json(i) for i in heartbeats if i["important"]]
+        self.emit("heartbeatList", (monitor_id, [self._heartbeat_json(i) for i in heartbeats[-100:]], True), to=sid)
+        self.emit("importantHeartbeatList", (monitor_id, list(reversed(important[-500:])), True), to=sid)
+        pings = [i["ping"] for i in heartbeats if i["ping"] is not None]
+        self.emit("avgPing", (monitor_id, round(sum(pings) / len(pings), 2) if pings else None), to=sid)
+        for hours in [24, 720]:
+            self.emit("uptime", (monitor_id, hours, self._uptime(heartbeats, hours)), to=sid)
+
+    @staticmethod
+    def _heartbeat_json(heartbeat):
+        return {
+            "monitorID": heartbeat["monitor_id"],
+            "status": heartbeat["status"],
+            "time": heartbeat["time"],
+            "msg": heartbeat["msg"],
+            "ping": heartbeat["ping"],
+            "important": bool(heartbeat["important"]),
+            "duration": heartbeat["duration"]
+        }
+
+    @staticmethod
+    def _uptime(heartbeats, hours):
+        start = format_datetime(now() - datetime.timedelta(hours=hours), milliseconds=True)
+        beats = [i for i in heartbeats if i["time"] > start]
+        if not beats:
+            return 0
+        return len([i for i in beats if i["status"] in [1, 3]]) / len(beats)
+
+    # auth
+
+    def on_needSetup(self, sid):
+        return not self._users
+
+    def on_setup(self, sid, username, password):
+        if self._users:
+            raise FakeUptimeKumaError("Uptime Kuma has been initialized. If you want to run setup again, please delete the database.")
+        self.add_user(username, password)
+        return {"ok": True, "msg": "Added Successfully."}
+
+    def on_login(self, sid, data):
+        user = self._users.get(data.get("username"))
+        if not user or user["password"] != data.get("password"):
+            return {"ok": False, "msg": "Incorrect username or password."}
+        if user.get("twofa_status"):
+            if not data.get("token"):
+                return {"tokenRequired": True}
+            if not verify_totp(user["twofa_secret"], data["token"]):
+                return {"ok": False, "msg": "Invalid Token!"}
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._tokens[token] = user["username"]
+        self._after_login(sid, user)
+        return {"ok": True, "token": token}
+
+    def on_loginByToken(self, sid, token):
+        username = self._tokens.get(token)
+        if not username or username not in self._users:
+            return {"ok": False, "msg": "Invalid token."}
+        self._after_login(sid, self._users[username])
+        return {"ok": True}
+
+    def on_logout(self, sid):
+        self.leave_room(sid, self._room(sid))
+        with self._lock:
+            self._sessions.pop(sid, None)
+
+    def on_changePassword(self, sid, password):
+        user = self._check_password(sid, password.get("currentPassword"))
+        user["password"] = password["newPassword"]
+        return {"ok": True, "msg": "Password has been updated successfully."}
+
+    def _check_password(self, sid, password):
+        self._user_id(sid)
+        if self._sessions[sid]["password"] != password:
+            raise FakeUptimeKumaError("Incorrect current password")
+        return self._sessions[sid]
+
+    def on_twoFAStatus(self, sid):
+        self._user_id(sid)
+        return {"ok": True, "status": bool(self._sessions[sid].get("twofa_status"))}
+
+    def on_prepare2FA(self, sid, password):
+        user = self._check_password(sid, password)
+        if user.get("twofa_status"):
+            raise FakeUptimeKumaError("Already enabled.")
+        user["twofa_secret"] = base64.b32encode(os.urandom(20)).decode()
+        uri = "otpauth://totp/Uptime%20Kuma:{0}?secret={1}".format(user["username"], user["twofa_secret"])
+        return {"ok": True, "uri": uri}
+
+    def on_verifyToken(self, sid, token, password):
+        user = self._check_password(sid, password)
+        return {"ok": True, "valid": verify_totp(user.get("twofa_secret"), token)}
+
+    def on_save2FA(self, sid, password):
+        user = self._check_password(sid, password)
+        user["twofa_status"] = True
+        return {"ok": True, "msg": "2FA Enabled."}
+
+    def on_disable2FA(self, sid, password):
+        user = self._check_password(sid, password)
+        user["twofa_status"] = False
+        return {"ok": True, "msg": "2FA Disabled."}
+
+    # monitors
+
+    def _monitor_index(self):
+        # relations of all monitors, computed once per monitor list
+        tags = {}
+        for monitor_tag in self.monitor_tags.values():
+            tag = self.tags[monitor_tag["tag_id"]]
+            tags.setdefault(monitor_tag["monitor_id"], []).append(dict(monitor_tag, name=tag["name"], color=tag["color"]))
+        children = {}
+        for monitor_id, monitor in self.monitors.items():
+            children.setdefault(monitor["parent"], []).append(monitor_id)
+        maintenance = set()
+        for maintenance_id, monitor_ids in self.maintenance_monitors.items():
+            if self._maintenance_status(maintenance_id) == "under-maintenance":
+                maintenance.update(monitor_ids)
+        return tags, children, maintenance
+
+    def _monitor_list_json(self):
+        index = self._monitor_index()
+        return dict((str(i), self._monitor_json(i, index)) for i in self.monitors)
+
+    def _monitor_json(self, monitor_id, index=None):
+        tags, children, maintenance = index or self._monitor_index()
+        monitor = dict(self.monitors[monitor_id])
+        path = [monitor["name"]]
+        parent = monitor["parent"]
+        while parent in self.monitors:
+            path.insert(0, self.monitors[parent]["name"])
+            parent = self.monitors[parent]["parent"]
+        monitor.update({
+            "id": monitor_id,
+            "tags": tags.get(monitor_id, []),
+            "pathName": " / ".join(path),
+            "childrenIDs": self._children_ids(monitor_id, children),
+            "maintenance": monitor_id in maintenance,
+            "forceInactive": False,
+            "includeSensitiveData": True
+        })
+        return monitor
+
+    def _children_ids(self, monitor_id, children=None):
+        if children is None:
+            children = self._monitor_index()[1]
+        children_ids = list(children.get(monitor_id, []))
+        for child in list(children_ids):
+            children_ids.extend(self._children_ids(child, children))
+        return children_ids
+
+    def _monitor_data(self, data):
+        monitor = dict((k, v) for k, v in data.items() if k not in COMPUTED_MONITOR_KEYS)
+        if not monitor.get("name"):
+            raise FakeUptimeKumaError("Name is required")
+        interval = monitor.get("interval", MONITOR_DEFAULTS["interval"])
+        if interval is not None and interval < 20:
+            raise FakeUptimeKumaError("Interval cannot be less than 20 seconds")
+        notification_ids = monitor.get("notificationIDList") or {}
+        monitor["notificationIDList"] = dict((str(k), True) for k, v in notification_ids.items() if v)
+        return monitor
+
+    def _add_monitor(self, data):
+        monitor = dict(MONITOR_DEFAULTS)
+        monitor.update(self._monitor_data(data))
+        monitor_id = self._next_id("monitor")
+        self.monitors[monitor_id] = monitor
+        return monitor_id
+
+    def _get_monitor(self, monitor_id):
+        if monitor_id not in self.monitors:
+            raise FakeUptimeKumaError("Cannot read properties of null (reading 'toJSON')")
+        return self.monitors[monitor_id]
+
+    def on_add(self, sid, data):
+        self._user_id(sid)
+        with self._lock:
+            if data.get("parent") is not None and data["parent"] not in self.monitors:
+                raise FakeUptimeKumaError("FOREIGN KEY constraint failed")
+            monitor_id = self._add_monitor(data)
+        self._send_monitor_list(sid)
+        return {"ok": True, "msg": "Added Successfully.", "monitorID": monitor_id}
+
+    def on_editMonitor(self, sid, data):
+        self._user_id(sid)
+        with self._lock:
+            monitor_id = data.get("id")
+            monitor = self._get_monitor(monitor_id)
+            parent = data.get("parent")
+            if parent is not None and (parent == monitor_id or parent in self._children_ids(monitor_id)):
+                raise FakeUptimeKumaError("Invalid Monitor Group")
+            monitor.update(self._monitor_data(data))
+        self._send_monitor_list(sid)
+        return {"ok": True, "msg": "Saved.", "monitorID": monitor_id}
+
+    def on_getMonitor(self, sid, monitor_id):
+        self._user_id(sid)
+        with self._lock:
+            self._get_monitor(monitor_id)
+            return {"ok": True, "monitor": self._monitor_json(monitor_id)}
+
+    def on_getMonitorBeats(self, sid, monitor_id, period):
+        self._user_id(sid)
+        start = format_datetime(now() - datetime.timedelta(hours=period), milliseconds=True)
+        with self._lock:
+            data = [dict(i) for i in self.heartbeats.get(monitor_id, []) if i["time"] > start]
+        return {"ok": True, "data": data}
+
+    def _set_monitor_active(self, sid, monitor_id, active):
+        self._user_id(sid)
+        with self._lock:
+            self._get_monitor(monitor_id)["active"] = active
+        self._send_monitor_list(sid)
+
+    def on_pauseMonitor(self, sid, monitor_id):
+        self._set_monitor_active(sid, monitor_id, False)
+        return {"ok": True, "msg": "Paused Successfully."}
+
+    def on_resumeMonitor(self, sid, monitor_id):
+        self._set_monitor_active(sid, monitor_id, True)
+        return {"ok": True, "msg": "Resumed Successfully."}
+
+    def on_deleteMonitor(self, sid, monitor_id):
+        self._user_id(sid)
+        with self._lock:
+            if monitor_id in self.monitors:
+                self._free(self.monitors.pop(monitor_id))
+                for monitor in self.monitors.values():
+                    if monitor["parent"] == monitor_id:
+                        monitor["parent"] = None
+                for monitor_tag_id in [i for i, j in self.monitor_tags.items() if j["monitor_id"] == monitor_id]:
+                    del self.monitor_tags[monitor_tag_id]
+                self._free(self.heartbeats.pop(monitor_id, []))
+                for monitor_ids in self.maintenance_monitors.values():
+                    if monitor_id in monitor_ids:
+                        monitor_ids.remove(monitor_id)
+                for groups in self.status_page_groups.values():
+                    for group in groups:
+                        group["monitorList"] = [i for i in group["monitorList"] if i["id"] != monitor_id]
+        self._send_monitor_list(sid)
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    # monitor tags
+
+    def _add_monitor_tag(self, tag_id, monitor_id, value):
+        monitor_tag_id = self._next_id("monitor_tag")
+        self.monitor_tags[monitor_tag_id] = {
+            "id": monitor_tag_id,
+            "monitor_id": monitor_id,
+            "tag_id": tag_id,
+            "value": value
+        }
+
+    def on_addMonitorTag(self, sid, tag_id, monitor_id, value):
+        self._user_id(sid)
+        with self._lock:
+            self._get_monitor(monitor_id)
+            if tag_id not in self.tags:
+                raise FakeUptimeKumaError("FOREIGN KEY constraint failed")
+            self._add_monitor_tag(tag_id, monitor_id, value)
+        return {"ok": True, "msg": "Added Successfully."}
+
+    def on_deleteMonitorTag(self, sid, tag_id, monitor_id, value):
+        self._user_id(sid)
+        with self._lock:
+            for monitor_tag_id, monitor_tag in list(self.monitor_tags.items()):
+                if (monitor_tag["tag_id"], monitor_tag["monitor_id"], monitor_tag["value"]) == (tag_id, monitor_id, value):
+                    del self.monitor_tags[monitor_tag_id]
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    # heartbeats and statistics
+
+    def on_clearEvents(self, sid, monitor_id):
+        self._user_id(sid)
+        with self._lock:
+            for heartbeat in self.heartbeats.get(monitor_id, []):
+                heartbeat["msg"] = ""
+                heartbeat["important"] = 0
+        return {"ok": True}
+
+    def on_clearHeartbeats(self, sid, monitor_id):
+        self._user_id(sid)
+        with self._lock:
+            self._free(self.heartbeats.pop(monitor_id, []))
+        return {"ok": True}
+
+    def on_clearStatistics(self, sid):
+        self._user_id(sid)
+        with self._lock:
+            self._free(self.heartbeats)
+            self.heartbeats = {}
+        return {"ok": True}
+
+    # tags
+
+    def _add_tag(self, name, color):
+        tag_id = self._next_id("tag")
+        self.tags[tag_id] = {
+            "id": tag_id,
+            "name": name,
+            "color": color,
+            "created_date": format_datetime(now())
+        }
+        return tag_id
+
+    def on_getTags(self, sid):
+        self._user_id(sid)
+        with self._lock:
+            return {"ok": True, "tags": [dict(i) for i in self.tags.values()]}
+
+    def on_addTag(self, sid, data):
+        self._user_id(sid)
+        with self._lock:
+            tag_id = self._add_tag(data["name"], data["color"])
+            tag = self.tags[tag_id]
+        return {"ok": True, "tag": {"id": tag_id, "name": tag["name"], "color": tag["color"]}}
+
+    def on_editTag(self, sid, data):
+        self._user_id(sid)
+        with self._lock:
+            tag = self.tags.get(data.get("id"))
+            if not tag:
+                raise FakeUptimeKumaError("Tag not found")
+            tag.update(name=data["name"], color=data["color"])
+            tag = dict(tag)
+        self._send_monitor_list(sid)
+        return {"ok": True, "msg": "Saved", "tag": tag}
+
+    def on_deleteTag(self, sid, tag_id):
+        self._user_id(sid)
+        with self._lock:
+            self.tags.pop(tag_id, None)
+            for monitor_tag_id in [i for i, j in self.monitor_tags.items() if j["tag_id"] == tag_id]:
+                del self.monitor_tags[monitor_tag_id]
+        self._send_monitor_list(sid)
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    # notifications
+
+    def _add_notification(self, data, notification_id=None):
+        if notification_id is None:
+            notification_id = self._next_id("notification")
+        elif notification_id not in self.notifications:
+            raise FakeUptimeKumaError("notification not found")
+        self.notifications[notification_id] = {
+            "id": notification_id,
+            "name": data["name"],
+            "active": True,
+            "userId": 1,
+            "isDefault": bool(data.get("isDefault")),
+            "config": json.dumps(data)
+        }
+        if data.get("applyExisting"):
+            for monitor in self.monitors.values():
+                monitor["notificationIDList"][str(notification_id)] = True
+        return notification_id
+
+    def on_addNotification(self, sid, data, notification_id):
+        self._user_id(sid)
+        with self._lock:
+            notification_id = self._add_notification(data, notification_id)
+        self._send_notification_list(sid)
+        return {"ok": True, "msg": "Saved", "id": notification_id}
+
+    def on_deleteNotification(self, sid, notification_id):
+        self._user_id(sid)
+        with self._lock:
+            self.notifications.pop(notification_id, None)
+            for monitor in self.monitors.values():
+                monitor["notificationIDList"].pop(str(notification_id), None)
+        self._send_notification_list(sid)
+        return {"ok": True, "msg": "Deleted"}
+
+    def on_testNotification(self, sid, data):
+        self._user_id(sid)
+        return {"ok": True, "msg": "Sent Successfully."}
+
+    def on_checkApprise(self, sid):
+        self._user_id(sid)
+        return False
+
+    # proxies
+
+    def _save_proxy(self, data, proxy_id):
+        if proxy_id is not None and proxy_id not in self.proxies:
+            raise FakeUptimeKumaError("proxy not found")
+        if data["protocol"] not in PROXY_PROTOCOLS:
+            raise FakeUptimeKumaError('Unsupported proxy protocol "{0}. Supported protocols are {1}."'.format(
+                data["protocol"], ", ".join(PROXY_PROTOCOLS)))
+        if data.get("default"):
+            for proxy in self.proxies.values():
+                proxy["default"] = 0
+        if proxy_id is None:
+            proxy_id = self._next_id("proxy")
+            created_date = format_datetime(now())
+        else:
+            created_date = self.proxies[proxy_id]["created_date"]
+        self.proxies[proxy_id] = {
+            "id": proxy_id,
+            "user_id": 1,
+            "protocol": data["protocol"],
+            "host": data["host"],
+            "port": int(data["port"]),
+            "auth": 1 if data.get("auth") else 0,
+            "username": data.get("username"),
+            "password": data.get("password"),
+            # uptime kuma always activates the proxy (proxy.active || true)
+            "active": 1,
+            "default": 1 if data.get("default") else 0,
+            "created_date": created_date
+        }
+        if data.get("applyExisting"):
+            for monitor in self.monitors.values():
+                monitor["proxyId"] = proxy_id
+        return proxy_id
+
+    def on_addProxy(self, sid, data, proxy_id):
+        self._user_id(sid)
+        with self._lock:
+            proxy_id = self._save_proxy(data, proxy_id)
+        self._send_proxy_list(sid)
+        if data.get("applyExisting"):
+            self._send_monitor_list(sid)
+        return {"ok": True, "msg": "Saved", "id": proxy_id}
+
+    def on_deleteProxy(self, sid, proxy_id):
+        self._user_id(sid)
+        with self._lock:
+            if proxy_id not in self.proxies:
+                raise FakeUptimeKumaError("proxy not found")
+            del self.proxies[proxy_id]
+            for monitor in self.monitors.values():
+                if monitor["proxyId"] == proxy_id:
+                    monitor["proxyId"] = None
+        self._send_proxy_list(sid)
+        return {"ok": True, "msg": "Deleted"}
+
+    # docker hosts
+
+    def _save_docker_host(self, data, docker_host_id):
+        if docker_host_id is None:
+            docker_host_id = self._next_id("docker_host")
+        elif docker_host_id not in self.docker_hosts:
+            raise FakeUptimeKumaError("docker host not found")
+        self.docker_hosts[docker_host_id] = {
+            "id": docker_host_id,
+            "userID": 1,
+            "dockerDaemon": data["dockerDaemon"],
+            "dockerType": data["dockerType"],
+            "name": data["name"]
+        }
+        return docker_host_id
+
+    def on_addDockerHost(self, sid, data, docker_host_id):
+        self._user_id(sid)
+        with self._lock:
+            docker_host_id = self._save_docker_host(data, docker_host_id)
+        self._send_docker_host_list(sid)
+        return {"ok": True, "msg": "Saved", "id": docker_host_id}
+
+    def on_deleteDockerHost(self, sid, docker_host_id):
+        self._user_id(sid)
+        with self._lock:
+            if docker_host_id not in self.docker_hosts:
+                raise FakeUptimeKumaError("docker host not found")
+            del self.docker_hosts[docker_host_id]
+            for monitor in self.monitors.values():
+                if monitor["docker_host"] == docker_host_id:
+                    monitor["docker_host"] = None
+        self._send_docker_host_list(sid)
+        return {"ok": True, "msg": "Deleted"}
+
+    def on_testDockerHost(self, sid, data):
+        self._user_id(sid)
+        daemon = data.get("dockerDaemon")
+        # only a local docker socket can be reached by the fake server
+        if data.get("dockerType") == "socket" and daemon and os.path.exists(daemon):
+            return {"ok": True, "msg": "Connected Successfully, but there are no containers?"}
+        if data.get("dockerType") == "socket":
+            raise FakeUptimeKumaError("connect ENOENT {0}".format(daemon))
+        raise FakeUptimeKumaError("connect ECONNREFUSED {0}".format(daemon))
+
+    # status pages
+
+    def _status_page_json(self, status_page_id):
+        status_page = dict(self.status_pages[status_page_id])
+        if not status_page["icon"]:
+            status_page["icon"] = "/icon.svg"
+        return status_page
+
+    def _get_status_page_id(self, slug):
+        for status_page_id, status_page in self.status_pages.items():
+            if status_page["slug"] == slug:
+                return status_page_id
+        raise FakeUptimeKumaError("No slug?")
+
+    def _add_status_page(self, title, slug):
+        title = (title or "").strip()
+        slug = str(slug or "").strip().lower()
+        if not title or not slug:
+            raise FakeUptimeKumaError("Please input all fields")
+        check_slug(slug)
+        if any(i["slug"] == slug for i in self.status_pages.values()):
+            raise FakeUptimeKumaError("UNIQUE constraint failed: status_page.slug")
+        status_page_id = self._next_id("status_page")
+        self.status_pages[status_page_id] = {
+            "id": status_page_id,
+            "slug": slug,
+            "title": title,
+            "description": None,
+            "icon": "",
+            "theme": "auto",
+            "published": True,
+            "showTags": False,
+            "domainNameList": [],
+            "customCSS": "body {\n  \n}\n",
+            "footerText": None,
+            "showPoweredBy": True,
+            "googleAnalyticsId": None,
+            "showCertificateExpiry": False
+        }
+        self.status_page_groups[status_page_id] = []
+        self.incidents[status_page_id] = []
+
+    def on_addStatusPage(self, sid, title, slug):
+        self._user_id(sid)
+        with self._lock:
+            self._add_status_page(title, slug)
+        self._send_status_page_list(sid)
+        return {"ok": True, "msg": "OK!"}
+
+    def on_getStatusPage(self, sid, slug):
+        self._user_id(sid)
+        with self._lock:
+            return {"ok": True, "config": self._status_page_json(self._get_status_page_id(slug))}
+
+    def on_saveStatusPage(self, sid, slug, config, img_data_url, public_group_list):
+        self._user_id(sid)
+        with self._lock:
+            status_page_id = self._get_status_page_id(slug)
+            check_slug(config["slug"])
+            status_page = self.status_pages[status_page_id]
+            status_page.update({
+                "slug": config["slug"],
+                "title": config["title"],
+                "description": config.get("description"),
+                # uptime kuma reads the icon from config.logo, which is only set for uploaded images
+                "icon": "/upload/logo{0}.png".format(status_page_id) if (img_data_url or "").startswith("data:") else None,
+                "theme": config.get("theme"),
+                "showTags": bool(config.get("showTags")),
+                "footerText": config.get("footerText"),
+                "customCSS": config.get("customCSS"),
+                "showPoweredBy": bool(config.get("showPoweredBy")),
+                "showCertificateExpiry": bool(config.get("showCertificateExpiry")),
+                "googleAnalyticsId": config.get("googleAnalyticsId"),
+                "domainNameList": list(config.get("domainNameList") or [])
+            })
+            groups = []
+            for weight, group in enumerate(public_group_list, 1):
+                group_id = group.get("id") or self._next_id("group")
+                monitor_list = []
+                for monitor in group.get("monitorList", []):
+                    if monitor["id"] not in self.monitors:
+                        raise FakeUptimeKumaError("FOREIGN KEY constraint failed")
+                    monitor_list.append({
+                        "id": monitor["id"],
+                        "sendUrl": 1 if monitor.get("sendUrl") else 0
+                    })
+                groups.append({
+                    "id": group_id,
+                    "name": group["name"],
+                    "weight": weight,
+                    "monitorList": monitor_list
+                })
+                group["id"] = group_id
+            self.status_page_groups[status_page_id] = groups
+        return {"ok": True, "publicGroupList": public_group_list}
+
+    def on_deleteStatusPage(self, sid, slug):
+        self._user_id(sid)
+        with self._lock:
+            status_page_id = self._get_status_page_id(slug)
+            del self.status_pages[status_page_id]
+            del self.status_page_groups[status_page_id]
+            del self.incidents[status_page_id]
+            for status_page_ids in self.maintenance_status_pages.values():
+                if status_page_id in status_page_ids:
+                    status_page_ids.remove(status_page_id)
+        return {"ok": True}
+
+    def on_postIncident(self, sid, slug, incident):
+        self._user_id(sid)
+        with self._lock:
+            incidents = self.incidents[self._get_status_page_id(slug)]
+            for i in incidents:
+                i["pin"] = False
+            date = format_datetime(now())
+            data = {
+                "id": self._next_id("incident"),
+                "style": incident.get("style", "primary"),
+                "title": incident["title"],
+                "content": incident["content"],
+                "pin": True,
+                "createdDate": date,
+                "lastUpdatedDate": None
+            }
+            incidents.append(data)
+            return {"ok": True, "incident": dict(data)}
+
+    def on_unpinIncident(self, sid, slug):
+        self._user_id(sid)
+        with self._lock:
+            for incident in self.incidents[self._get_status_page_id(slug)]:
+                incident["pin"] = False
+        return {"ok": True}
+
+    def _public_status_page(self, slug):
+        with self._lock:
+            status_page_id = self._get_status_page_id(slug)
+            config = self._status_page_json(status_page_id)
+            show_tags = config["showTags"]
+            incident = [dict(i) for i in self.incidents[status_page_id] if i["pin"]]
+            index = self._monitor_index()
+            groups = []
+            for group in self.status_page_groups[status_page_id]:
+                monitor_list = []
+                for monitor in group["monitorList"]:
+                    monitor_json = self._monitor_json(monitor["id"], index)
+                    public_monitor = {
+                        "id": monitor["id"],
+                        "name": monitor_json["name"],
+                        "sendUrl": monitor["sendUrl"],
+                        "type": monitor_json["type"]
+                    }
+                    if show_tags:
+                        public_monitor["tags"] = monitor_json["tags"]
+                    monitor_list.append(public_monitor)
+                groups.append(dict(group, monitorList=monitor_list))
+            maintenance_list = [
+                self._maintenance_json(i) for i, status_page_ids in self.maintenance_status_pages.items()
+                if status_page_id in status_page_ids and self._maintenance_status(i) == "under-maintenance"
+            ]
+        return {
+            "config": config,
+            "incident": incident[-1] if incident else None,
+            "publicGroupList": groups,
+            "maintenanceList": maintenance_list
+        }
+
+    # maintenances
+
+    def _maintenance_status(self, maintenance_id):
+        maintenance = self.maintenances[maintenance_id]
+        if not maintenance["active"]:
+            return "inactive"
+        if maintenance["strategy"] == "manual":
+            return "under-maintenance"
+        if maintenance["strategy"] == "single":
+            date_range = maintenance.get("dateRange") or []
+            current = format_datetime(now())
+            if len(date_range) > 1 and date_range[1] and date_range[1] < current:
+                return "ended"
+            if date_range and date_range[0] and date_range[0] > current:
+                return "scheduled"
+            return "under-maintenance"
+        return "scheduled"
+
+    def _maintenance_json(self, maintenance_id):
+        maintenance = dict(self.maintenances[maintenance_id])
+        maintenance.update({
+            "id": maintenance_id,
+            "status": self._maintenance_status(maintenance_id),
+            "timeslotList": []
+        })
+        return maintenance
+
+    def _get_maintenance(self, maintenance_id):
+        if maintenance_id not in self.maintenances:
+            raise FakeUptimeKumaError("Maintenance not found")
+        return self.maintenances[maintenance_id]
+
+    def _add_maintenance(self, data):
+        maintenance_id = self._next_id("maintenance")
+        self.maintenances[maintenance_id] = {}
+        self._update_maintenance(maintenance_id, data)
+        self.maintenance_monitors[maintenance_id] = []
+        self.maintenance_status_pages[maintenance_id] = []
+        return maintenance_id
+
+    def _update_maintenance(self, maintenance_id, data):
+        maintenance = dict((k, v) for k, v in data.items() if k not in ["id", "status", "timeslotList"])
+        maintenance.setdefault("description", "")
+        maintenance.setdefault("active", True)
+        maintenance["active"] = bool(maintenance["active"])
+        maintenance.update({
+            "duration": (maintenance.get("durationMinutes") or 0) * 60,
+            "timezone": maintenance.get("timezoneOption") or "UTC",
+            "timezoneOffset": "+00:00"
+        })
+        self.maintenances[maintenance_id].update(maintenance)
+
+    def on_getMaintenance(self, sid, maintenance_id):
+        self._user_id(sid)
+        with self._lock:
+            self._get_maintenance(maintenance_id)
+            return {"ok": True, "maintenance": self._maintenance_json(maintenance_id)}
+
+    def on_addMaintenance(self, sid, data):
+        self._user_id(sid)
+        with self._lock:
+            maintenance_id = self._add_maintenance(data)
+        self._send_maintenance_list(sid)
+        return {"ok": True, "msg": "Added Successfully.", "maintenanceID": maintenance_id}
+
+    def on_editMaintenance(self, sid, data):
+        self._user_id(sid)
+        with self._lock:
+            maintenance_id = data.get("id")
+            self._get_maintenance(maintenance_id)
+            self._update_maintenance(maintenance_id, data)
+        self._send_maintenance_list(sid)
+        return {"ok": True, "msg": "Saved.", "maintenanceID": maintenance_id}
+
+    def on_deleteMaintenance(self, sid, maintenance_id):
+        self._user_id(sid)
+        with self._lock:
+            if maintenance_id in self.maintenances:
+                del self.maintenances[maintenance_id]
+                del self.maintenance_monitors[maintenance_id]
+                del self.maintenance_status_pages[maintenance_id]
+        self._send_maintenance_list(sid)
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    def _set_maintenance_active(self, sid, maintenance_id, active):
+        self._user_id(sid)
+        with self._lock:
+            self._get_maintenance(maintenance_id)["active"] = active
+        self._send_maintenance_list(sid)
+
+    def on_pauseMaintenance(self, sid, maintenance_id):
+        self._set_maintenance_active(sid, maintenance_id, False)
+        return {"ok": True, "msg": "Paused Successfully."}
+
+    def on_resumeMaintenance(self, sid, maintenance_id):
+        self._set_maintenance_active(sid, maintenance_id, True)
+        return {"ok": True, "msg": "Resume Successfully"}
+
+    def on_getMonitorMaintenance(self, sid, maintenance_id):
+        self._user_id(sid)
+        with self._lock:
+            self._get_maintenance(maintenance_id)
+            monitors = [{"id": i, "name": self.monitors[i]["name"]} for i in self.maintenance_monitors[maintenance_id]]
+        return {"ok": True, "monitors": monitors}
+
+    def on_addMonitorMaintenance(self, sid, maintenance_id, monitors):
+        self._user_id(sid)
+        with self._lock:
+            self._get_maintenance(maintenance_id)
+            for monitor in monitors:
+                self._get_monitor(monitor["id"])
+            self.maintenance_monitors[maintenance_id] = [i["id"] for i in monitors]
+        return {"ok": True, "msg": "Added Successfully."}
+
+    def on_getMaintenanceStatusPage(self, sid, maintenance_id):
+        self._user_id(sid)
+        with self._lock:
+            self._get_maintenance(maintenance_id)
+            status_pages = [{"id": i, "title": self.status_pages[i]["title"]}
+                            for i in self.maintenance_status_pages[maintenance_id]]
+        return {"ok": True, "statusPages": status_pages}
+
+    def on_addMaintenanceStatusPage(self, sid, maintenance_id, status_pages):
+        self._user_id(sid)
+        with self._lock:
+            self._get_maintenance(maintenance_id)
+            for status_page in status_pages:
+                if status_page["id"] not in self.status_pages:
+                    raise FakeUptimeKumaError("FOREIGN KEY constraint failed")
+            self.maintenance_status_pages[maintenance_id] = [i["id"] for i in status_pages]
+        return {"ok": True, "msg": "Added Successfully."}
+
+    # api keys
+
+    def _api_key_json(self, api_key_id):
+        api_key = dict(self.api_keys[api_key_id])
+        api_key.pop("key")
+        if not api_key["active"]:
+            api_key["status"] = "inactive"
+        elif api_key["expires"] and api_key["expires"] < format_datetime(now()):
+            api_key["status"] = "expired"
+        else:
+            api_key["status"] = "active"
+        return api_key
+
+    def _add_api_key(self, data):
+        api_key_id = self._next_id("api_key")
+        key = secrets.token_urlsafe(24)
+        self.api_keys[api_key_id] = {
+            "id": api_key_id,
+            "name": data["name"],
+            "userID": 1,
+            "createdDate": format_datetime(now()),
+            "active": 1 if data.get("active") else 0,
+            "expires": data.get("expires"),
+            "key": key
+        }
+        return api_key_id, "uk{0}_{1}".format(api_key_id, key)
+
+    def on_addAPIKey(self, sid, data):
+        self._user_id(sid)
+        with self._lock:
+            api_key_id, key = self._add_api_key(data)
+        self._send_api_key_list(sid)
+        return {"ok": True, "msg": "Added Successfully.", "key": key, "keyID": api_key_id}
+
+    def _set_api_key_active(self, sid, api_key_id, active):
+        self._user_id(sid)
+        with self._lock:
+            if api_key_id not in self.api_keys:
+                raise FakeUptimeKumaError("API key not found")
+            self.api_keys[api_key_id]["active"] = active
+        self._send_api_key_list(sid)
+
+    def on_enableAPIKey(self, sid, api_key_id):
+        self._set_api_key_active(sid, api_key_id, 1)
+        return {"ok": True, "msg": "Enabled Successfully"}
+
+    def on_disableAPIKey(self, sid, api_key_id):
+        self._set_api_key_active(sid, api_key_id, 0)
+        return {"ok": True, "msg": "Disabled Successfully"}
+
+    def on_deleteAPIKey(self, sid, api_key_id):
+        self._user_id(sid)
+        with self._lock:
+            self.api_keys.pop(api_key_id, None)
+        self._send_api_key_list(sid)
+        return {"ok": True, "msg": "Deleted Successfully."}
+
+    # settings
+
+    def on_getSettings(self, sid):
+        self._user_id(sid)
+        with self._lock:
+            return {"ok": True, "data": dict(self.settings)}
+
+    def on_setSettings(self, sid, data, password):
+        self._user_id(sid)
+        with self._lock:
+            # the password is only required to disable the authentication
+            if not self.settings["disableAuth"] and data.get("disableAuth"):
+                self._check_password(sid, password)
+            self.settings.update(data)
+        self.emit("info", self._info(), room=self._room(sid))
+        return {"ok": True, "msg": "Saved"}
+
+    # database
+
+    def on_getDatabaseSize(self, sid):
+        self._user_id(sid)
+        return {"ok": True, "size": self.database_size()}
+
+    def on_shrinkDatabase(self, sid):
+        self._user_id(sid)
+        with self._lock:
+            self.freed_bytes = 0
+        return {"ok": True}
+
+    # misc
+
+    def on_getGameList(self, sid):
+        self._user_id(sid)
+        return {"ok": True, "gameList": GAME_LIST}
+
+    # http
+
+    def _http_app(self, environ, start_response):
+        path = environ.get("PATH_INFO", "")
+        match = re.match(r"^/api/status-page/([^/]+)$", path)
+        if match:
+            self.calls["GET /api/status-page"] += 1
+            if self.latency:
+                time.sleep(self.latency)
+            try:
+                status, body = "200 OK", self._public_status_page(match.group(1))
+            except FakeUptimeKumaError:
+                status, body = "404 Not Found", {"ok": False, "msg": "Not Found"}
+        elif path == "/":
+            status, body = "200 OK", {"ok": True}
+        else:
+            status, body = "404 Not Found", {"ok": False, "msg": "Not Found"}
+        data = json.dumps(body).encode()
+        start_response(status, [("Content-Type", "application/json"), ("Content-Length", str(len(data)))])
+        return [data]
@@ -0,0 +1,98 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.lucasheld.uptime_kuma.plugins.action.uptime_kuma import ActionModule, no_log_values
+from ansible_collections.lucasheld.uptime_kuma.plugins.modules import proxies
+from tests.unit.plugins.module_utils.module_test_case import ModuleTestCase
+
+
+class TestActionModule(ModuleTestCase):
+    def setUp(self):
+        super(TestActionModule, self).setUp()
+
+        self.args = {
+            "api_url": self.url,
+            "api_timeout": 10,
+            "api_wait_events": 0.01,
+            "api_username": self.username,
+            "api_password": self.password
+        }
+
+    def run_action(self, action, args, transport="local", become=False, environment=None, task_vars=None):
+        task = MagicMock(action=action, args=args, check_mode=False, async_val=0, environment=environment or [])
+        connection = MagicMock(transport=transport)
+        play_context = MagicMock(become=become)
+        templar = MagicMock(template=lambda value: value)
+        action_module = ActionModule(task, connection, play_context, None, templar, None)
+        with patch.object(ActionModule, "_execute_module", return_value={"executed": True}) as execute_module:
+            result = action_module.run(task_vars=task_vars or {})
+        return result, execute_module
+
+    def test_local(self):
+        monitor_id = self.add_monitor()
+        result, execute_module = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args)
+        execute_module.assert_not_called()
+        self.assertFalse(result.get("failed"))
+        self.assertEqual([i["id"] for i in result["monitors"]], [monitor_id])
+
+    def test_remote(self):
+        result, execute_module = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args, "ssh")
+        execute_module.assert_called_once()
+        self.assertTrue(result["executed"])
+
+    def test_remote_become(self):
+        result, execute_module = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args, become=True)
+        execute_module.assert_called_once()
+        self.assertTrue(result["executed"])
+
+    def test_remote_environment(self):
+        environment = [{"HTTPS_PROXY": "http://127.0.0.1:3128"}]
+        result, execute_module = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args, environment=environment)
+        execute_module.assert_called_once()
+        self.assertTrue(result["executed"])
+
+    def test_interpreter(self):
+        # another interpreter than the controller executes the module
+        task_vars = {"ansible_python_interpreter": "/opt/venv/bin/python"}
+        result, execute_module = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args, task_vars=task_vars)
+        execute_module.assert_called_once()
+        self.assertTrue(result["executed"])
+
+        # the interpreter of the controller runs the module in the controller process
+        task_vars = {"ansible_python_interpreter": sys.executable}
+        result, execute_module = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args, task_vars=task_vars)
+        execute_module.assert_not_called()
+        self.assertFalse(result.get("failed"))
+
+    def test_warnings(self):
+        # warnings and deprecations of the validation are passed to the result
+        action_module = "ansible_collections.lucasheld.uptime_kuma.plugins.action.uptime_kuma"
+        deprecation = {"msg": "deprecation 1", "version": "2.0.0", "date": None, "collection_name": "lucasheld.uptime_kuma"}
+        with patch(action_module + ".get_warning_messages", side_effect=[("warning 0",), ("warning 0", "warning 1")]), \
+                patch(action_module + ".get_deprecation_messages", side_effect=[(), (deprecation,)]):
+            result, _ = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args)
+        self.assertFalse(result.get("failed"))
+        self.assertEqual(result["warnings"], ["warning 1"])
+        self.assertEqual(result["deprecations"], [deprecation])
+
+    def test_unsupported_parameter(self):
+        result, execute_module = self.run_action("lucasheld.uptime_kuma.monitor_info", {**self.args, "unknown": 1})
+        execute_module.assert_not_called()
+        self.assertTrue(result["failed"])
+        self.assertIn("Unsupported parameters for (lucasheld.uptime_kuma.monitor_info) module", result["msg"])
+
+    def test_no_log_values(self):
+        # the password is removed from the result
+        self.api.add_monitor(type="http", name="monitor 1", url="http://127.0.0.1", description=self.password)
+        result, _ = self.run_action("lucasheld.uptime_kuma.monitor_info", self.args)
+        self.assertNotEqual(result["monitors"][0]["description"], self.password)
+
+        # also the no_log values of suboptions
+        params = {
+            "api_password": "password 1",
+            "proxies": [
+                {"host": "127.0.0.1", "password": "password 2"},
+                {"host": "127.0.0.2", "password": None}
+            ]
+        }
+        self.assertEqual(no_log_values(proxies.get_module_args(), params), {"password 1", "password 2"})
@@ -4,6 +4,18 @@ import unittest
 import tempfile
 from uptime_kuma_api import UptimeKumaApi, MonitorType, DockerType, UptimeKumaException, MaintenanceStrategy
 
+from plugins.module_utils.common import run_concurrently
+from tests.fake_server import FakeUptimeKumaServer
+
+
+def delete(deletion):
+    func, id_ = deletion
+    try:
+        func(id_)
+    except UptimeKumaException:
+        # already deleted, e.g. together with its group monitor
+        pass
+
 
 class ModuleTestCase(unittest.TestCase):
     api = None
@@ -11,9 +23,30 @@ class ModuleTestCase(unittest.TestCase):
     username = "admin"
     password = "secret123"
 
+    # set UPTIME_KUMA_FAKE_SERVER=1 to run the tests against the in-memory fake server
+    # instead of a real uptime kuma instance, UPTIME_KUMA_FAKE_SERVER_LATENCY delays every call
+    fake_server = None
+
+    delete_concurrency = 10
+
+    @classmethod
+    def setUpClass(cls):
+        if os.environ.get("UPTIME_KUMA_FAKE_SERVER") and not ModuleTestCase.fake_server:
+            latency = float(os.environ.get("UPTIME_KUMA_FAKE_SERVER_LATENCY", 0))
+            ModuleTestCase.fake_server = FakeUptimeKumaServer(latency=latency).start()
+            ModuleTestCase.url = ModuleTestCase.fake_server.url
+
     def setUp(self):
-        self.api = UptimeKumaApi(self.url, timeout=1, wait_events=0.01)
+        if self.fake_server:
+            self.fake_server.reset()
 
+        self.api = UptimeKumaApi(self.url)
+        self.login()
+
+        if not self.fake_server:
+            self.delete_all()
+
+    def login(self):
         filepath = os.path.join(tempfile.gettempdir(), "uptime-kuma-token")
         token = None
         if os.path.isfile(filepath):
@@ -33,40 +66,32 @@ class ModuleTestCase(unittest.TestCase):
             with open(filepath, "w") as f:
                 f.write(token)
 
-        # delete monitors
-        monitors = self.api.get_monitors()
-        for monitor in monitors:
-            self.api.delete_monitor(monitor["id"])
-
-        # delete notifications
-        notifications = self.api.get_notifications()
-        for notification in notifications:
-            self.api.delete_notification(notification["id"])
-
-        # delete proxies
-        proxies = self.api.get_proxies()
-        for proxy in proxies:
-            self.api.delete_proxy(proxy["id"])
-
-        # delete tags
-        tags = self.api.get_tags()
-        for tag in tags:
-            self.api.delete_tag(tag["id"])
-
-        # delete status pages
-        status_pages = self.api.get_status_pages()
-        for status_page in status_pages:
-            self.api.delete_status_page(status_page["slug"])
-
-        # delete docker hosts
-        docker_hosts = self.api.get_docker_hosts()
-        for docker_host in docker_hosts:
-            self.api.delete_docker_host(docker_host["id"])
-
-        # login again to receive initial messages
-        self.api.disconnect()
-        self.api = UptimeKumaApi(self.url)
-        self.api.login_by_token(token)
+    def delete_all(self):
+        # the lists are only read once, a short wait for further messages is enough
+        wait_events = self.api.wait_events
+        self.api.wait_events = 0.01
+
+        deletions = []
+        deletions.extend((self.api.delete_monitor, i["id"]) for i in self.api.get_monitors())
+        deletions.extend((self.api.delete_notification, i["id"]) for i in self.api.get_notifications())
+        deletions.extend((self.api.delete_proxy, i["id"]) for i in self.api.get_proxies())
+        deletions.extend((self.api.delete_tag, i["id"]) for i in self.api.get_tags())
+        deletions.extend((self.api.delete_status_page, i["slug"]) for i in self.api.get_status_pages())
+        deletions.extend((self.api.delete_docker_host, i["id"]) for i in self.api.get_docker_hosts())
+        deletions.extend((self.api.delete_maintenance, i["id"]) for i in self.api.get_maintenances())
+        deletions.extend((self.api.delete_api_key, i["id"]) for i in self.api.get_api_keys())
+        run_concurrently(delete, deletions, self.delete_concurrency)
+
+        # the lists pushed by concurrent deletions can arrive out of order,
+        # login again to receive the current lists in that case
+        lists = [self.api.get_monitors, self.api.get_notifications, self.api.get_proxies, self.api.get_docker_hosts,
+                 self.api.get_maintenances, self.api.get_api_keys]
+        if deletions and any(i() for i in lists):
+            self.api.disconnect()
+            self.api = UptimeKumaApi(self.url)
+            self.login()
+        else:
+            self.api.wait_events = wait_events
 
     def tearDown(self):
         self.api.disconnect()
@@ -0,0 +1,118 @@
+import plugins.modules.api_keys as module
+from plugins.module_utils.common import get_api_key_by_name
+from .module_test_case import ModuleTestCase
+
+
+class TestApiKeys(ModuleTestCase):
+    def setUp(self):
+        super(TestApiKeys, self).setUp()
+
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "api_keys": [],
+            "purge": False
+        }
+
+    def build_api_key_params(self, **kwargs):
+        api_key_params = {
+            "name": None,
+            "expires": None,
+            "active": True,
+            "state": "present"
+        }
+        api_key_params.update(kwargs)
+        return api_key_params
+
+    def test_api_keys(self):
+        # add api keys
+        self.params["api_keys"] = [
+            self.build_api_key_params(name="api key 1", expires="2023-03-30 12:20:00"),
+            self.build_api_key_params(name="api key 2")
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["name"] for i in result["created_keys"]], ["api key 1", "api key 2"])
+        for created_key in result["created_keys"]:
+            self.assertIsNotNone(created_key["key"])
+        api_key = get_api_key_by_name(self.api, "api key 1")
+        self.assertEqual(api_key["expires"], "2023-03-30 12:20:00")
+        self.assertTrue(api_key["active"])
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        self.assertEqual(result["created_keys"], [])
+
+        # disable api key
+        self.params["api_keys"][1]["state"] = "disabled"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["changed"] for i in result["api_keys"]], [False, True])
+        api_key = get_api_key_by_name(self.api, "api key 2")
+        self.assertFalse(api_key["active"])
+
+        # enable api key
+        self.params["api_keys"][1]["state"] = "enabled"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        api_key = get_api_key_by_name(self.api, "api key 2")
+        self.assertTrue(api_key["active"])
+
+        # delete api key
+        self.params["api_keys"][1]["state"] = "absent"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertIsNone(get_api_key_by_name(self.api, "api key 2"))
+
+    def test_api_keys_purge(self):
+        self.add_api_key("api key 1")
+        api_key_id = self.add_api_key("api key 2")
+
+        self.params.update({
+            "api_keys": [
+                self.build_api_key_params(name="api key 1")
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["id"] for i in result["purged"]], [api_key_id])
+        self.assertEqual([i["name"] for i in self.api.get_api_keys()], ["api key 1"])
+
+    def test_api_keys_purge_duplicates(self):
+        api_key_id_1 = self.add_api_key("api key 1")
+        api_key_id_2 = self.add_api_key("api key 1")
+        api_key_id_3 = self.add_api_key("api key 2")
+        api_key_id_4 = self.add_api_key("api key 2")
+
+        self.params.update({
+            "api_keys": [
+                self.build_api_key_params(name="api key 1")
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(sorted(i["id"] for i in result["purged"]), [api_key_id_2, api_key_id_3, api_key_id_4])
+        self.assertEqual([i["id"] for i in self.api.get_api_keys()], [api_key_id_1])
+
+    def test_api_keys_duplicates(self):
+        self.add_api_key("api key 1")
+        self.add_api_key("api key 1")
+
+        # all api keys with the name are disabled
+        self.params["api_keys"] = [
+            self.build_api_key_params(name="api key 1", state="disabled")
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["active"] for i in self.api.get_api_keys()], [False, False])
+
+        self.params["api_keys"] = [
+            self.build_api_key_params(name="api key 1", state="absent")
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(self.api.get_api_keys(), [])
@@ -0,0 +1,92 @@
+from uptime_kuma_api import MonitorType
+
+from .module_test_case import ModuleTestCase
+import plugins.modules.clear as module
+
+
+class TestClear(ModuleTestCase):
+    def setUp(self):
+        super(TestClear, self).setUp()
+
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "data": ["events", "heartbeats"],
+            "all": False,
+            "monitor_ids": None,
+            "monitor_names": None,
+            "tag_names": None,
+            "monitor_types": None,
+            "concurrency": 10
+        }
+        self.monitor_id_1 = self.add_monitor("monitor 1")
+        self.monitor_id_2 = self.add_monitor("monitor 2")
+        self.monitor_id_3 = self.api.add_monitor(type=MonitorType.GROUP, name="group 1")["monitorID"]
+        tag_id = self.add_tag()
+        self.api.add_monitor_tag(tag_id, self.monitor_id_2)
+
+    def test_all_monitors(self):
+        self.params["all"] = True
+        result = self.run_module(module, self.params)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["monitors"], 3)
+        self.assertEqual(result["cleared"], {"events": 3, "heartbeats": 3, "statistics": False})
+        self.assertEqual(self.api.get_monitor_beats(self.monitor_id_1, 24), [])
+
+    def test_selectors(self):
+        self.params.update({
+            "data": ["heartbeats"],
+            "monitor_names": ["monitor 1"],
+            "tag_names": ["tag 1"],
+            "monitor_types": ["group"]
+        })
+        result = self.run_module(module, self.params)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(sorted(result["monitor_ids"]), [self.monitor_id_1, self.monitor_id_2, self.monitor_id_3])
+        self.assertEqual(result["cleared"], {"events": 0, "heartbeats": 3, "statistics": False})
+
+        self.params.update({
+            "monitor_names": None,
+            "tag_names": None,
+            "monitor_types": None,
+            "monitor_ids": [self.monitor_id_2]
+        })
+        result = self.run_module(module, self.params)
+        self.assertEqual(result["monitor_ids"], [self.monitor_id_2])
+
+    def test_no_selector(self):
+        # no selector and empty selectors do not clear all monitors
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+        self.params["monitor_ids"] = []
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+
+        self.params.update({
+            "all": True,
+            "monitor_ids": [self.monitor_id_1]
+        })
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+
+    def test_unknown_monitor_name(self):
+        self.params["monitor_names"] = ["monitor 3"]
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+
+    def test_unknown_monitor_id(self):
+        self.params["monitor_ids"] = [self.monitor_id_3 + 1]
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+
+    def test_statistics(self):
+        self.params["data"] = ["statistics"]
+        result = self.run_module(module, self.params)
+
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["monitors"], 0)
+        self.assertEqual(result["cleared"], {"events": 0, "heartbeats": 0, "statistics": True})
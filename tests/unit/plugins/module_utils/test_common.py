@@ -1,7 +1,17 @@
-from uptime_kuma_api import UptimeKumaApi
+import os
+import pstats
+import tempfile
+import time
+
+from socketio.exceptions import TimeoutError as SocketIOTimeoutError
+
+from uptime_kuma_api import UptimeKumaApi, UptimeKumaException
 
 from .module_test_case import ModuleTestCase
 import plugins.modules.monitor_info as module_monitor_info
+import plugins.modules.tag as module_tag
+from plugins.module_utils.common import ApiTrace, Profile, RateLimiter, connect, get_tag_by_name, run_module
+from tests.fake_server import FakeUptimeKumaServer
 
 
 class TestCommon(ModuleTestCase):
@@ -34,3 +44,231 @@ class TestCommon(ModuleTestCase):
 
         # enable auth again
         self.api.set_settings(disableAuth=False)
+
+    def test_api_trace(self):
+        monitor_id = self.add_monitor()
+
+        trace = ApiTrace()
+        trace.wrap(self.api)
+
+        params = {
+            **self.params,
+            "id": None,
+            "name": "monitor 1"
+        }
+        result = self.run_module(module_monitor_info, params)
+        self.assertEqual(result["monitors"][0]["id"], monitor_id)
+
+        r = trace.result()
+        self.assertEqual(r["total"]["calls"], len(r["calls"]))
+        self.assertEqual(r["methods"]["get_monitors"]["calls"], 1)
+        self.assertGreater(r["methods"]["get_monitors"]["size"], 0)
+        self.assertFalse(r["calls"][0]["failed"])
+
+    def test_profile(self):
+        params = {
+            **self.params,
+            "id": None,
+            "name": None
+        }
+
+        profile = Profile(top=5)
+        with profile.phase("run"):
+            self.run_module(module_monitor_info, params)
+        r = profile.result()
+        self.assertEqual(set(r["phases"]), {"import", "run"})
+        self.assertEqual(len(r["functions"]), 5)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "module.prof")
+            profile = Profile(path)
+            with profile.phase("run"):
+                self.run_module(module_monitor_info, params)
+            r = profile.result()
+            self.assertEqual(r["path"], path)
+            self.assertNotIn("functions", r)
+            self.assertTrue(pstats.Stats(path).total_calls > 0)
+
+    def test_rate_limit(self):
+        RateLimiter(rate=20).wrap(self.api)
+        start = time.perf_counter()
+        for _ in range(5):
+            self.api.get_settings()
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+
+    def test_retries(self):
+        call = self.api._call
+        events = []
+
+        def call_with_timeout(event, data=None):
+            events.append(event)
+            if len(events) == 1:
+                raise SocketIOTimeoutError()
+            return call(event, data)
+
+        self.api._call = call_with_timeout
+        RateLimiter(retries=1).wrap(self.api)
+
+        # reads are sent again
+        self.api.get_settings()
+        self.assertEqual(events, ["getSettings", "getSettings"])
+
+        # writes are not sent again
+        events.clear()
+        with self.assertRaises(SocketIOTimeoutError):
+            self.api.add_tag(name="tag 1", color="#ffffff")
+        self.assertEqual(events, ["addTag"])
+
+    def test_connect_rate_limiter(self):
+        params = {
+            **self.params,
+            "api_url": self.url,
+            "api_timeout": 10,
+            "api_headers": None,
+            "api_ssl_verify": True,
+            "api_wait_events": 0.01,
+            "api_username": self.username,
+            "api_password": self.password
+        }
+
+        # the calls are only wrapped if one of the options is set
+        api = connect(params)
+        self.addCleanup(api.disconnect)
+        self.assertIsNone(api.connect_args[4])
+
+        api = connect({**params, "api_retries": 1})
+        self.addCleanup(api.disconnect)
+        self.assertEqual(api.connect_args[4].retries, 1)
+
+    def test_api_endpoints(self):
+        target = FakeUptimeKumaServer()
+        target.add_user(self.username, self.password)
+        target.start()
+        self.addCleanup(target.stop)
+
+        endpoint = {
+            "api_headers": None,
+            "api_username": self.username,
+            "api_password": self.password,
+            "api_token": None
+        }
+        params = {
+            "api_url": None,
+            "api_timeout": 1,
+            "api_headers": None,
+            "api_ssl_verify": True,
+            "api_wait_events": 0.01,
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "api_endpoints": [
+                {**endpoint, "api_url": self.url},
+                {**endpoint, "api_url": target.url}
+            ],
+            "api_endpoints_concurrency": 10,
+            "id": None,
+            "name": "tag 1",
+            "color": "#ffffff",
+            "state": "present"
+        }
+        result = {
+            "changed": False
+        }
+        run_module(module_tag.run, params, result)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["api_url"] for i in result["endpoints"]], [self.url, target.url])
+        self.assertTrue(all(i["changed"] for i in result["endpoints"]))
+        self.assertIsNotNone(get_tag_by_name(self.api, "tag 1"))
+
+        # a failed endpoint does not stop the others
+        params["api_endpoints"].append({**endpoint, "api_url": "http://127.0.0.1:1"})
+        params["color"] = "#000000"
+        result = {
+            "changed": False
+        }
+        with self.assertRaises(UptimeKumaException):
+            run_module(module_tag.run, params, result)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i.get("failed", False) for i in result["endpoints"]], [False, False, True])
+        self.assertEqual(get_tag_by_name(self.api, "tag 1")["color"], "#000000")
+
+    def test_api_endpoints_credentials(self):
+        endpoint = {
+            "api_url": self.url,
+            "api_headers": None,
+            "api_username": self.username,
+            "api_password": self.password,
+            "api_token": None
+        }
+        params = {
+            "api_url": None,
+            "api_timeout": 1,
+            "api_headers": None,
+            "api_ssl_verify": True,
+            "api_wait_events": 0.01,
+            "api_username": None,
+            "api_password": None,
+            "api_token": "invalid",
+            "api_endpoints": [endpoint],
+            "api_endpoints_concurrency": 10,
+            "id": None,
+            "name": None
+        }
+        result = {
+            "changed": False
+        }
+        # the password of the endpoint is used instead of the token of the module
+        run_module(module_monitor_info.run, params, result)
+        self.assertFalse(result["endpoints"][0].get("failed"))
+
+    def test_api_endpoints_output_options(self):
+        params = {
+            "api_url": None,
+            "api_endpoints": [{"api_url": self.url}, {"api_url": self.url}],
+            "path": "/tmp/heartbeats.jsonl"
+        }
+        with self.assertRaises(ValueError):
+            run_module(module_monitor_info.run, params, {"changed": False}, output_options=("path",))
+
+    def test_run_module_profile(self):
+        params = {
+            "api_url": self.url,
+            "api_timeout": 10,
+            "api_headers": None,
+            "api_ssl_verify": True,
+            "api_wait_events": 0.01,
+            "api_username": self.username,
+            "api_password": self.password,
+            "api_token": None,
+            "api_profile": True,
+            "api_profile_top": 5,
+            "id": None,
+            "name": None
+        }
+        result = {
+            "changed": False
+        }
+        run_module(module_monitor_info.run, params, result)
+        self.assertEqual(set(result["api_profile"]["phases"]), {"import", "connect", "login", "run", "disconnect"})
+        self.assertEqual(len(result["api_profile"]["functions"]), 5)
+
+        # the endpoints are profiled once
+        endpoint = {
+            "api_url": self.url,
+            "api_headers": None,
+            "api_username": self.username,
+            "api_password": self.password,
+            "api_token": None
+        }
+        params.update({
+            "api_endpoints": [endpoint, endpoint],
+            "api_endpoints_concurrency": 2
+        })
+        result = {
+            "changed": False
+        }
+        run_module(module_monitor_info.run, params, result)
+        self.assertEqual(set(result["api_profile"]["phases"]), {"import", "endpoints", "connect", "login", "run", "disconnect"})
+        self.assertEqual(len(result["api_profile"]["functions"]), 5)
+        self.assertTrue(all("api_profile" not in i for i in result["endpoints"]))
+        self.assertTrue(all(not i.get("failed") for i in result["endpoints"]))
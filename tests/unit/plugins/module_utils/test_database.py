@@ -0,0 +1,39 @@
+from .module_test_case import ModuleTestCase
+import plugins.modules.database as module
+
+
+class TestDatabase(ModuleTestCase):
+    def setUp(self):
+        super(TestDatabase, self).setUp()
+
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "shrink": False,
+            "threshold": None
+        }
+
+    def test_size(self):
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        self.assertFalse(result["shrunk"])
+        self.assertGreater(result["size"], 0)
+
+    def test_shrink(self):
+        self.params["shrink"] = True
+
+        # below the threshold
+        self.params["threshold"] = "1TB"
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        self.assertFalse(result["shrunk"])
+        self.assertNotIn("size_after", result)
+
+        # above the threshold
+        self.params["threshold"] = 1
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertTrue(result["shrunk"])
+        self.assertLessEqual(result["size_after"], result["size"])
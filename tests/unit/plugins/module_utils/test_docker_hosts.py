@@ -0,0 +1,183 @@
+import json
+import os
+import tempfile
+
+import plugins.modules.docker_hosts as module
+from plugins.module_utils.common import get_docker_host_by_name
+from plugins.module_utils.fingerprint import FingerprintState, fingerprint
+from .module_test_case import ModuleTestCase
+
+from uptime_kuma_api import DockerType, UptimeKumaException
+
+
+class TestDockerHosts(ModuleTestCase):
+    def setUp(self):
+        super(TestDockerHosts, self).setUp()
+
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "docker_hosts": [],
+            "purge": False,
+            "test_connection": False,
+            "concurrency": 10,
+            "fingerprint_file": None
+        }
+
+    def build_docker_host_params(self, **kwargs):
+        docker_host_params = {
+            "name": None,
+            "dockerType": None,
+            "dockerDaemon": None,
+            "state": "present"
+        }
+        docker_host_params.update(kwargs)
+        return docker_host_params
+
+    def test_docker_hosts(self):
+        # add docker hosts
+        self.params["docker_hosts"] = [
+            self.build_docker_host_params(name="docker host 1", dockerType=DockerType.SOCKET, dockerDaemon="/var/run/docker.sock"),
+            self.build_docker_host_params(name="docker host 2", dockerType=DockerType.TCP, dockerDaemon="tcp://localhost:2375")
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["changed"] for i in result["docker_hosts"]], [True, True])
+        docker_host = get_docker_host_by_name(self.api, "docker host 2")
+        self.assertEqual(docker_host["dockerType"], DockerType.TCP)
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        # edit docker host
+        self.params["docker_hosts"][1]["dockerDaemon"] = "tcp://127.0.0.1:2375"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["changed"] for i in result["docker_hosts"]], [False, True])
+        docker_host = get_docker_host_by_name(self.api, "docker host 2")
+        self.assertEqual(docker_host["dockerDaemon"], "tcp://127.0.0.1:2375")
+
+        # delete docker host
+        self.params["docker_hosts"][1]["state"] = "absent"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertIsNone(get_docker_host_by_name(self.api, "docker host 2"))
+
+    def test_docker_hosts_purge(self):
+        self.add_docker_host("docker host 1")
+        docker_host_id = self.add_docker_host("docker host 2")
+
+        self.params.update({
+            "docker_hosts": [
+                self.build_docker_host_params(name="docker host 1", dockerType=DockerType.SOCKET)
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["id"] for i in result["purged"]], [docker_host_id])
+        self.assertEqual([i["name"] for i in self.api.get_docker_hosts()], ["docker host 1"])
+
+    def test_docker_hosts_purge_duplicates(self):
+        docker_host_id_1 = self.add_docker_host("docker host 1")
+        docker_host_id_2 = self.add_docker_host("docker host 1")
+        docker_host_id_3 = self.add_docker_host("docker host 2")
+        docker_host_id_4 = self.add_docker_host("docker host 2")
+
+        self.params.update({
+            "docker_hosts": [
+                self.build_docker_host_params(name="docker host 1", dockerType=DockerType.SOCKET)
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(sorted(i["id"] for i in result["purged"]), [docker_host_id_2, docker_host_id_3, docker_host_id_4])
+        self.assertEqual([i["id"] for i in self.api.get_docker_hosts()], [docker_host_id_1])
+
+    def test_docker_hosts_absent_duplicates(self):
+        self.add_docker_host("docker host 1")
+        self.add_docker_host("docker host 1")
+
+        self.params.update({
+            "docker_hosts": [
+                self.build_docker_host_params(name="docker host 1", state="absent")
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["purged"], [])
+        self.assertEqual(self.api.get_docker_hosts(), [])
+
+    def test_docker_hosts_test_connection(self):
+        # the connection test fails because no docker daemon is reachable, nothing is added
+        self.params.update({
+            "docker_hosts": [
+                self.build_docker_host_params(name="docker host 1", dockerType=DockerType.TCP, dockerDaemon="tcp://127.0.0.1:1"),
+                self.build_docker_host_params(name="docker host 2", dockerType=DockerType.TCP, dockerDaemon="tcp://127.0.0.1:2")
+            ],
+            "test_connection": True
+        })
+        with self.assertRaises(UptimeKumaException):
+            self.run_module(module, self.params)
+        self.assertEqual(self.api.get_docker_hosts(), [])
+
+    def test_docker_hosts_fingerprint_file(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, "fingerprints.json")
+        self.params["fingerprint_file"] = path
+        self.params["docker_hosts"] = [
+            self.build_docker_host_params(name="docker host 1", dockerType=DockerType.SOCKET, dockerDaemon="/var/run/docker.sock")
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+
+        # a change outside of the module is not detected while the options are unchanged
+        docker_host = get_docker_host_by_name(self.api, "docker host 1")
+        self.api.edit_docker_host(docker_host["id"], dockerDaemon="/run/docker.sock")
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        # the options change
+        self.params["docker_hosts"][0]["dockerDaemon"] = "/var/run/docker2.sock"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(get_docker_host_by_name(self.api, "docker host 1")["dockerDaemon"], "/var/run/docker2.sock")
+
+        # without the file it is reverted
+        self.api.edit_docker_host(docker_host["id"], dockerDaemon="/run/docker.sock")
+        self.params["fingerprint_file"] = None
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+
+    def test_docker_hosts_fingerprint_key(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, "fingerprints.json")
+        options = {"name": "docker host 1", "dockerType": DockerType.SOCKET, "dockerDaemon": "/var/run/docker.sock"}
+
+        # the hash is keyed, it can not be computed from the options alone
+        fingerprints = FingerprintState(path, self.params["api_url"], "secret")
+        fingerprints.store("docker_host", "docker host 1", 1, options)
+        fingerprints.save()
+        with open(path) as f:
+            entry = json.load(f)[self.params["api_url"]]["docker_host"]["docker host 1"]
+        self.assertNotEqual(entry["hash"], fingerprint(options))
+        self.assertTrue(FingerprintState(path, self.params["api_url"], "secret").unchanged("docker_host", "docker host 1", options, {"id": 1}))
+        self.assertFalse(FingerprintState(path, self.params["api_url"], "other").unchanged("docker_host", "docker host 1", options, {"id": 1}))
+
+        # instances that were read before the other one saved do not overwrite its entries
+        fingerprints_1 = FingerprintState(path, self.params["api_url"], "secret")
+        fingerprints_2 = FingerprintState(path, self.params["api_url"], "secret")
+        fingerprints_1.store("docker_host", "docker host 2", 2, options)
+        fingerprints_2.store("docker_host", "docker host 3", 3, options)
+        fingerprints_2.remove("docker_host", "docker host 1")
+        fingerprints_1.save()
+        fingerprints_2.save()
+        with open(path) as f:
+            entries = json.load(f)[self.params["api_url"]]["docker_host"]
+        self.assertEqual(sorted(entries), ["docker host 2", "docker host 3"])
@@ -0,0 +1,107 @@
+import os
+import tempfile
+
+from uptime_kuma_api import MonitorType, UptimeKumaException
+
+import plugins.modules.export as module
+from plugins.module_utils.backup import read_records
+from .module_test_case import ModuleTestCase
+
+
+class TestExport(ModuleTestCase):
+    def setUp(self):
+        super(TestExport, self).setUp()
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "path": os.path.join(self.tmpdir.name, "export.jsonl.gz"),
+            "types": ["settings", "tags", "notifications", "proxies", "docker_hosts", "monitors", "status_pages", "maintenances"],
+            "concurrency": 10
+        }
+
+    def tearDown(self):
+        super(TestExport, self).tearDown()
+        self.tmpdir.cleanup()
+
+    def test_export(self):
+        monitor_id = self.add_monitor("monitor 1")
+        group_id = self.api.add_monitor(type=MonitorType.GROUP, name="group 1")["monitorID"]
+        self.api.edit_monitor(monitor_id, parent=group_id)
+        self.add_tag()
+        self.add_notification()
+        self.add_proxy()
+        self.add_docker_host()
+        self.add_status_page()
+        maintenance_id = self.add_maintenance()
+        self.api.add_monitor_maintenance(maintenance_id, [{"id": monitor_id}])
+
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["counts"], {
+            "settings": 1,
+            "tags": 1,
+            "notifications": 1,
+            "proxies": 1,
+            "docker_hosts": 1,
+            "monitors": 2,
+            "status_pages": 1,
+            "maintenances": 1
+        })
+
+        records = list(read_records(self.params["path"]))
+        self.assertEqual(records[0][0], "header")
+        self.assertEqual(records[0][1]["version"], self.api.version)
+        types = [i[0] for i in records[1:]]
+        self.assertEqual(types, sorted(types, key=self.params["types"].index))
+
+        monitors = [data for record_type, data in records if record_type == "monitors"]
+        self.assertEqual([i["id"] for i in monitors], [group_id, monitor_id])
+
+        maintenance = [data for record_type, data in records if record_type == "maintenances"][0]
+        self.assertEqual([i["id"] for i in maintenance["monitors"]], [monitor_id])
+        self.assertEqual(maintenance["status_pages"], [])
+
+        status_page = [data for record_type, data in records if record_type == "status_pages"][0]
+        self.assertEqual(status_page["slug"], "slug1")
+        self.assertIn("publicGroupList", status_page)
+
+    def test_export_types(self):
+        self.add_tag()
+        self.add_monitor()
+
+        self.params["types"] = ["tags"]
+        result = self.run_module(module, self.params)
+        self.assertEqual(result["counts"], {"tags": 1})
+
+    def test_export_unchanged(self):
+        self.add_tag()
+
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+
+        # the same records keep the previous file
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        self.add_tag("tag 2")
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(os.listdir(self.tmpdir.name), ["export.jsonl.gz"])
+
+    def test_export_failed(self):
+        self.add_tag()
+        self.run_module(module, self.params)
+        with open(self.params["path"], "rb") as f:
+            content = f.read()
+
+        # a failed export keeps the previous file
+        self.api.get_monitors = lambda: (_ for _ in ()).throw(UptimeKumaException("failed"))
+        with self.assertRaises(UptimeKumaException):
+            self.run_module(module, self.params)
+        with open(self.params["path"], "rb") as f:
+            self.assertEqual(f.read(), content)
+        self.assertEqual(os.listdir(self.tmpdir.name), ["export.jsonl.gz"])
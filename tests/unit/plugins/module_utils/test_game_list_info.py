@@ -1,3 +1,6 @@
+import os
+import tempfile
+
 from .module_test_case import ModuleTestCase
 import plugins.modules.game_list_info as module
 
@@ -10,7 +13,10 @@ class TestGameListInfo(ModuleTestCase):
             "api_url": "http://127.0.0.1:3001",
             "api_username": None,
             "api_password": None,
-            "api_token": None
+            "api_token": None,
+            "cache_path": None,
+            "keyword": None,
+            "keys": None
         }
 
     def test_game_list(self):
@@ -18,3 +24,46 @@ class TestGameListInfo(ModuleTestCase):
 
         self.assertFalse(result["changed"])
         self.assertTrue("keys" in result["game_list"][0])
+        self.assertFalse(result["cached"])
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.params["cache_path"] = os.path.join(tmpdir, "game_list.json")
+            result = self.run_module(module, self.params)
+            self.assertFalse(result["cached"])
+            game_list = result["game_list"]
+
+            result = self.run_module(module, self.params)
+            self.assertTrue(result["cached"])
+            self.assertEqual(result["game_list"], game_list)
+
+            # another version invalidates the cache
+            module.write_cache(self.params["cache_path"], "0.0.0", [])
+            result = self.run_module(module, self.params)
+            self.assertFalse(result["cached"])
+            self.assertEqual(result["game_list"], game_list)
+
+    def test_cache_check_mode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.params.update({
+                "cache_path": os.path.join(tmpdir, "game_list.json"),
+                "check_mode": True
+            })
+            result = self.run_module(module, self.params)
+            self.assertFalse(result["cached"])
+            self.assertFalse(os.path.exists(self.params["cache_path"]))
+
+    def test_filter(self):
+        game_list = self.run_module(module, self.params)["game_list"]
+        game = game_list[0]
+
+        self.params["keys"] = [game["keys"][0]]
+        result = self.run_module(module, self.params)
+        self.assertIn(game, result["game_list"])
+        self.assertTrue(all(game["keys"][0] in i["keys"] for i in result["game_list"]))
+
+        self.params["keys"] = None
+        self.params["keyword"] = game["pretty"].upper()
+        result = self.run_module(module, self.params)
+        self.assertIn(game, result["game_list"])
+        self.assertLess(len(result["game_list"]), len(game_list))
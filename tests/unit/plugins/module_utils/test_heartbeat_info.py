@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+import threading
+
+from uptime_kuma_api import UptimeKumaException
+
+import plugins.modules.heartbeat_info as module
+from plugins.module_utils.common import connect, connection_pool, run_concurrently, run_module
+from .module_test_case import ModuleTestCase
+
+
+class TestHeartbeatInfo(ModuleTestCase):
+    def setUp(self):
+        super(TestHeartbeatInfo, self).setUp()
+
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "monitor_ids": None,
+            "monitor_names": None,
+            "hours": 24,
+            "path": None,
+            "concurrency": 10,
+            "connections": 1
+        }
+        self.monitor_id_1 = self.add_monitor("monitor 1")
+        self.monitor_id_2 = self.add_monitor("monitor 2")
+
+    def test_all_monitors(self):
+        result = self.run_module(module, self.params)
+
+        self.assertFalse(result["changed"])
+        self.assertEqual(result["count"], len(result["heartbeats"]))
+        for heartbeat in result["heartbeats"]:
+            self.assertIn(heartbeat["monitor_id"], [self.monitor_id_1, self.monitor_id_2])
+
+    def test_monitor_names(self):
+        self.params["monitor_names"] = ["monitor 2"]
+        result = self.run_module(module, self.params)
+
+        self.assertFalse(result["changed"])
+        for heartbeat in result["heartbeats"]:
+            self.assertEqual(heartbeat["monitor_id"], self.monitor_id_2)
+
+    def test_connections(self):
+        self.params.update({
+            "api_url": self.url,
+            "api_timeout": 10,
+            "api_headers": None,
+            "api_ssl_verify": True,
+            "api_wait_events": 0.01,
+            "api_username": self.username,
+            "api_password": self.password,
+            "connections": 2
+        })
+        expected = self.run_module(module, {**self.params, "connections": 1})
+        result = {"changed": False}
+        run_module(module.run, {**self.params, "api_trace": True}, result)
+
+        self.assertEqual(result["count"], expected["count"])
+        self.assertEqual(result["heartbeats"], expected["heartbeats"])
+        # the additional connection is set up like the first one and is traced
+        self.assertEqual(result["api_trace"]["methods"]["login"]["calls"], 2)
+        self.assertEqual(result["api_trace"]["methods"]["disconnect"]["calls"], 2)
+
+        # the calls are distributed over the connections in turn
+        api = connect(self.params)
+        try:
+            with connection_pool(api, 2) as apis:
+                self.assertEqual(len(apis), 2)
+                self.assertEqual(run_concurrently(lambda api_, _: api_, [1, 2, 3], 1, apis), [apis[0], apis[1], apis[0]])
+        finally:
+            api.disconnect()
+
+    def test_unknown_monitor_name(self):
+        self.params["monitor_names"] = ["monitor 3"]
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+
+    def test_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "heartbeats.jsonl")
+            self.params.update({
+                "monitor_ids": [self.monitor_id_1],
+                "path": path
+            })
+            result = self.run_module(module, self.params)
+
+            self.assertTrue(result["changed"])
+            self.assertNotIn("heartbeats", result)
+            self.assertEqual(result["path"], path)
+            with open(path) as f:
+                heartbeats = [json.loads(line) for line in f]
+            self.assertEqual(len(heartbeats), result["count"])
+            for heartbeat in heartbeats:
+                self.assertEqual(heartbeat["monitor_id"], self.monitor_id_1)
+
+            # the same heartbeats do not change the file
+            result = self.run_module(module, self.params)
+            self.assertFalse(result["changed"])
+            self.assertEqual(os.listdir(tmpdir), ["heartbeats.jsonl"])
+
+            # the heartbeats of the monitors are written in the order of the monitors
+            self.params["monitor_ids"] = [self.monitor_id_1, self.monitor_id_2]
+            self.run_module(module, self.params)
+            with open(path) as f:
+                monitor_ids = [json.loads(line)["monitor_id"] for line in f]
+            self.assertEqual(monitor_ids, sorted(monitor_ids, key=[self.monitor_id_1, self.monitor_id_2].index))
+
+    def test_path_check_mode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "heartbeats.jsonl")
+            self.params.update({
+                "monitor_ids": [self.monitor_id_1],
+                "path": path,
+                "check_mode": True
+            })
+            result = self.run_module(module, self.params)
+            self.assertTrue(result["changed"])
+            self.assertEqual(os.listdir(tmpdir), [])
+
+            self.run_module(module, {**self.params, "check_mode": False})
+            result = self.run_module(module, self.params)
+            self.assertFalse(result["changed"])
+
+    def test_path_failed_monitor(self):
+        monitor_ids = [self.monitor_id_1, self.monitor_id_2] + [self.add_monitor("monitor {0}".format(i)) for i in range(3, 7)]
+        get_monitor_beats = self.api.get_monitor_beats
+
+        def get_monitor_beats_failing(monitor_id, hours):
+            if monitor_id == monitor_ids[1]:
+                raise UptimeKumaException("monitor failed")
+            return get_monitor_beats(monitor_id, hours)
+
+        self.api.get_monitor_beats = get_monitor_beats_failing
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.params.update({
+                "monitor_ids": monitor_ids,
+                "path": os.path.join(tmpdir, "heartbeats.jsonl"),
+                "concurrency": 3
+            })
+            errors = []
+
+            def run():
+                try:
+                    self.run_module(module, self.params)
+                except Exception as e:
+                    errors.append(e)
+
+            # the other monitors do not wait for the failed monitor forever
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+            thread.join(10)
+            self.assertFalse(thread.is_alive())
+            self.assertEqual([str(i) for i in errors], ["monitor failed"])
+            self.assertEqual(os.listdir(tmpdir), [])
@@ -12,7 +12,9 @@ class TestMaintenanceInfo(ModuleTestCase):
             "api_password": None,
             "api_token": None,
             "id": None,
-            "title": None
+            "title": None,
+            "include_associations": False,
+            "concurrency": 10
         }
         self.maintenance_id_1 = self.add_maintenance("maintenance 1")
         self.maintenance_id_2 = self.add_maintenance("maintenance 2")
@@ -24,6 +26,20 @@ class TestMaintenanceInfo(ModuleTestCase):
         maintenance_ids = [self.maintenance_id_1, self.maintenance_id_2]
         self.assertEqual(len(result["maintenances"]), len(maintenance_ids))
         self.assertEqual([i["id"] for i in result["maintenances"]], maintenance_ids)
+        self.assertNotIn("monitors", result["maintenances"][0])
+
+    def test_all_maintenances_include_associations(self):
+        monitor_id = self.add_monitor()
+        self.api.add_monitor_maintenance(self.maintenance_id_2, [{"id": monitor_id}])
+
+        self.params["include_associations"] = True
+        result = self.run_module(module, self.params)
+
+        self.assertFalse(result["changed"])
+        self.assertEqual(len(result["maintenances"]), 2)
+        self.assertEqual(result["maintenances"][0]["monitors"], [])
+        self.assertEqual([i["id"] for i in result["maintenances"][1]["monitors"]], [monitor_id])
+        self.assertEqual(result["maintenances"][1]["status_pages"], [])
 
     def test_maintenance_by_id(self):
         self.params["id"] = self.maintenance_id_2
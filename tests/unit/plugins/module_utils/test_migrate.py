@@ -0,0 +1,70 @@
+import copy
+
+from uptime_kuma_api import UptimeKumaApi
+
+import plugins.modules.migrate as module
+from tests.fake_server import FakeUptimeKumaServer
+from .module_test_case import ModuleTestCase
+
+
+class TestMigrate(ModuleTestCase):
+    def setUp(self):
+        super(TestMigrate, self).setUp()
+
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "source": {
+                "api_url": self.url,
+                "api_timeout": 10,
+                "api_headers": None,
+                "api_ssl_verify": True,
+                "api_wait_events": 0.01,
+                "api_username": self.username,
+                "api_password": self.password,
+                "api_token": None,
+                "api_rate_limit": None,
+                "api_latency_target": None,
+                "api_retries": None
+            },
+            "types": ["tags", "notifications", "proxies", "docker_hosts", "monitors", "status_pages", "maintenances"],
+            "concurrency": 10,
+            "fingerprint_file": None
+        }
+
+    def test_migrate_same_instance(self):
+        self.add_tag()
+        self.add_monitor()
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        self.assertEqual(result["counts"]["monitors"], {"created": 0, "updated": 0, "unchanged": 1})
+        self.assertEqual(result["counts"]["tags"], {"created": 0, "updated": 0, "unchanged": 1})
+
+    def test_migrate(self):
+        tag_id = self.add_tag()
+        monitor_id = self.add_monitor()
+        self.api.add_monitor_tag(tag_id, monitor_id, "value 1")
+
+        target = FakeUptimeKumaServer()
+        target.add_user(self.username, self.password)
+        target.start()
+        self.addCleanup(target.stop)
+        target_api = UptimeKumaApi(target.url, wait_events=0.01)
+        self.addCleanup(target_api.disconnect)
+        target_api.login(self.username, self.password)
+        target_api.add_monitor(type="http", name="monitor 0", url="http://127.0.0.1")
+
+        # the fake server is the target, the source is the instance of the other tests
+        result = {
+            "changed": False
+        }
+        module.run(target_api, copy.deepcopy(self.params), result)
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["counts"]["monitors"], {"created": 1, "updated": 0, "unchanged": 0})
+
+        monitor = [i for i in target_api.get_monitors() if i["name"] == "monitor 1"][0]
+        self.assertNotEqual(monitor["id"], monitor_id)
+        self.assertEqual([(i["name"], i["value"]) for i in monitor["tags"]], [("tag 1", "value 1")])
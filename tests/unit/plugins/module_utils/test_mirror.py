@@ -0,0 +1,214 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import plugins.modules.mirror as module
+import plugins.modules.monitor_info as monitor_info
+import plugins.modules.proxy_info as proxy_info
+from plugins.module_utils.common import connect, run_module
+from plugins.module_utils.mirror import Mirror, MirrorApi, read_state
+from .module_test_case import ModuleTestCase
+
+
+class TestMirror(ModuleTestCase):
+    def setUp(self):
+        super(TestMirror, self).setUp()
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.params = {
+            "api_url": self.url,
+            "api_timeout": 10,
+            "api_headers": None,
+            "api_ssl_verify": True,
+            "api_wait_events": 0.01,
+            "api_username": self.username,
+            "api_password": self.password,
+            "api_token": None,
+            "path": os.path.join(self.tmpdir.name, "mirror.db"),
+            "state": "started"
+        }
+
+    def tearDown(self):
+        super(TestMirror, self).tearDown()
+        self.tmpdir.cleanup()
+
+    def start_mirror(self):
+        stop = threading.Event()
+        mirror = Mirror(self.params["path"], lambda: connect(self.params), api_username=self.username)
+        thread = threading.Thread(target=mirror.run, args=(stop,))
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(stop.set)
+        self.wait_for(lambda: read_state(self.params["path"]).get("ready") == "1")
+
+    def wait_for(self, condition, timeout=10):
+        deadline = time.time() + timeout
+        while not condition():
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.05)
+
+    def test_mirror(self):
+        monitor_id = self.add_monitor("monitor 1")
+        proxy_id = self.add_proxy()
+        self.start_mirror()
+
+        mirror_api = MirrorApi(self.params["path"])
+        self.addCleanup(mirror_api.disconnect)
+        monitors = mirror_api.get_monitors()
+        self.assertEqual([i["id"] for i in monitors], [monitor_id])
+        self.assertEqual(mirror_api.get_monitor(monitor_id)["name"], "monitor 1")
+        self.assertEqual(mirror_api.find("monitors", "monitor 1")["id"], monitor_id)
+        self.assertEqual(mirror_api.get_proxy(proxy_id)["id"], proxy_id)
+
+        # changes are pushed to the mirror
+        monitor_id_2 = self.add_monitor("monitor 2")
+        self.wait_for(lambda: mirror_api.find("monitors", "monitor 2") is not None)
+        self.assertEqual(mirror_api.find("monitors", "monitor 2")["id"], monitor_id_2)
+
+        self.api.delete_monitor(monitor_id)
+        self.wait_for(lambda: mirror_api.find("monitors", "monitor 1") is None)
+
+    def test_info_modules(self):
+        self.add_monitor("monitor 1")
+        proxy_id = self.add_proxy()
+        self.start_mirror()
+
+        # the mirror is not running as separate process
+        with open(self.params["path"] + ".pid", "w") as f:
+            f.write(str(os.getpid()))
+        db = sqlite3.connect(self.params["path"])
+        with db:
+            db.execute("INSERT OR REPLACE INTO state (key, value) VALUES ('pid', ?)", (str(os.getpid()),))
+        db.close()
+
+        params = {
+            "api_url": self.url,
+            "api_username": self.username,
+            "api_trace": True,
+            "mirror": self.params["path"],
+            "id": None,
+            "name": "monitor 1"
+        }
+        result = {}
+        run_module(monitor_info.run, params, result)
+        self.assertEqual(result["monitors"][0]["name"], "monitor 1")
+        self.assertEqual([i["method"] for i in result["api_trace"]["calls"]], ["find", "disconnect"])
+
+        proxy = self.api.get_proxy(proxy_id)
+        params = {
+            "api_url": self.url,
+            "api_username": self.username,
+            "mirror": self.params["path"],
+            "id": None,
+            "host": proxy["host"],
+            "port": proxy["port"]
+        }
+        result = {}
+        run_module(proxy_info.run, params, result)
+        self.assertEqual(result["proxies"][0]["id"], proxy_id)
+
+    def test_other_instance(self):
+        self.add_monitor("monitor 1")
+        self.start_mirror()
+        with open(self.params["path"] + ".pid", "w") as f:
+            f.write(str(os.getpid()))
+        db = sqlite3.connect(self.params["path"])
+        with db:
+            db.execute("INSERT OR REPLACE INTO state (key, value) VALUES ('pid', ?)", (str(os.getpid()),))
+        db.close()
+
+        # the mirror of another instance or user is not used, the module connects to its own instance
+        params = {
+            **self.params,
+            "api_url": "http://127.0.0.1:1",
+            "api_timeout": 1,
+            "mirror": self.params["path"],
+            "id": None,
+            "name": None
+        }
+        with self.assertRaises(Exception):
+            run_module(monitor_info.run, params, {})
+
+        params = {
+            **self.params,
+            "api_username": None,
+            "api_password": None,
+            "api_token": "token",
+            "mirror": self.params["path"],
+            "id": None,
+            "name": None
+        }
+        with self.assertRaises(Exception):
+            run_module(monitor_info.run, params, {})
+
+    def test_start_stop(self):
+        monitor_id = self.add_monitor("monitor 1")
+
+        result = {
+            "changed": False
+        }
+        module.run(self.params, result)
+        self.assertTrue(result["changed"])
+        pid = result["pid"]
+
+        result = {
+            "changed": False
+        }
+        module.run(self.params, result)
+        self.assertFalse(result["changed"])
+        self.assertEqual(result["pid"], pid)
+        for suffix in ["", "-wal", "-shm", ".pid"]:
+            self.assertEqual(os.stat(self.params["path"] + suffix).st_mode & 0o777, 0o600)
+
+        params = {
+            "api_url": self.url,
+            "api_username": self.username,
+            "mirror": self.params["path"],
+            "id": monitor_id,
+            "name": None
+        }
+        result = {}
+        run_module(monitor_info.run, params, result)
+        self.assertEqual(result["monitors"][0]["name"], "monitor 1")
+
+        self.params["state"] = "stopped"
+        result = {
+            "changed": False
+        }
+        module.run(self.params, result)
+        self.assertTrue(result["changed"])
+        self.assertFalse(os.path.exists(self.params["path"] + ".pid"))
+
+    def test_restart(self):
+        result = {
+            "changed": False
+        }
+        module.run(self.params, result)
+        pid = result["pid"]
+
+        # a mirror of another url is restarted
+        self.params["api_url"] = self.url.replace("127.0.0.1", "localhost")
+        result = {
+            "changed": False
+        }
+        module.run(self.params, result)
+        self.assertTrue(result["changed"])
+        self.assertNotEqual(result["pid"], pid)
+        self.assertEqual(read_state(self.params["path"])["api_url"], self.params["api_url"])
+        self.assertTrue(module.stop(self.params["path"]))
+
+    def test_stopped(self):
+        self.params["state"] = "stopped"
+        result = {
+            "changed": False
+        }
+        module.run(self.params, result)
+        self.assertFalse(result["changed"])
+
+    def test_module_args(self):
+        # the mirror is not run with run_module
+        module_args = module.get_module_args()
+        for option in ["api_endpoints", "api_endpoints_concurrency", "api_trace", "api_profile"]:
+            self.assertNotIn(option, module_args)
@@ -0,0 +1,159 @@
+import os
+import tempfile
+
+from .module_test_case import ModuleTestCase
+import plugins.modules.proxies as module
+from plugins.module_utils.common import get_proxy_by_host_port
+
+from uptime_kuma_api import ProxyProtocol
+
+
+class TestProxies(ModuleTestCase):
+    def setUp(self):
+        super(TestProxies, self).setUp()
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "proxies": [],
+            "purge": False,
+            "fingerprint_file": None
+        }
+
+    def build_proxy_params(self, **kwargs):
+        proxy_params = {
+            "host": None,
+            "port": None,
+            "protocol": None,
+            "auth": None,
+            "username": None,
+            "password": None,
+            "active": None,
+            "default": None,
+            "applyExisting": None,
+            "state": "present"
+        }
+        proxy_params.update(kwargs)
+        return proxy_params
+
+    def test_proxies(self):
+        # add proxies
+        self.params["proxies"] = [
+            self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.1", port=8080),
+            self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.2", port=8080)
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["changed"] for i in result["proxies"]], [True, True])
+        proxy = get_proxy_by_host_port(self.api, "127.0.0.2", 8080)
+        self.assertEqual(proxy["protocol"], ProxyProtocol.HTTP)
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        # edit proxy
+        self.params["proxies"][1]["protocol"] = ProxyProtocol.HTTPS
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["changed"] for i in result["proxies"]], [False, True])
+        proxy = get_proxy_by_host_port(self.api, "127.0.0.2", 8080)
+        self.assertEqual(proxy["protocol"], ProxyProtocol.HTTPS)
+
+        # delete proxy
+        self.params["proxies"][1]["state"] = "absent"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertIsNone(get_proxy_by_host_port(self.api, "127.0.0.2", 8080))
+
+    def test_proxies_inactive(self):
+        # uptime kuma always activates saved proxies, an inactive proxy is not changed again
+        self.params["proxies"] = [
+            self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.1", port=8080, active=False)
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        proxy = get_proxy_by_host_port(self.api, "127.0.0.1", 8080)
+        self.assertTrue(proxy["active"])
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+    def test_proxies_purge(self):
+        self.add_proxy("127.0.0.1", 8080)
+        proxy_id = self.add_proxy("127.0.0.3", 8080)
+
+        self.params.update({
+            "proxies": [
+                self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.1", port=8080)
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["id"] for i in result["purged"]], [proxy_id])
+        self.assertEqual([i["host"] for i in self.api.get_proxies()], ["127.0.0.1"])
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+    def test_proxies_purge_duplicates(self):
+        proxy_id_1 = self.add_proxy("127.0.0.1", 8080)
+        proxy_id_2 = self.add_proxy("127.0.0.1", 8080)
+        proxy_id_3 = self.add_proxy("127.0.0.2", 8080)
+        proxy_id_4 = self.add_proxy("127.0.0.2", 8080)
+
+        self.params.update({
+            "proxies": [
+                self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.1", port=8080)
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(sorted(i["id"] for i in result["purged"]), [proxy_id_2, proxy_id_3, proxy_id_4])
+        self.assertEqual([i["id"] for i in self.api.get_proxies()], [proxy_id_1])
+
+    def test_proxies_absent_duplicates(self):
+        self.add_proxy("127.0.0.1", 8080)
+        self.add_proxy("127.0.0.1", 8080)
+
+        self.params.update({
+            "proxies": [
+                self.build_proxy_params(host="127.0.0.1", port=8080, state="absent")
+            ],
+            "purge": True
+        })
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["purged"], [])
+        self.assertEqual(self.api.get_proxies(), [])
+
+    def test_proxies_apply_existing(self):
+        self.params["proxies"] = [
+            self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.1", port=8080, applyExisting=True),
+            self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.2", port=8080, applyExisting=True)
+        ]
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+
+    def test_proxies_fingerprint_file(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.params["fingerprint_file"] = os.path.join(tmpdir.name, "fingerprints.json")
+        self.params["proxies"] = [
+            self.build_proxy_params(protocol=ProxyProtocol.HTTP, host="127.0.0.1", port=8080)
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+
+        # a change outside of the module is not detected while the options are unchanged
+        proxy = get_proxy_by_host_port(self.api, "127.0.0.1", 8080)
+        self.api.edit_proxy(proxy["id"], protocol=ProxyProtocol.HTTPS)
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        # without the file it is reverted
+        self.params["fingerprint_file"] = None
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+
+from uptime_kuma_api import MonitorType
+
+import plugins.modules.export as module_export
+import plugins.modules.restore as module
+from .module_test_case import ModuleTestCase
+
+
+class TestRestore(ModuleTestCase):
+    def setUp(self):
+        super(TestRestore, self).setUp()
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmpdir.name, "export.jsonl.gz")
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "path": path,
+            "concurrency": 10,
+            "fingerprint_file": None
+        }
+        self.export_params = {
+            **self.params,
+            "types": ["settings", "tags", "notifications", "proxies", "docker_hosts", "monitors", "status_pages", "maintenances"]
+        }
+
+    def tearDown(self):
+        super(TestRestore, self).tearDown()
+        self.tmpdir.cleanup()
+
+    def test_restore(self):
+        notification_id = self.add_notification()
+        proxy_id = self.add_proxy()
+        group_id = self.api.add_monitor(type=MonitorType.GROUP, name="group 1")["monitorID"]
+        monitor_id = self.add_monitor("monitor 1")
+        self.api.edit_monitor(monitor_id, parent=group_id, notificationIDList=[notification_id], proxyId=proxy_id)
+        tag_id = self.add_tag()
+        self.api.add_monitor_tag(tag_id, monitor_id, "value 1")
+        self.add_status_page()
+        self.api.save_status_page("slug1", publicGroupList=[{"name": "services", "monitorList": [{"id": monitor_id}]}])
+        maintenance_id = self.add_maintenance()
+        self.api.add_monitor_maintenance(maintenance_id, [{"id": monitor_id}])
+        self.run_module(module_export, self.export_params)
+
+        # restore into an empty instance, the ids are different
+        self.delete_all()
+        self.add_monitor("monitor 0")
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["counts"]["monitors"], {"created": 2, "updated": 0, "unchanged": 0})
+        self.assertEqual(result["counts"]["settings"], {"created": 0, "updated": 0, "unchanged": 1})
+
+        monitors = dict((i["name"], i) for i in self.api.get_monitors())
+        monitor = monitors["monitor 1"]
+        self.assertEqual(monitor["parent"], monitors["group 1"]["id"])
+        self.assertEqual(monitor["notificationIDList"], [self.api.get_notifications()[0]["id"]])
+        self.assertEqual(monitor["proxyId"], self.api.get_proxies()[0]["id"])
+        self.assertEqual([(i["name"], i["value"]) for i in monitor["tags"]], [("tag 1", "value 1")])
+
+        status_page = self.api.get_status_page("slug1")
+        self.assertEqual([i["id"] for i in status_page["publicGroupList"][0]["monitorList"]], [monitor["id"]])
+
+        maintenance = self.api.get_maintenances()[0]
+        self.assertEqual(self.api.get_monitor_maintenance(maintenance["id"]), [{"id": monitor["id"], "name": "monitor 1"}])
+
+        # restore again
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        self.assertEqual(result["counts"]["monitors"], {"created": 0, "updated": 0, "unchanged": 2})
+
+    def test_restore_update(self):
+        self.add_tag()
+        self.run_module(module_export, self.export_params)
+
+        tag = self.api.get_tags()[0]
+        self.api.edit_tag(tag["id"], color="#000000")
+
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(result["counts"]["tags"], {"created": 0, "updated": 1, "unchanged": 0})
+        self.assertEqual(self.api.get_tag(tag["id"])["color"], "#ffffff")
+
+    def test_restore_fingerprint_file(self):
+        self.add_tag()
+        self.add_monitor()
+        self.run_module(module_export, self.export_params)
+
+        self.params["fingerprint_file"] = os.path.join(self.tmpdir.name, "fingerprints.json")
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        with open(self.params["fingerprint_file"]) as f:
+            fingerprints = json.load(f)
+        self.assertEqual(list(fingerprints[self.params["api_url"]]["monitors"]), ["monitor 1"])
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        self.assertEqual(result["counts"]["monitors"], {"created": 0, "updated": 0, "unchanged": 1})
@@ -105,3 +105,12 @@ class TestStatusPage(ModuleTestCase):
         })
         result = self.run_module(module, self.params)
         self.assertTrue(result["changed"])
+
+    def test_status_page_absent(self):
+        # delete status page that does not exist
+        self.params.update({
+            "slug": "slug1",
+            "state": "absent"
+        })
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
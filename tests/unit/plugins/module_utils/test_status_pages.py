@@ -0,0 +1,130 @@
+import os
+import tempfile
+
+import plugins.modules.status_pages as module
+from .module_test_case import ModuleTestCase
+
+
+class TestStatusPages(ModuleTestCase):
+    def setUp(self):
+        super(TestStatusPages, self).setUp()
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "status_pages": [],
+            "fingerprint_file": None
+        }
+
+    def build_status_page_params(self, **kwargs):
+        status_page_params = {
+            "slug": None,
+            "title": None,
+            "description": None,
+            "theme": None,
+            "published": None,
+            "showTags": None,
+            "domainNameList": None,
+            "googleAnalyticsId": None,
+            "customCSS": None,
+            "footerText": None,
+            "showPoweredBy": None,
+            "icon": None,
+            "publicGroupList": None,
+            "incident": None,
+            "state": "present"
+        }
+        status_page_params.update(kwargs)
+        return status_page_params
+
+    def test_status_pages(self):
+        # add status pages
+        self.add_monitor("monitor 1")
+        self.params["status_pages"] = [
+            self.build_status_page_params(
+                slug="slug1",
+                title="status page 1",
+                publicGroupList=[
+                    {
+                        "name": "Services",
+                        "weight": 1,
+                        "monitorList": [
+                            {
+                                "id": None,
+                                "name": "monitor 1",
+                                "sendUrl": None
+                            }
+                        ]
+                    }
+                ]
+            ),
+            self.build_status_page_params(
+                slug="slug2",
+                title="status page 2",
+                incident={
+                    "title": "incident 1",
+                    "content": "content 1",
+                    "style": "info"
+                }
+            )
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["changed"] for i in result["status_pages"]], [True, True])
+        status_page = self.api.get_status_page("slug1")
+        self.assertEqual(status_page["title"], "status page 1")
+        self.assertEqual(status_page["publicGroupList"][0]["monitorList"][0]["name"], "monitor 1")
+        status_page = self.api.get_status_page("slug2")
+        self.assertEqual(status_page["incident"]["title"], "incident 1")
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        # edit one status page and unpin the incident of the other
+        self.params["status_pages"][0]["title"] = "status page 1 new"
+        self.params["status_pages"][1]["incident"] = None
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual([i["changed"] for i in result["status_pages"]], [True, True])
+        status_page = self.api.get_status_page("slug1")
+        self.assertEqual(status_page["title"], "status page 1 new")
+        status_page = self.api.get_status_page("slug2")
+        self.assertIsNone(status_page["incident"])
+
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        # delete status pages
+        for status_page_params in self.params["status_pages"]:
+            status_page_params["state"] = "absent"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertEqual(self.api.get_status_pages(), [])
+
+    def test_status_pages_fingerprint_file(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.params["fingerprint_file"] = os.path.join(tmpdir.name, "fingerprints.json")
+        self.params["status_pages"] = [
+            self.build_status_page_params(slug="slug1", title="status page 1")
+        ]
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+
+        # the id of the new status page is stored
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+
+        # the unchanged status page is not retrieved
+        get_status_page = self.api.get_status_page
+        slugs = []
+        self.api.get_status_page = lambda slug: slugs.append(slug) or get_status_page(slug)
+        result = self.run_module(module, self.params)
+        self.assertFalse(result["changed"])
+        self.assertEqual(slugs, [])
+
+        self.params["status_pages"][0]["title"] = "status page 1 new"
+        result = self.run_module(module, self.params)
+        self.assertTrue(result["changed"])
+        self.assertIn("slug1", slugs)
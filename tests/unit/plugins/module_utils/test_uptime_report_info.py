@@ -0,0 +1,81 @@
+import plugins.modules.uptime_report_info as module
+from .module_test_case import ModuleTestCase
+
+
+class TestUptimeReportInfo(ModuleTestCase):
+    def setUp(self):
+        super(TestUptimeReportInfo, self).setUp()
+
+        self.params = {
+            "api_url": "http://127.0.0.1:3001",
+            "api_username": None,
+            "api_password": None,
+            "api_token": None,
+            "monitor_ids": None,
+            "monitor_names": None,
+            "tag_names": None,
+            "windows": [24],
+            "by_tag": True,
+            "concurrency": 10
+        }
+        self.monitor_id_1 = self.add_monitor("monitor 1")
+        self.monitor_id_2 = self.add_monitor("monitor 2")
+        self.tag_id = self.add_tag("tag 1")
+        self.api.add_monitor_tag(self.tag_id, self.monitor_id_2, "value 1")
+
+    def test_all_monitors(self):
+        self.params["windows"] = [720, 24]
+        result = self.run_module(module, self.params)
+
+        self.assertFalse(result["changed"])
+        self.assertEqual([i["id"] for i in result["monitors"]], [self.monitor_id_1, self.monitor_id_2])
+        self.assertEqual([i["hours"] for i in result["monitors"][0]["windows"]], [720, 24])
+        self.assertEqual(len(result["tags"]), 1)
+        self.assertEqual(result["tags"][0]["name"], "tag 1")
+        self.assertEqual(result["tags"][0]["monitors"], 1)
+
+    def test_tag_names(self):
+        self.params.update({
+            "tag_names": ["tag 1"],
+            "by_tag": False
+        })
+        result = self.run_module(module, self.params)
+
+        self.assertEqual([i["id"] for i in result["monitors"]], [self.monitor_id_2])
+        self.assertNotIn("tags", result)
+
+    def test_unknown_monitor_name(self):
+        self.params["monitor_names"] = ["monitor 3"]
+        with self.assertRaises(ValueError):
+            self.run_module(module, self.params)
+
+    def test_report(self):
+        heartbeats = [
+            {"time": "2023-05-01 10:00:00.000", "status": 1, "duration": 0, "ping": 10},
+            {"time": "2023-05-01 10:01:00.000", "status": 0, "duration": 60, "ping": None},
+            {"time": "2023-05-01 10:02:00.000", "status": 1, "duration": 60, "ping": 30},
+            {"time": "2023-05-01 10:03:00.000", "status": 3, "duration": 60, "ping": 20},
+            {"time": "2023-05-01 10:04:00.000", "status": 1, "duration": 60, "ping": 40}
+        ]
+        beats = module.BeatArrays(heartbeats)
+
+        report = beats.window("2023-05-01 09:00:00.000").report(24)
+        self.assertEqual(report, {
+            "hours": 24,
+            "beats": 5,
+            "availability": 75,
+            "downtime_minutes": 1,
+            "ping_mean": 25,
+            "ping_p95": 40,
+            "ping_p99": 40
+        })
+
+        report = beats.window("2023-05-01 10:02:00.000").report(1)
+        self.assertEqual(report["beats"], 2)
+        self.assertEqual(report["availability"], 100)
+        self.assertEqual(report["ping_p95"], 40)
+
+        report = beats.window("2023-05-01 11:00:00.000").report(1)
+        self.assertEqual(report["beats"], 0)
+        self.assertIsNone(report["availability"])
+        self.assertIsNone(report["ping_mean"])